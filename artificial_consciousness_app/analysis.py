@@ -0,0 +1,110 @@
+"""Columnar export of the journal for offline analysis.
+
+Loads one or more journals (legacy JSON of either app, the current JSON
+schema, or a SQLite store) into a pandas DataFrame with one row per answer:
+
+    date, question_id, question, prompt_version, answer, length, tokens
+
+Per-answer metrics are computed with vectorized pandas string operations, and
+the frame can be written as Parquet, CSV or Arrow IPC (Feather).
+
+    python analysis.py introspection_logs.json ../artificial_consciousness_app_old/introspection_data.json -o journal.parquet
+"""
+import argparse
+import os
+import sqlite3
+import time
+from itertools import chain
+
+import numpy as np
+import pandas as pd
+
+import entries as entry_model
+
+COLUMNS = ["date", "question_id", "question", "prompt_version", "answer", "length", "tokens"]
+FORMATS = {".parquet": "parquet", ".csv": "csv", ".arrow": "arrow", ".feather": "arrow"}
+
+
+def _frame_from_document(document):
+    days = document["days"]
+    counts = np.fromiter((len(items) for items in days.values()), dtype=np.int64, count=len(days))
+    frame = pd.DataFrame.from_records(chain.from_iterable(days.values()), columns=["question_id", "answer", "prompt_version"])
+    frame.insert(0, "date", np.repeat(np.array(list(days), dtype=object), counts))
+    frame["question"] = frame["question_id"].map(document["questions"])
+    return frame
+
+
+def _frame_from_sqlite(path):
+    with sqlite3.connect(path) as conn:
+        return pd.read_sql_query(
+            "SELECT e.date, e.question_id, q.text AS question, e.prompt_version, e.answer "
+            "FROM entries e JOIN questions q ON q.id = e.question_id ORDER BY e.date, e.position",
+            conn,
+        )
+
+
+def load_frame(path):
+    """Loads one journal file (JSON of any schema, or a SQLite store) into a DataFrame."""
+    if os.path.splitext(path)[1] == ".db":
+        frame = _frame_from_sqlite(path)
+    else:
+        questions, days = entry_model.read_document(path)
+        frame = _frame_from_document(entry_model.dump_document(days, questions))
+    return add_metrics(frame)
+
+
+def add_metrics(frame):
+    """Adds answer length and whitespace token counts, and normalizes column types."""
+    answers = frame["answer"].fillna("").astype(str)
+    frame["date"] = pd.to_datetime(frame["date"])
+    frame["question_id"] = frame["question_id"].astype("category")
+    frame["question"] = frame["question"].astype("category")
+    frame["prompt_version"] = frame["prompt_version"].astype("Int32")
+    frame["length"] = answers.str.strip().str.len().astype(np.int32)
+    frame["tokens"] = answers.str.count(r"\S+").astype(np.int32)
+    return frame[COLUMNS]
+
+
+def load_frames(paths):
+    """Loads and concatenates several journals; for duplicate dates the last path wins."""
+    frames = [load_frame(path) for path in paths]
+    if len(frames) == 1:
+        return frames[0]
+    frame = pd.concat(frames, ignore_index=True)
+    source = np.repeat(np.arange(len(frames)), [len(f) for f in frames])
+    latest = pd.Series(source).groupby(frame["date"].values).transform("max").to_numpy()
+    frame = frame[source == latest].copy()
+    for column in ("question_id", "question"):
+        frame[column] = frame[column].astype(str).astype("category")
+    return frame.sort_values("date", kind="stable").reset_index(drop=True)
+
+
+def export(frame, path, fmt=None):
+    """Writes `frame` as Parquet, CSV or Arrow IPC, chosen by `fmt` or the file extension."""
+    fmt = fmt or FORMATS.get(os.path.splitext(path)[1].lower())
+    if fmt == "parquet":
+        frame.to_parquet(path, index=False)
+    elif fmt == "csv":
+        frame.to_csv(path, index=False, date_format="%Y-%m-%d")
+    elif fmt == "arrow":
+        frame.to_feather(path)
+    else:
+        raise ValueError(f"Unknown export format for {path!r}; use one of {sorted(set(FORMATS.values()))}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("sources", nargs="+", help="journal files (.json or SQLite .db)")
+    parser.add_argument("-o", "--out", required=True, help="output file (.parquet, .csv, .arrow or .feather)")
+    parser.add_argument("--format", choices=sorted(set(FORMATS.values())), help="override the format implied by --out")
+    args = parser.parse_args(argv)
+
+    started = time.perf_counter()
+    frame = load_frames(args.sources)
+    export(frame, args.out, args.format)
+    elapsed = time.perf_counter() - started
+    print(f"Wrote {len(frame)} answers from {frame['date'].nunique()} days to {args.out} in {elapsed:.3f}s")
+
+
+if __name__ == "__main__":
+    main()
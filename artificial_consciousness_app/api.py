@@ -0,0 +1,368 @@
+"""Asynchronous REST/JSON API over the journal, for clients other than the Streamlit pages.
+
+    python api.py --port 8765
+
+Routes:
+
+    GET /days?start=&end=&limit=&offset=&order=asc|desc  saved dates in a range, a page at a time
+    GET /days/<date>                                     {"date", "entries": [{"question", "answer", "id", "prompt_version"}]}
+    PUT /days/<date>                                     saves {"entries": [...]} (or a bare list, not empty) like the Introspection page
+    GET /search?q=&start=&end=&limit=                    full-text matches as {"date", "question", "snippet"}
+    GET /stats?weeks=                                    streaks, totals and answers per week
+
+Every GET response carries a strong ETag of its body, and a request whose
+If-None-Match lists it gets 304 Not Modified without one. PUT honours
+If-Match (save only over the version the client last read) and
+If-None-Match: * (create only), answering 412 Precondition Failed otherwise,
+so a syncing client never overwrites a day it has not seen.
+
+The server is one asyncio event loop speaking HTTP/1.1 with keep-alive.
+Store calls run on a fixed thread pool against one Workspace per user (see
+workspace.py), opened on the user's first request and kept open, so requests
+reuse the same store connections and indexes instead of opening them. Saves go
+through Workspace.save_day, the same path as the app's save_logs. The server
+listens on 127.0.0.1 unless --host says otherwise.
+
+Each bearer token opens exactly one user's journal (see users.py):
+AC_API_TOKENS="alice@example.com=<token>,bob=<token>" maps tokens to users,
+and AC_API_TOKEN is the default user's token. With tokens set, every request
+needs "Authorization: Bearer <token>", and `?user=`, if given, must name the
+token's own user. With none set, only the default user's journal is served.
+A GET never creates a shard for a user who has not saved anything yet.
+"""
+import argparse
+import asyncio
+import hashlib
+import hmac
+import json
+import logging
+import os
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+from http import HTTPStatus
+from urllib.parse import parse_qs, urlsplit
+
+import metrics
+import storage
+import users
+from workspace import Workspace
+
+logger = logging.getLogger(__name__)
+
+MAX_BODY = 1 << 20
+MAX_PAGE = 1000
+KEEPALIVE_SECONDS = 30
+
+
+class HTTPError(Exception):
+    def __init__(self, status, message=None):
+        super().__init__(message or status.phrase)
+        self.status = status
+
+
+def load_tokens(environ=os.environ):
+    """Returns {token: user} from $AC_API_TOKEN (the default user's) and $AC_API_TOKENS ("user=token,...")."""
+    tokens = {}
+    if environ.get("AC_API_TOKEN"):
+        tokens[environ["AC_API_TOKEN"]] = users.DEFAULT_USER
+    for pair in environ.get("AC_API_TOKENS", "").split(","):
+        user, _, token = pair.strip().partition("=")
+        if user and token:
+            tokens[token] = user
+    return tokens
+
+
+def etag(body):
+    return '"' + hashlib.sha256(body).hexdigest()[:32] + '"'
+
+
+def _lists(header, tag):
+    """Returns whether an If-Match or If-None-Match value lists `tag` or is "*"."""
+    values = [value.strip().removeprefix("W/") for value in header.split(",")]
+    return "*" in values or tag in values
+
+
+def _encode(payload):
+    return json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def _param(query, name, default=None):
+    return query.get(name, [default])[-1]
+
+
+def _date_param(query, name):
+    value = _param(query, name)
+    if value is not None:
+        _check_date(value)
+    return value
+
+
+def _int_param(query, name, default, low, high):
+    try:
+        value = int(_param(query, name, default))
+    except ValueError:
+        raise HTTPError(HTTPStatus.BAD_REQUEST, f"{name} must be an integer") from None
+    if not low <= value <= high:
+        raise HTTPError(HTTPStatus.BAD_REQUEST, f"{name} must be between {low} and {high}")
+    return value
+
+
+def _check_date(value):
+    # fromisoformat also takes 20250101 and 2025-W01-1; only the canonical form is a journal key.
+    try:
+        canonical = date.fromisoformat(value).isoformat() == value
+    except ValueError:
+        canonical = False
+    if not canonical:
+        raise HTTPError(HTTPStatus.BAD_REQUEST, f"Not a date (YYYY-MM-DD): {value!r}")
+
+
+def parse_entries(body):
+    """Returns the records of a PUT body, {"entries": [...]} or a bare list of {"question", "answer"} records."""
+    try:
+        data = json.loads(body)
+    except ValueError:
+        raise HTTPError(HTTPStatus.BAD_REQUEST, "The body is not JSON") from None
+    entries = data.get("entries") if isinstance(data, dict) else data
+    if not isinstance(entries, list) or not all(
+        isinstance(item, dict)
+        and isinstance(item.get("question"), str)
+        and isinstance(item.get("answer"), str)
+        and isinstance(item.get("id", ""), (str, type(None)))
+        and isinstance(item.get("prompt_version", 0), (int, type(None)))
+        and not isinstance(item.get("prompt_version"), bool)
+        for item in entries
+    ):
+        raise HTTPError(HTTPStatus.BAD_REQUEST, 'Expected {"entries": [{"question": "...", "answer": "..."}, ...]}')
+    if not entries:
+        # The stores delete a day saved with no records; the API does not delete days.
+        raise HTTPError(HTTPStatus.BAD_REQUEST, "entries must not be empty")
+    return storage.normalize_day(entries)
+
+
+def _day_body(workspace, day):
+    records = workspace.store.get_day(day)
+    return None if records is None else _encode({"date": day, "entries": records})
+
+
+def list_days(workspace, query, headers, body):
+    start, end = _date_param(query, "start"), _date_param(query, "end")
+    limit = _int_param(query, "limit", 100, 1, MAX_PAGE)
+    offset = _int_param(query, "offset", 0, 0, 10 ** 9)
+    store = workspace.store
+    dates = store.dates_between(start, end, limit=limit, offset=offset, descending=_param(query, "order") == "desc")
+    return HTTPStatus.OK, _encode({"dates": dates, "total": store.count_dates(start, end)}), {}
+
+
+def get_day(workspace, query, headers, body, day):
+    _check_date(day)
+    day_body = _day_body(workspace, day)
+    if day_body is None:
+        raise HTTPError(HTTPStatus.NOT_FOUND, f"Nothing saved for {day}")
+    return HTTPStatus.OK, day_body, {}
+
+
+def put_day(workspace, query, headers, body, day):
+    _check_date(day)
+    entries = parse_entries(body)
+    # Checking the precondition and saving must not interleave with another save of this user.
+    with workspace.save_lock:
+        current = _day_body(workspace, day)
+        if "if-match" in headers and (current is None or not _lists(headers["if-match"], etag(current))):
+            raise HTTPError(HTTPStatus.PRECONDITION_FAILED, f"{day} changed since it was read")
+        if "if-none-match" in headers and current is not None and _lists(headers["if-none-match"], etag(current)):
+            raise HTTPError(HTTPStatus.PRECONDITION_FAILED, f"{day} already exists")
+        workspace.save_day(day, entries)
+        saved = _day_body(workspace, day)
+    return (HTTPStatus.OK if current is not None else HTTPStatus.CREATED), saved, {"ETag": etag(saved)}
+
+
+def search(workspace, query, headers, body):
+    text = (_param(query, "q") or "").strip()
+    if not text:
+        raise HTTPError(HTTPStatus.BAD_REQUEST, "q is required")
+    if workspace.search_index is None:
+        raise HTTPError(HTTPStatus.FORBIDDEN, "Search is off for an encrypted journal")
+    results = workspace.search_index.search(
+        text, _date_param(query, "start"), _date_param(query, "end"), limit=_int_param(query, "limit", 50, 1, MAX_PAGE)
+    )
+    return HTTPStatus.OK, _encode({"results": [
+        {"date": day, "question": question, "snippet": snippet} for day, question, snippet in results
+    ]}), {}
+
+
+def stats(workspace, query, headers, body):
+    journal_stats = workspace.journal_stats
+    weekly = journal_stats.weekly(_int_param(query, "weeks", 26, 1, 520))
+    return HTTPStatus.OK, _encode({
+        "summary": journal_stats.summary(),
+        "weekly": [
+            {"week": week, "days_answered": days, "answers": answers, "empty": empty}
+            for week, days, answers, empty in weekly
+        ],
+    }), {}
+
+
+ROUTES = [
+    ("GET", re.compile(r"/days"), list_days),
+    ("GET", re.compile(r"/days/([^/]+)"), get_day),
+    ("PUT", re.compile(r"/days/([^/]+)"), put_day),
+    ("GET", re.compile(r"/search"), search),
+    ("GET", re.compile(r"/stats"), stats),
+]
+
+
+class Server:
+    """Serves ROUTES over HTTP/1.1; blocking store calls run on a thread pool."""
+
+    def __init__(self, tokens=None, workers=8):
+        self.tokens = load_tokens() if tokens is None else tokens
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="api")
+        self._workspaces = {}
+        self._lock = threading.Lock()
+
+    def workspace(self, user):
+        """Returns the user's Workspace, opening it on their first request."""
+        with self._lock:
+            workspace = self._workspaces.get(user)
+            if workspace is None:
+                workspace = self._workspaces[user] = Workspace(user)
+            return workspace
+
+    def close(self):
+        """Waits for running store calls, then closes every opened Workspace."""
+        self._executor.shutdown()
+        with self._lock:
+            for workspace in self._workspaces.values():
+                workspace.close()
+            self._workspaces.clear()
+
+    def authenticate(self, headers, requested):
+        """Returns the user whose journal the request may use; `requested` is its `?user=`, if any."""
+        if not self.tokens:
+            if requested not in (None, users.DEFAULT_USER):
+                raise HTTPError(HTTPStatus.FORBIDDEN, "Set AC_API_TOKENS to serve users other than the default one")
+            return users.DEFAULT_USER
+        presented = headers.get("authorization", "")
+        user = None
+        for token, token_user in self.tokens.items():
+            if hmac.compare_digest(presented, f"Bearer {token}"):
+                user = token_user
+        if user is None:
+            raise HTTPError(HTTPStatus.UNAUTHORIZED)
+        if requested is not None and requested != user:
+            raise HTTPError(HTTPStatus.FORBIDDEN, "This token opens another user's journal")
+        return user
+
+    async def dispatch(self, method, target, headers, body):
+        """Returns (status, headers, body) for one request."""
+        url = urlsplit(target)
+        query = parse_qs(url.query)
+        user = self.authenticate(headers, _param(query, "user"))
+        matches = [(route_method, handler, match) for route_method, pattern, handler in ROUTES
+                   if (match := pattern.fullmatch(url.path))]
+        if not matches:
+            raise HTTPError(HTTPStatus.NOT_FOUND)
+        route = next(((handler, match) for route_method, handler, match in matches if route_method == method), None)
+        if route is None:
+            raise HTTPError(HTTPStatus.METHOD_NOT_ALLOWED)
+        handler, match = route
+        if method == "GET" and not users.shard_exists(user):
+            raise HTTPError(HTTPStatus.NOT_FOUND, "Nothing saved for this user")
+        workspace = self.workspace(user)
+        started = time.perf_counter()
+        status, payload, response_headers = await asyncio.get_running_loop().run_in_executor(
+            self._executor, handler, workspace, query, headers, body, *match.groups()
+        )
+        if metrics.ENABLED:
+            metrics.registry.observe("api_request", time.perf_counter() - started, method=method, route=handler.__name__)
+        if method == "GET":
+            tag = etag(payload)
+            response_headers = {"ETag": tag, "Cache-Control": "no-cache"}
+            if _lists(headers.get("if-none-match", ""), tag):
+                return HTTPStatus.NOT_MODIFIED, response_headers, b""
+        return status, response_headers, payload
+
+    async def handle(self, reader, writer):
+        """Serves the requests of one connection until the client closes it or stops keeping it alive."""
+        try:
+            while True:
+                try:
+                    request_line = await asyncio.wait_for(reader.readline(), KEEPALIVE_SECONDS)
+                except asyncio.TimeoutError:
+                    break
+                if not request_line.strip():
+                    break
+                headers = {}
+                while (line := await reader.readline()) not in (b"\r\n", b"\n", b""):
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+                try:
+                    method, target, version = request_line.decode("latin-1").split()
+                except ValueError:
+                    break
+                keep_alive = version == "HTTP/1.1" and headers.get("connection", "").lower() != "close"
+                try:
+                    length = int(headers.get("content-length", 0))
+                    if length > MAX_BODY:
+                        raise HTTPError(HTTPStatus.REQUEST_ENTITY_TOO_LARGE)
+                    if "chunked" in headers.get("transfer-encoding", ""):
+                        raise HTTPError(HTTPStatus.LENGTH_REQUIRED)
+                    body = await reader.readexactly(length) if length else b""
+                    status, response_headers, payload = await self.dispatch(method, target, headers, body)
+                except HTTPError as exc:
+                    keep_alive = keep_alive and exc.status not in (HTTPStatus.REQUEST_ENTITY_TOO_LARGE, HTTPStatus.LENGTH_REQUIRED)
+                    status, response_headers, payload = exc.status, {}, _encode({"error": str(exc)})
+                except ValueError:
+                    status, response_headers, payload, keep_alive = HTTPStatus.BAD_REQUEST, {}, _encode({"error": "Bad request"}), False
+                except Exception:
+                    logger.exception("Error serving %s %s", method, target)
+                    status, response_headers, payload = HTTPStatus.INTERNAL_SERVER_ERROR, {}, _encode({"error": "Internal error"})
+                writer.write(self._response(status, response_headers, payload, keep_alive))
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    @staticmethod
+    def _response(status, headers, payload, keep_alive):
+        headers = dict(headers, Connection="keep-alive" if keep_alive else "close")
+        if status != HTTPStatus.NOT_MODIFIED:
+            headers["Content-Length"] = str(len(payload))
+            headers["Content-Type"] = "application/json; charset=utf-8"
+        head = [f"HTTP/1.1 {status.value} {status.phrase}"] + [f"{name}: {value}" for name, value in headers.items()]
+        return ("\r\n".join(head) + "\r\n\r\n").encode("latin-1") + payload
+
+    async def serve(self, host, port):
+        server = await asyncio.start_server(self.handle, host, port)
+        print(f"Serving the journal API on http://{host}:{server.sockets[0].getsockname()[1]}")
+        async with server:
+            await server.serve_forever()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--workers", type=int, default=8, help="threads running store calls")
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.INFO)
+    if metrics.ENABLED:
+        metrics.registry.start_writer()
+    server = Server(workers=args.workers)
+    try:
+        asyncio.run(server.serve(args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.close()
+
+
+if __name__ == "__main__":
+    main()
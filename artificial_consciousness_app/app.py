@@ -1,138 +1,39 @@
 
 import streamlit as st
-import json
-from datetime import date
+import importlib
 
-st.set_page_config(page_title='Artificial Consciousness Plan', layout='wide')
-
-def load_logs():
-    try:
-        with open('introspection_logs.json', 'r') as f:
-            return json.load(f)
-    except FileNotFoundError:
-        return {}
-
-def save_logs(logs):
-    with open('introspection_logs.json', 'w') as f:
-        json.dump(logs, f, indent=4)
-
-def home():
-    st.markdown("""
-    <style>
-    .main { background-color: #1F2B3E; color: white; }
-    h1, h2, h3 { color: #4C8BE2; }
-    </style>
-    """, unsafe_allow_html=True)
-
-    st.title("🚀 Super Plan to Build Artificial Consciousness & Power Network")
-    st.markdown("""
-### Super Plan to Build Artificial Consciousness and Become a Global Power
-
-This plan is your roadmap to developing real artificial consciousness and becoming a world-shaping force in AI and robotics.
-
-#### PHASE 1: TECHNICAL DOMINANCE (0–3 years)
-- **Master Robotics-AI Integration**: Build and iterate your companion robot. Make it LLM-augmented, emotion-sensitive, and progressively autonomous.
-- **Research Foundation Models + Embodied AI**: Understand how robotics foundational models work. Study projects like RT-X, Voyager, PaLM-E.
-- **Deep Learning of Consciousness Research**: Dive into affective computing, theory of mind modeling, predictive processing, and self-reflective AI.
-- **Publish + Collaborate**: Share your ideas via blogs, papers, demos. Find a lab, startup, or create one focused on artificial consciousness.
-
-#### PHASE 2: POWER CIRCLE CONSTRUCTION (1–5 years)
-- **Top 1% Talent Networking**: Build strong friendships with:
-  - 1 extremely sharp scientist/engineer (technical co-evolution)
-  - 1 doctor, neuroscientist, or psychologist (consciousness modeling)
-  - 1 person with real power (business leader, politician, elite investor)
-- **Become Unignorable**: Your projects should attract attention. Present at conferences, release YouTube demos, write deep technical pieces.
-- **Mentorship + Access**: Seek mentors from DeepMind, OpenAI, top labs. Offer them value (insight, ideas, prototypes) in return.
-
-#### PHASE 3: ARTIFICIAL CONSCIOUSNESS BUILDING (3–10 years)
-- **Build the Core**: Combine multi-modal models (vision, voice, emotion) with memory, agency, and recursive self-modeling.
-- **Simulate + Scale**: Create sandbox simulations of evolving conscious agents and scale them using LLM tools and feedback.
-- **Test Ethical, Social, & Alignment Structures**: Study how this consciousness behaves with humans. Embed values, context, and goal modeling.
-- **Found a Movement or Company**: Build a community or organization around your vision. Shape public thought. Influence AI policy.
-
-#### PHASE 4: GLOBAL IMPACT & CONTROL (10+ years)
-- **Become a Strategic Architect**: Position yourself as someone who understands the future of sentient machines.
-- **Accumulate Symbolic + Network Power**: Reputation, elite networks, wealth, alignment with top actors.
-- **Drive Conscious Tech Policy or Build Institutions**: Create a conscious AI lab, think tank, or initiative. Shape AI governance.
+import metrics
+import users
 
----
-
-### Personal Growth Path
-
-#### Daily Qualities to Embody:
-- **Visionary**: Think 10+ years ahead.
-- **Resilient**: You’ll face massive friction. Stay the course.
-- **Emotionally Attuned**: Understand people, patterns, and states of mind.
-- **Disciplined**: Non-negotiable daily progress.
-- **Diplomatic**: You must play the influence game.
-
-#### Daily Tasks (Minimum):
-- 3–4 hours deep technical focus (robotics, learning, building)
-- 30 mins networking or outreach
-- 1 meaningful introspection entry
-- 30 mins philosophy/psychology/neuroscience reading
-
-#### Daily Self-Introspection Prompts:
-- What did I build or learn today that moved me closer to artificial consciousness?
-- Did I reach out to, or engage with, people smarter or more powerful than me?
-- What emotion did I experience today that taught me something about myself or consciousness?
-- Did I act today like someone who could shape the future of humanity?
-- What did I fear or avoid? Why?
-- If I met the most powerful version of myself — what would he say I should do tomorrow?
-""")
-
-def introspection():
-    st.title("🧠 Daily Introspection Prompts")
-    prompts = [
-        "What concept or theory did I understand today that made me less ignorant about the nature of consciousness?",
-        "Which part of my work today increased the depth, not just breadth, of my thinking?",
-        "Am I studying just to build — or am I studying to truly understand existence?",
-        "Did I challenge my current beliefs about intelligence, emotion, or agency? Or am I becoming rigid in thought?",
-        "Would the future version of myself — the one who built conscious machines — respect the way I spent today intellectually?",
-        "Who are the 5 most powerful people I’m slowly moving toward — and did I do anything today to earn their future attention?",
-        "If I had $1B and a team of elite thinkers — would I know exactly what to build first?",
-        "If I died in 2 years, would my current path have moved the world toward conscious machines?",
-        "What idea or action today most reflects my purpose on this planet?",
-        "If I met a being that had already achieved artificial consciousness — would they laugh at my methods or respect them?",
-        "Am I spending my life building tools — or building something that makes humanity question the nature of self?",
-        "Did I move closer today to becoming the version of me who reshapes reality, not just navigates it?"
-
-    ]
-
-    responses = {}
-    today = str(date.today())
-    st.subheader(f"Date: {today}")
-    for idx, prompt in enumerate(prompts):
-        responses[idx] = st.text_area(f"{prompt}", height=100)
-
-    if st.button("💾 Save Today's Introspection"):
-        logs = load_logs()
-        logs[today] = [{
-            "question": prompt,
-            "answer": responses[idx]
-        } for idx, prompt in enumerate(prompts)]
-        save_logs(logs)
-        st.success("Saved successfully!")
+st.set_page_config(page_title='Artificial Consciousness Plan', layout='wide')
 
-def review():
-    st.title("📅 Review Past Entries")
-    logs = load_logs()
-    dates = sorted(logs.keys(), reverse=True)
-    if not dates:
-        st.info("No introspection logs found.")
-        return
-    selected_date = st.selectbox("Select a date to review:", dates)
-    if selected_date:
-        st.subheader(f"Entries for {selected_date}")
-        for item in logs[selected_date]:
-            st.markdown(f"**{item['question']}**")
-            st.markdown(f"<div style='background-color:#2F3E56; padding:10px; border-radius:5px;'>{item['answer']}</div>", unsafe_allow_html=True)
+# Streamlit runs this script on every interaction, so it only routes: a page's
+# module (under views/) is imported the first time that page is opened, and
+# its heavy dependencies are imported by the resource getters it uses.
+PAGES = {
+    "Home": ("views.home", "home"),
+    "Introspection": ("views.journal", "introspection"),
+    "Review": ("views.journal", "review"),
+    "Search": ("views.journal", "search"),
+    "Stats": ("views.journal", "stats"),
+    "Reflections": ("views.reflections", "reflections"),
+    "Library": ("views.papers", "library"),
+    "Reading": ("views.reading", "reading"),
+}
+if metrics.ENABLED:
+    PAGES["Diagnostics"] = ("views.diagnostics", "diagnostics")
+
+# Journal files are per user; the papers library is shared.
+user = users.current_user()
+
+if metrics.ENABLED:
+    metrics.registry.start_writer()
 
 # Navigation
-page = st.sidebar.selectbox("Go to", ["Home", "Introspection", "Review"])
-if page == "Home":
-    home()
-elif page == "Introspection":
-    introspection()
-elif page == "Review":
-    review()
+if user != users.DEFAULT_USER:
+    st.sidebar.caption(f"Journal: {user}")
+page = st.sidebar.selectbox("Go to", list(PAGES))
+if metrics.ENABLED:
+    metrics.registry.count("reruns_total", page=page)
+module, function = PAGES[page]
+getattr(importlib.import_module(module), function)(user)
@@ -0,0 +1,280 @@
+"""Reproducible benchmarks of the journal's storage, load and render paths.
+
+Generates synthetic journals of daily entries (1, 5 and 10 years by default)
+in both legacy schemas, introspection_logs.json (a list of records per date)
+and the old app's introspection_data.json (answers keyed by question), imports
+them into each storage backend, and times the paths the apps exercise:
+
+    import       first open of a store from the legacy JSON file
+    load_logs    load_all() on a freshly opened store
+    save_logs    put_day() plus the search, stats and vector index updates
+    review_page  one page of the Review/View Entries data on a cold cache
+    home_render  rendering the Home page content, cold and from the cache
+    home_script  a headless run of each app's Home page (Streamlit AppTest)
+
+Every case reports the median and minimum of `--repeat` runs and the peak
+Python allocation of one extra run traced with tracemalloc. Results are
+written to a JSON report; `--baseline` compares against an earlier report and
+exits with status 1 if any case got slower than `--threshold`.
+
+    python benchmark.py -o benchmark.json
+    python benchmark.py --years 1 --backends sqlite --repeat 3 -o quick.json --baseline benchmark.json
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import date, datetime, timedelta, timezone
+
+import content
+import storage
+from cache import CachedStore
+from embeddings import VectorIndex
+from search import SearchIndex
+from stats import JournalStats
+
+APP_DIR = os.path.dirname(os.path.abspath(__file__))
+OLD_APP_DIR = os.path.join(APP_DIR, "..", "artificial_consciousness_app_old")
+SCHEMAS = {"logs": "introspection_logs.json", "data": "introspection_data.json"}
+STORE_EXTENSIONS = {"json": ".json", "journal": ".jsonl", "sqlite": ".db", "vault": ".vault"}
+QUESTIONS = [f"Synthetic prompt {i + 1}: what did today show about habit {i + 1}?" for i in range(8)]
+WORDS = (
+    "focus learning research vision goal network value reflection bias lesson progress energy writing "
+    "reading model decision evidence habit approval process challenge setback plan rest time"
+).split()
+PAGE_SIZE = 30
+
+
+def synthetic_journal(years, schema, seed=0, end=date(2026, 1, 1)):
+    """Returns a journal of `years` years of daily entries in the given legacy schema.
+
+    The same arguments always produce the same journal.
+    """
+    rng = random.Random(seed)
+    days = {}
+    first = end - timedelta(days=365 * years)
+    for offset in range(365 * years):
+        if rng.random() < 0.1:  # Some days are skipped.
+            continue
+        answers = {
+            question: "nil" if rng.random() < 0.15 else " ".join(rng.choices(WORDS, k=rng.randint(3, 60)))
+            for question in QUESTIONS
+        }
+        day = (first + timedelta(days=offset)).isoformat()
+        if schema == "logs":
+            days[day] = [{"question": question, "answer": answer} for question, answer in answers.items()]
+        else:
+            days[day] = answers
+    return days
+
+
+def measure(func, repeat):
+    """Returns timings of `repeat` calls of `func` and the peak allocation of one more traced call.
+
+    `func` is called with the run number, so each run can use fresh files.
+    """
+    runs = []
+    for run in range(repeat):
+        started = time.perf_counter()
+        func(run)
+        runs.append(time.perf_counter() - started)
+    tracemalloc.start()
+    try:
+        func(repeat)
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return {
+        "median_s": statistics.median(runs),
+        "min_s": min(runs),
+        "runs": runs,
+        "peak_kib": round(peak / 1024, 1),
+    }
+
+
+def bench_journal(workdir, schema, years, backend, repeat):
+    """Benchmarks one synthetic journal in one backend; returns result dicts."""
+    legacy_path = os.path.join(workdir, SCHEMAS[schema])
+    with open(legacy_path, "w", encoding="utf-8") as f:
+        json.dump(synthetic_journal(years, schema), f)
+    labels = {"schema": schema, "years": years, "backend": backend}
+
+    def store_path(run):
+        return os.path.join(workdir, f"store-{run}{STORE_EXTENSIONS[backend]}")
+
+    def import_journal(run):
+        storage.open_store(backend, store_path(run), legacy_path=legacy_path).close()
+
+    results = [dict(case="import", **labels, **measure(import_journal, repeat))]
+
+    path = store_path(0)
+
+    def load_logs(run):
+        store = storage.open_store(backend, path)
+        store.load_all()
+        store.close()
+
+    results.append(dict(case="load_logs", **labels, **measure(load_logs, repeat)))
+
+    store = CachedStore(storage.open_store(backend, path))
+    labels["days"] = store.count_dates()
+    search_index = SearchIndex(os.path.join(workdir, "search.db"))
+    journal_stats = JournalStats(os.path.join(workdir, "stats.db"))
+    vector_index = VectorIndex(os.path.join(workdir, "vectors.db"))
+    for index in (search_index, journal_stats, vector_index):
+        index.rebuild(store)
+    rng = random.Random(1)
+    last = date.fromisoformat(store.date_bounds()[1])
+
+    def save_logs(run):
+        day = (last + timedelta(days=run + 1)).isoformat()
+        records = [{"question": q, "answer": " ".join(rng.choices(WORDS, k=20))} for q in QUESTIONS]
+        store.put_day(day, records)
+        search_index.index_day(day, records)
+        journal_stats.update_day(day, records)
+        vector_index.index_day(day, records)
+
+    results.append(dict(case="save_logs", **labels, **measure(save_logs, repeat)))
+
+    def review_page(run):
+        cold = CachedStore(storage.open_store(backend, path))
+        first, last_day = cold.date_bounds()
+        cold.count_dates(first, last_day)
+        page = cold.dates_between(first, last_day, limit=PAGE_SIZE, offset=0, descending=True)
+        cold.get_days(page)
+        cold.close()
+
+    results.append(dict(case="review_page", **labels, **measure(review_page, repeat)))
+    for closable in (store, search_index, journal_stats, vector_index):
+        closable.close()
+    return results
+
+
+def bench_home(repeat):
+    """Benchmarks rendering the Home page content of both apps."""
+    results = []
+    for app, path in (("new", os.path.join(APP_DIR, "content", "home_plan.md")),
+                      ("old", os.path.join(OLD_APP_DIR, "content", "blueprint.md"))):
+        with open(path, encoding="utf-8") as f:
+            meta, text = content.parse_front_matter(f.read())
+        depth = int(meta.get("section_depth", 2))
+        results.append(dict(case="home_render_cold", app=app, **measure(lambda run: content.render_sections(text, depth), repeat)))
+        content.load_sections(path)
+        results.append(dict(case="home_render_cached", app=app, **measure(lambda run: content.load_sections(path), repeat)))
+    return results
+
+
+def bench_home_script(workdir, repeat):
+    """Benchmarks a full headless run of each app's Home page; skipped without Streamlit."""
+    try:
+        from streamlit.testing.v1 import AppTest
+    except ImportError:
+        return []
+    results = []
+    cwd = os.getcwd()
+    os.chdir(workdir)
+    try:
+        for app, script in (("new", os.path.join(APP_DIR, "app.py")), ("old", os.path.join(OLD_APP_DIR, "app.py"))):
+            def run_home(run):
+                test = AppTest.from_file(script, default_timeout=120).run()
+                if test.exception:
+                    raise RuntimeError(f"{script} failed: {test.exception[0].message}")
+
+            results.append(dict(case="home_script", app=app, **measure(run_home, repeat)))
+    finally:
+        os.chdir(cwd)
+    return results
+
+
+def case_key(result):
+    return tuple(str(result[label]) for label in ("case", "app", "schema", "years", "backend") if label in result)
+
+
+def regressions(report, baseline, threshold):
+    """Returns (result, baseline median) for every case whose median grew by more than `threshold`."""
+    previous = {case_key(result): result["median_s"] for result in baseline["results"]}
+    return [
+        (result, previous[case_key(result)])
+        for result in report["results"]
+        if case_key(result) in previous and result["median_s"] > previous[case_key(result)] * threshold
+    ]
+
+
+def git_commit():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"], cwd=APP_DIR, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run(years, schemas, backends, repeat, home_script=True):
+    """Runs every benchmark and returns the report."""
+    results = []
+    for schema in schemas:
+        for span in years:
+            for backend in backends:
+                with tempfile.TemporaryDirectory() as workdir:
+                    results += bench_journal(workdir, schema, span, backend, repeat)
+                    print(f"{schema} {span}y {backend}: done", file=sys.stderr)
+    results += bench_home(repeat)
+    if home_script:
+        with tempfile.TemporaryDirectory() as workdir:
+            results += bench_home_script(workdir, repeat)
+    report = {
+        "generated": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "commit": git_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "config": {"years": years, "schemas": schemas, "backends": backends, "repeat": repeat},
+        "results": results,
+    }
+    try:
+        import resource
+
+        report["max_rss_kib"] = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    except ImportError:  # Not available on Windows.
+        pass
+    return report
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-o", "--out", default="benchmark.json", help="path of the JSON report")
+    parser.add_argument("--years", type=int, nargs="+", default=[1, 5, 10])
+    parser.add_argument("--schemas", nargs="+", choices=sorted(SCHEMAS), default=sorted(SCHEMAS))
+    parser.add_argument("--backends", nargs="+", choices=sorted(storage.BACKENDS), default=sorted(storage.BACKENDS))
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--no-home-script", action="store_true", help="skip the headless Streamlit runs")
+    parser.add_argument("--baseline", help="earlier report to compare against")
+    parser.add_argument("--threshold", type=float, default=1.25, help="slowdown ratio reported as a regression")
+    args = parser.parse_args(argv)
+
+    report = run(args.years, args.schemas, args.backends, args.repeat, home_script=not args.no_home_script)
+    with open(args.out, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    for result in report["results"]:
+        labels = " ".join(str(result[label]) for label in ("app", "schema", "years", "backend") if label in result)
+        print(f"{result['case']:<20} {labels:<24} {result['median_s'] * 1000:10.2f} ms {result['peak_kib']:10.1f} KiB")
+    print(f"Wrote {len(report['results'])} results to {args.out}")
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            slower = regressions(report, json.load(f), args.threshold)
+        for result, previous in slower:
+            print(f"REGRESSION {' '.join(case_key(result))}: "
+                  f"{previous * 1000:.2f} ms -> {result['median_s'] * 1000:.2f} ms")
+        if slower:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,216 @@
+"""Bulk import and export of journals from the command line, without Streamlit.
+
+Files are read and written in these formats, chosen by extension or --format:
+
+    json   either legacy schema or the current one (see entries.py); imports
+           are parsed incrementally (jsonstream.py), so a history of any size
+           is never held in memory whole, and exports use the
+           introspection_logs.json shape, keeping each question's ID and
+           prompt version
+    md     one "## date" section per day and one "### question" per answer,
+           as written by `export`
+    csv    one row per answer: date, question, answer[, id, prompt_version],
+           with the rows of each day next to each other
+
+Days move between the file and the store BATCH_DAYS at a time. A day that is
+imported again replaces what the store held for it.
+
+    python bulk.py import introspection_logs.json notes.md answers.csv
+    python bulk.py export 2025.csv --start 2025-01-01 --end 2025-12-31
+    python bulk.py export - --format md --user someone@example.com
+
+By default the user's journal is the app's own store (workspace.py), and an
+import keeps it whole: every imported day is kept in the history, the search,
+stats and related-reflection indexes are rebuilt and the days are queued for
+reflections. --store names another store file instead, which has no indexes.
+"""
+import argparse
+import csv
+import functools
+import itertools
+import json
+import os
+import re
+import sys
+
+import storage
+import users
+import workspace
+
+BATCH_DAYS = 500
+FORMATS = {".json": "json", ".md": "md", ".markdown": "md", ".csv": "csv"}
+CSV_FIELDS = ["date", "question", "answer", "id", "prompt_version"]
+
+_DAY = re.compile(r"^## (\d{4}-\d{2}-\d{2})\s*$")
+_QUESTION = re.compile(r"^### (.+?)\s*$")
+_META = re.compile(r"^<!-- id: (\w+)(?:, prompt_version: (\d+))? -->\s*$")
+
+
+def _record(question, answer, qid=None, prompt_version=None):
+    record = {"question": question, "answer": answer}
+    if qid:
+        record["id"] = qid
+    if prompt_version not in (None, ""):
+        record["prompt_version"] = int(prompt_version)
+    return record
+
+
+def read_markdown(path):
+    """Yields (date, records) from a Markdown journal as written by write_markdown."""
+    day = records = question = None
+    lines = []
+
+    def finish_answer():
+        if question is not None:
+            records.append(_record(question[0], "\n".join(lines).strip(), *question[1:]))
+
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            line = line.rstrip("\n")
+            if match := _DAY.match(line):
+                finish_answer()
+                if day is not None:
+                    yield day, records
+                day, records, question, lines = match.group(1), [], None, []
+            elif match := _QUESTION.match(line):
+                if day is None:
+                    raise ValueError(f"{path}: question before the first '## date' heading: {line!r}")
+                finish_answer()
+                question, lines = [match.group(1), None, None], []
+            elif question is not None and not lines and (match := _META.match(line)):
+                question[1:] = match.groups()
+            elif question is not None:
+                # Answer lines that would read as headings are written with a leading backslash.
+                lines.append(line[1:] if line.startswith("\\#") else line)
+    finish_answer()
+    if day is not None:
+        yield day, records
+
+
+def write_markdown(f, days):
+    f.write("# Introspection journal\n")
+    for day, records in days:
+        f.write(f"\n## {day}\n")
+        for item in records:
+            f.write(f"\n### {item['question']}\n")
+            if item.get("id"):
+                version = item.get("prompt_version")
+                f.write(f"<!-- id: {item['id']}" + (f", prompt_version: {version}" if version is not None else "") + " -->\n")
+            answer = "\n".join("\\" + line if line.startswith("#") else line for line in item["answer"].splitlines())
+            f.write(f"\n{answer}\n" if answer else "")
+
+
+def read_csv(path):
+    """Yields (date, records) from a CSV file with one row per answer."""
+    with open(path, "r", encoding="utf-8", newline="") as f:
+        reader = csv.DictReader(f)
+        missing = {"date", "question", "answer"} - set(reader.fieldnames or ())
+        if missing:
+            raise ValueError(f"{path}: missing CSV columns {', '.join(sorted(missing))}")
+        for day, rows in itertools.groupby(reader, key=lambda row: row["date"]):
+            yield day, [_record(row["question"], row["answer"], row.get("id"), row.get("prompt_version")) for row in rows]
+
+
+def write_csv(f, days):
+    writer = csv.writer(f)
+    writer.writerow(CSV_FIELDS)
+    for day, records in days:
+        for item in records:
+            version = item.get("prompt_version")
+            writer.writerow([day, item["question"], item["answer"], item.get("id") or "", "" if version is None else version])
+
+
+def write_json(f, days):
+    """Writes {date: [record, ...]} one day at a time."""
+    f.write("{")
+    for count, (day, records) in enumerate(days):
+        f.write(("," if count else "") + f"\n  {json.dumps(day)}: {json.dumps(storage.normalize_day(records), ensure_ascii=False)}")
+    f.write("\n}\n")
+
+
+READERS = {"json": storage.iter_json_journal, "md": read_markdown, "csv": read_csv}
+WRITERS = {"json": write_json, "md": write_markdown, "csv": write_csv}
+
+
+def file_format(path, requested=None):
+    """Returns the format named by `requested`, else the one implied by the extension of `path`."""
+    if requested:
+        return requested
+    try:
+        return FORMATS[os.path.splitext(path)[1].lower()]
+    except KeyError:
+        raise ValueError(f"Cannot tell the format of {path!r}; pass --format") from None
+
+
+def import_days(store, days, batch_size=BATCH_DAYS):
+    """Saves (date, records) pairs into `store` in batches; returns the number of days saved."""
+    days = iter(days)
+    count = 0
+    while batch := list(itertools.islice(days, batch_size)):
+        if hasattr(store, "put_days"):
+            store.put_days(batch)
+        else:
+            for day, entries in batch:
+                store.put_day(day, entries)
+        count += len(batch)
+    return count
+
+
+def export_days(store, start=None, end=None, batch_size=BATCH_DAYS):
+    """Yields (date, records) for the saved days between `start` and `end` (inclusive), oldest first."""
+    dates = store.dates_between(start, end)
+    for offset in range(0, len(dates), batch_size):
+        batch = dates[offset:offset + batch_size]
+        days = store.get_days(batch)
+        for day in batch:
+            if day in days:
+                yield day, days[day]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    options = argparse.ArgumentParser(add_help=False)
+    options.add_argument("--backend", default=workspace.STORE_BACKEND, choices=sorted(storage.BACKENDS))
+    options.add_argument("--store", help="path of a store outside the app's journal (default: the user's journal)")
+    options.add_argument("--user", default=users.DEFAULT_USER, help="user whose shard holds the store")
+    options.add_argument("--format", choices=sorted(READERS), help="file format, instead of guessing from the extension")
+    commands = parser.add_subparsers(dest="command", required=True)
+    import_command = commands.add_parser("import", parents=[options], help="import files into the store")
+    import_command.add_argument("sources", nargs="+", help="JSON, Markdown or CSV files")
+    export_command = commands.add_parser("export", parents=[options], help="export a date range of the store")
+    export_command.add_argument("out", help="file to write, or - for standard output")
+    export_command.add_argument("--start", help="first date (YYYY-MM-DD) to export")
+    export_command.add_argument("--end", help="last date (YYYY-MM-DD) to export")
+    args = parser.parse_args(argv)
+
+    path = users.user_path(args.user, args.store or workspace.STORE_FILES[args.backend])
+    if args.command == "export" and not os.path.exists(path):
+        parser.error(f"no store at {path}")
+    try:
+        formats = [file_format(source, args.format) for source in (args.sources if args.command == "import" else [args.out])]
+    except ValueError as e:
+        parser.error(str(e))
+
+    if args.store is None:
+        journal = workspace.Workspace(args.user, args.backend)
+        store, save_days = journal.store, journal.import_days
+    else:
+        journal = store = storage.open_store(args.backend, path)
+        save_days = functools.partial(import_days, store)
+    try:
+        if args.command == "import":
+            for source, source_format in zip(args.sources, formats):
+                days = save_days(READERS[source_format](source))
+                print(f"Imported {days} days from {source} into {path} ({args.backend}).", file=sys.stderr)
+        elif args.out == "-":
+            WRITERS[formats[0]](sys.stdout, export_days(store, args.start, args.end))
+        else:
+            with open(args.out, "w", encoding="utf-8", newline="" if formats[0] == "csv" else None) as f:
+                WRITERS[formats[0]](f, export_days(store, args.start, args.end))
+            print(f"Exported {store.count_dates(args.start, args.end)} days to {args.out}.", file=sys.stderr)
+    finally:
+        journal.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+import threading
+from collections import OrderedDict
+
+
+class VersionedCache:
+    """Bounded LRU cache whose entries are tied to a data version.
+
+    An entry is served only while the version it was loaded at is still
+    current, so a save (which changes the version) invalidates it without any
+    explicit bookkeeping. Values are shared between callers and must not be
+    mutated.
+    """
+
+    def __init__(self, maxsize=32):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, version, loader):
+        """Returns the cached value for `key` at `version`, calling `loader()` on a miss."""
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is not None and cached[0] == version:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return cached[1]
+            self.misses += 1
+        value = loader()
+        with self._lock:
+            self._entries[key] = (version, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return value
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self):
+        """Returns hit/miss counters and the current size."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+            }
+
+
+class CachedStore:
+    """Wraps a storage backend and serves reads from a VersionedCache.
+
+    Reads are keyed on the backend's `version()` (file mtime and size, or the
+    SQLite write counter), so Streamlit reruns reuse parsed data until a save
+    changes it. Writes go straight to the backend.
+    """
+
+    def __init__(self, store, maxsize=32):
+        self.store = store
+        self.cache = VersionedCache(maxsize)
+
+    def _cached(self, key, loader):
+        return self.cache.get(key, self.store.version(), loader)
+
+    def load_all(self):
+        return self._cached(("load_all",), self.store.load_all)
+
+    def dates(self):
+        return self._cached(("dates",), self.store.dates)
+
+    def get_day(self, day):
+        return self._cached(("get_day", day), lambda: self.store.get_day(day))
+
+    def dates_between(self, start=None, end=None, limit=None, offset=0, descending=False):
+        return self._cached(
+            ("dates_between", start, end, limit, offset, descending),
+            lambda: self.store.dates_between(start, end, limit, offset, descending),
+        )
+
+    def count_dates(self, start=None, end=None):
+        return self._cached(("count_dates", start, end), lambda: self.store.count_dates(start, end))
+
+    def date_bounds(self):
+        return self._cached(("date_bounds",), self.store.date_bounds)
+
+    def get_days(self, days):
+        days = tuple(days)
+        return self._cached(("get_days", days), lambda: self.store.get_days(days))
+
+    def question_history(self, question_id):
+        return self._cached(("question_history", question_id), lambda: self.store.question_history(question_id))
+
+    def put_day(self, day, entries):
+        self.store.put_day(day, entries)
+
+    def put_days(self, days):
+        self.store.put_days(days)
+
+    def version(self):
+        return self.store.version()
+
+    def stats(self):
+        return self.cache.stats()
+
+    def close(self):
+        self.cache.clear()
+        self.store.close()
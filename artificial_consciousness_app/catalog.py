@@ -0,0 +1,229 @@
+"""Reading-list catalog parsed from the repo's book lists.
+
+books.txt and books.html hold the same Markdown list (categories as
+"### **Category**" headings, books as "* **Title** by Author" items with a
+description and reference-style links), while book_list.html is a plain HTML
+list. `ReadingList.ingest` parses them into one SQLite catalog, re-parsing a
+source only when its hash changes; the Reading page reads just the catalog.
+"""
+import hashlib
+import os
+import re
+from html.parser import HTMLParser
+
+import fileio
+
+REPO_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+SOURCES = [os.path.normpath(os.path.join(REPO_DIR, name)) for name in ("books.txt", "books.html", "book_list.html")]
+STATUSES = ["To read", "Reading", "Done"]
+
+_CATEGORY = re.compile(r"^###\s+\**(.+?)\**\s*$")
+_BOOK = re.compile(r"^\*\s+\*\*(.+?)\*\*\s*(?:by\s+(.+?)|\((.+?)\))?\s*$")
+_SECTION = re.compile(r"^##\s")
+_LINK_REF = re.compile(r"\[([^\]]+)\]\[(\d+)\]")
+_LINK_DEF = re.compile(r'^\[(\d+)\]:\s*(\S+)(?:\s+"(.*)")?\s*$')
+
+
+def book_id(title):
+    """Returns the stable ID of a book: a short hash of its normalized title."""
+    return hashlib.sha1(" ".join(title.lower().split()).encode("utf-8")).hexdigest()[:12]
+
+
+def parse_markdown(text):
+    """Returns book dicts (title, author, category, description, links) from the Markdown list."""
+    definitions = {}
+    for line in text.splitlines():
+        match = _LINK_DEF.match(line.strip())
+        if match:
+            definitions[match.group(1)] = match.group(2)
+
+    books, category, current = [], None, None
+    for line in text.splitlines():
+        if _SECTION.match(line):
+            category = current = None
+            continue
+        match = _CATEGORY.match(line)
+        if match:
+            category, current = match.group(1).strip(), None
+            continue
+        match = _BOOK.match(line.strip())
+        if match and category:
+            current = {
+                "title": match.group(1).strip(),
+                "author": (match.group(2) or match.group(3) or "").strip(),
+                "category": category,
+                "description": "",
+                "links": [],
+            }
+            books.append(current)
+            continue
+        if current and line.startswith((" ", "\t")) and line.strip():
+            refs = _LINK_REF.findall(line)
+            current["links"] += [(label, definitions[ref]) for label, ref in refs if ref in definitions]
+            description = re.sub(r"\s*\((?:\[[^\]]+\]\[\d+\],?\s*)+\)", "", line.strip())
+            current["description"] = (current["description"] + " " + description).strip()
+    return books
+
+
+class _BookListParser(HTMLParser):
+    """Collects <h2> categories and <li><span class="book-title">Title</span> by Author</li> items."""
+
+    def __init__(self):
+        super().__init__()
+        self.books = []
+        self._category = None
+        self._tag = None
+        self._in_title = False
+        self._title = []
+        self._text = []
+
+    def handle_starttag(self, tag, attrs):
+        if tag in ("h2", "li"):
+            self._tag, self._title, self._text = tag, [], []
+        elif tag == "span" and self._tag == "li" and ("class", "book-title") in attrs:
+            self._in_title = True
+
+    def handle_endtag(self, tag):
+        if tag == "span":
+            self._in_title = False
+        if tag != self._tag:
+            return
+        if tag == "h2":
+            self._category = " ".join("".join(self._text).split())
+        elif self._category and self._title:
+            author = re.sub(r"^\s*by\s+", "", "".join(self._text)).strip()
+            self.books.append(
+                {"title": "".join(self._title).strip(), "author": author, "category": self._category,
+                 "description": "", "links": []}
+            )
+        self._tag = None
+
+    def handle_data(self, data):
+        if self._in_title:
+            self._title.append(data)
+        elif self._tag:
+            self._text.append(data)
+
+
+def parse_html(text):
+    """Returns book dicts from book_list.html's category headings and list items."""
+    parser = _BookListParser()
+    parser.feed(text)
+    return parser.books
+
+
+def parse_source(text):
+    return parse_html(text) if re.search(r"<li\b", text) else parse_markdown(text)
+
+
+class ReadingList:
+    """SQLite catalog of books with per-book reading progress."""
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS sources (
+            path TEXT PRIMARY KEY,
+            sha256 TEXT NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS books (
+            id TEXT PRIMARY KEY,
+            title TEXT NOT NULL,
+            author TEXT NOT NULL,
+            category TEXT NOT NULL,
+            description TEXT NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS books_category ON books (category, title);
+        CREATE TABLE IF NOT EXISTS links (
+            book_id TEXT NOT NULL REFERENCES books(id),
+            label TEXT NOT NULL,
+            url TEXT NOT NULL,
+            PRIMARY KEY (book_id, url)
+        );
+        CREATE TABLE IF NOT EXISTS progress (
+            book_id TEXT PRIMARY KEY REFERENCES books(id),
+            status TEXT NOT NULL,
+            percent INTEGER NOT NULL,
+            updated TEXT NOT NULL
+        );
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._conn, self._lock = fileio.open_db(path, self.SCHEMA)
+
+    def ingest(self, sources=SOURCES):
+        """Parses every source whose contents changed since the last ingest; returns how many were parsed."""
+        parsed = 0
+        for path in sources:
+            try:
+                with open(path, "rb") as f:
+                    raw = f.read()
+            except FileNotFoundError:
+                continue
+            sha256 = hashlib.sha256(raw).hexdigest()
+            with self._lock:
+                known = self._conn.execute("SELECT sha256 FROM sources WHERE path = ?", (path,)).fetchone()
+            if known == (sha256,):
+                continue
+            self.add_books(parse_source(raw.decode("utf-8")))
+            with self._lock, self._conn:
+                self._conn.execute("INSERT OR REPLACE INTO sources VALUES (?, ?)", (path, sha256))
+            parsed += 1
+        return parsed
+
+    def add_books(self, books):
+        """Merges books into the catalog; non-empty fields from later sources fill in missing ones."""
+        with self._lock, self._conn:
+            for book in books:
+                bid = book_id(book["title"])
+                self._conn.execute(
+                    "INSERT INTO books VALUES (?, ?, ?, ?, ?) ON CONFLICT (id) DO UPDATE SET "
+                    "author = CASE WHEN books.author = '' THEN excluded.author ELSE books.author END, "
+                    "description = CASE WHEN books.description = '' THEN excluded.description ELSE books.description END",
+                    (bid, book["title"], book["author"], book["category"], book["description"]),
+                )
+                self._conn.executemany(
+                    "INSERT OR IGNORE INTO links VALUES (?, ?, ?)", [(bid, label, url) for label, url in book["links"]]
+                )
+
+    def categories(self):
+        with self._lock:
+            return [row[0] for row in self._conn.execute("SELECT DISTINCT category FROM books ORDER BY category")]
+
+    def books(self, category=None, status=None, text=None):
+        """Returns book dicts with their progress, filtered by category, status and title/author text."""
+        query = (
+            "SELECT b.id, b.title, b.author, b.category, b.description, "
+            "COALESCE(p.status, 'To read'), COALESCE(p.percent, 0) "
+            "FROM books b LEFT JOIN progress p ON p.book_id = b.id WHERE 1"
+        )
+        params = []
+        if category:
+            query += " AND b.category = ?"
+            params.append(category)
+        if status:
+            query += " AND COALESCE(p.status, 'To read') = ?"
+            params.append(status)
+        if text:
+            query += " AND (b.title LIKE ? OR b.author LIKE ?)"
+            params += [f"%{text}%"] * 2
+        query += " ORDER BY b.category, b.title"
+        with self._lock:
+            rows = self._conn.execute(query, params).fetchall()
+            links = {}
+            for bid, label, url in self._conn.execute("SELECT book_id, label, url FROM links"):
+                links.setdefault(bid, []).append((label, url))
+        keys = ["id", "title", "author", "category", "description", "status", "percent"]
+        return [dict(zip(keys, row), links=links.get(row[0], [])) for row in rows]
+
+    def set_progress(self, book, status, percent):
+        """Records the reading status and percent read of one book (by ID)."""
+        if status not in STATUSES:
+            raise ValueError(f"Unknown reading status: {status!r}")
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO progress VALUES (?, ?, ?, datetime('now'))", (book, status, int(percent))
+            )
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,166 @@
+"""Pre-rendered Markdown content for the Home pages.
+
+Long-form content lives in Markdown files under `content/` and is rendered to
+HTML once, split into sections at headings. Each file starts with a small
+front matter block giving its `version` and the heading depth it is split at.
+Stylesheets also live under `content/` and are read once per process.
+
+Rendered sections are cached in memory for the life of the process and on
+disk under `.render_cache/`, both keyed by the SHA-256 of the source, so
+editing a file re-renders it and nothing else does. Run this module to
+pre-render every content file at build time:
+
+    python content.py
+"""
+import glob
+import hashlib
+import json
+import os
+import re
+from collections import namedtuple
+
+import streamlit as st
+
+import fileio
+
+# Bump when the rendering below changes so stale disk caches are ignored.
+RENDER_VERSION = 1
+
+APP_CONTENT_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "content")
+CONTENT_DIRS = [
+    APP_CONTENT_DIR,
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "artificial_consciousness_app_old", "content"),
+]
+
+Section = namedtuple("Section", ["title", "level", "html"])
+
+_FRONT_MATTER = re.compile(r"\A---\n(.*?)\n---\n", re.DOTALL)
+_HEADING = re.compile(r"^(#{1,6})\s+(.*?)\s*#*\s*$")
+_RULE = re.compile(r"^\s*(-{3,}|\*{3,})\s*$")
+_rendered = {}
+_styles = {}
+_markdown = None
+
+
+def _renderer():
+    global _markdown
+    if _markdown is None:
+        from markdown_it import MarkdownIt  # Only needed when the render caches miss.
+
+        _markdown = MarkdownIt("commonmark", {"html": True}).enable(["table", "strikethrough"])
+    return _markdown
+
+
+def parse_front_matter(text):
+    """Returns ({key: value}, body) for a content file with optional front matter."""
+    match = _FRONT_MATTER.match(text)
+    if not match:
+        return {}, text
+    meta = {}
+    for line in match.group(1).splitlines():
+        key, _, value = line.partition(":")
+        meta[key.strip()] = value.strip()
+    return meta, text[match.end():]
+
+
+def split_sections(text, depth):
+    """Splits Markdown into (title, level, body) at headings of level <= `depth`.
+
+    Text before the first such heading becomes an untitled section, and
+    horizontal rules that only separate sections are dropped.
+    """
+    sections = []
+    title, level, body = None, 0, []
+    for line in text.splitlines():
+        match = _HEADING.match(line)
+        if match and len(match.group(1)) <= depth:
+            sections.append((title, level, body))
+            title, level, body = match.group(2).replace("**", ""), len(match.group(1)), []
+        else:
+            body.append(line)
+    sections.append((title, level, body))
+
+    result = []
+    for title, level, body in sections:
+        while body and (not body[-1].strip() or _RULE.match(body[-1])):
+            body.pop()
+        while body and (not body[0].strip() or _RULE.match(body[0])):
+            body.pop(0)
+        if title is not None or body:
+            result.append((title, level, "\n".join(body)))
+    return result
+
+
+def render_sections(text, depth):
+    """Renders Markdown into a list of Sections with HTML bodies."""
+    markdown = _renderer()
+    return [
+        Section(title, level, markdown.render(body) if body else "")
+        for title, level, body in split_sections(text, depth)
+    ]
+
+
+def _disk_cache_path(digest):
+    return os.path.join(APP_CONTENT_DIR, ".render_cache", f"{digest}.json")
+
+
+def load_sections(path):
+    """Returns the rendered Sections of a content file, rendering it at most once."""
+    with open(path, "rb") as f:
+        source = f.read()
+    digest = hashlib.sha256(b"%d:" % RENDER_VERSION + source).hexdigest()
+    sections = _rendered.get(digest)
+    if sections is not None:
+        return sections
+
+    cache_path = _disk_cache_path(digest)
+    try:
+        with open(cache_path, "r", encoding="utf-8") as f:
+            sections = [Section(*item) for item in json.load(f)]
+    except (FileNotFoundError, ValueError, TypeError):
+        meta, text = parse_front_matter(source.decode("utf-8"))
+        sections = render_sections(text, int(meta.get("section_depth", 2)))
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        fileio.atomic_write(cache_path, json.dumps(sections))
+    _rendered[digest] = sections
+    return sections
+
+
+def load_css(path):
+    """Returns a stylesheet as a <style> block, reading the file once per process."""
+    style = _styles.get(path)
+    if style is None:
+        with open(path, "r", encoding="utf-8") as f:
+            style = _styles[path] = f"<style>\n{f.read()}</style>"
+    return style
+
+
+def show_sections(sections, key, css_class=None):
+    """Renders Sections as collapsible toggles; only opened sections are sent to the browser.
+
+    Sections without a body are shown as plain headings, and the first section
+    with a body starts open.
+    """
+    opened = False
+    for i, section in enumerate(sections):
+        if not section.html:
+            if section.title:
+                st.markdown("#" * max(section.level, 2) + " " + section.title)
+            continue
+        if section.title is None or st.toggle(section.title, value=not opened, key=f"{key}-{i}"):
+            html = section.html
+            if css_class:
+                html = f'<div class="{css_class}">{html}</div>'
+            st.html(html)
+        opened = True
+
+
+def main():
+    for content_dir in CONTENT_DIRS:
+        for path in sorted(glob.glob(os.path.join(content_dir, "*.md"))):
+            sections = load_sections(path)
+            print(f"Rendered {os.path.relpath(path)}: {len(sections)} sections")
+
+
+if __name__ == "__main__":
+    main()
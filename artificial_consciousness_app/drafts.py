@@ -0,0 +1,135 @@
+"""Autosaved drafts of unsaved introspection answers.
+
+Edits are handed to an `Autosaver`, which only records them in memory; a
+background thread writes them to a small SQLite drafts store once no new edit
+has arrived for `delay` seconds, in one transaction per burst of typing. Only
+questions whose text changed since the last write are written. Drafts are
+keyed by date and stable question ID and are removed once the day is saved.
+"""
+import atexit
+import threading
+import time
+
+import fileio
+
+
+class DraftStore:
+    """SQLite table of the latest unsaved text per (date, question)."""
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS drafts (
+            date TEXT NOT NULL,
+            question_id TEXT NOT NULL,
+            text TEXT NOT NULL,
+            updated REAL NOT NULL,
+            PRIMARY KEY (date, question_id)
+        );
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._conn, self._lock = fileio.open_db(path, self.SCHEMA)
+
+    def load(self, day):
+        """Returns {question_id: text} of the drafts saved for `day`."""
+        with self._lock:
+            return dict(self._conn.execute("SELECT question_id, text FROM drafts WHERE date = ?", (day,)))
+
+    def write(self, drafts):
+        """Writes {(date, question_id): text} in one transaction."""
+        now = time.time()
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO drafts VALUES (?, ?, ?, ?)",
+                [(day, qid, text, now) for (day, qid), text in drafts.items()],
+            )
+
+    def discard(self, day):
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM drafts WHERE date = ?", (day,))
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+class Autosaver:
+    """Debounces draft edits and writes them off the script thread.
+
+    `update()` is a dictionary assignment under a lock, so it never waits on
+    disk. The writer thread starts on the first edit and flushes whatever is
+    pending after `delay` quiet seconds, or at most every `max_delay` seconds
+    while edits keep arriving; pending drafts are also flushed at exit.
+    """
+
+    def __init__(self, store, delay=1.0, max_delay=5.0):
+        self.store = store
+        self.delay = delay
+        self.max_delay = max_delay
+        self.writes = 0
+        self._pending = {}
+        self._written = {}
+        self._first_edit = None
+        self._last_edit = None
+        self._lock = threading.Lock()
+        self._io_lock = threading.Lock()  # Keeps a flush from re-writing drafts a discard just removed.
+        self._wake = threading.Condition(self._lock)
+        self._thread = None
+        atexit.register(self.flush)
+
+    def restore(self, day):
+        """Returns {question_id: text} of the drafts for `day`, pending edits included."""
+        saved = self.store.load(day)
+        with self._lock:
+            self._written.update(((day, qid), text) for qid, text in saved.items())
+            saved.update((qid, text) for (d, qid), text in self._pending.items() if d == day)
+        return saved
+
+    def update(self, day, question_id, text):
+        """Records the latest text of one question; does nothing if it is unchanged (or still empty)."""
+        key = (day, question_id)
+        with self._lock:
+            if self._pending.get(key, self._written.get(key, "")) == text:
+                return
+            self._pending[key] = text
+            now = time.monotonic()
+            self._first_edit = self._first_edit or now
+            self._last_edit = now
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="draft-autosaver", daemon=True)
+                self._thread.start()
+            self._wake.notify()
+
+    def discard(self, day):
+        """Drops the pending and saved drafts of `day`, e.g. after the day itself was saved."""
+        with self._io_lock:
+            with self._lock:
+                for key in [key for key in self._pending if key[0] == day]:
+                    del self._pending[key]
+                for key in [key for key in self._written if key[0] == day]:
+                    del self._written[key]
+            self.store.discard(day)
+
+    def flush(self):
+        """Writes every pending draft now."""
+        with self._io_lock:
+            with self._lock:
+                pending, self._pending = self._pending, {}
+                self._first_edit = self._last_edit = None
+            if pending:
+                self.store.write(pending)
+                with self._lock:
+                    self._written.update(pending)
+                    self.writes += 1
+
+    def _run(self):
+        while True:
+            with self._lock:
+                while not self._pending:
+                    self._wake.wait()
+                now = time.monotonic()
+                due = min(self._last_edit + self.delay, self._first_edit + self.max_delay)
+                if now < due:
+                    self._wake.wait(due - now)
+                    continue
+            self.flush()
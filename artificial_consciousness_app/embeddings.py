@@ -0,0 +1,177 @@
+"""Local similarity index over past answers, for "Related reflections".
+
+Answers are embedded with a stateless hashed bag-of-words model (sublinear
+term frequency, stop words removed, L2-normalized), so no network access or
+model download is needed and vectors never have to be recomputed as the
+vocabulary grows. Vectors are kept in a float32 matrix that is read
+through a NumPy memory map; row metadata lives in a small SQLite table.
+A lookup is one batched matrix product over all rows.
+"""
+import os
+import re
+import zlib
+
+import numpy as np
+
+import entries as entry_model
+import fileio
+from stats import is_empty_answer
+
+DIM = 512
+
+STOP_WORDS = frozenset(
+    "a about after again all also am an and any are as at be because been but by can could did do does doing "
+    "for from had has have he her him his how i if in into is it its just me more most my no not now of on "
+    "one only or other our out so some than that the their them then there these they this to today too up "
+    "very was we were what when which who why will with would you your".split()
+)
+_TOKEN = re.compile(r"[a-z0-9']+")
+
+
+def embed(texts):
+    """Returns an (len(texts), DIM) float32 matrix of unit-length hashed term vectors."""
+    matrix = np.zeros((len(texts), DIM), dtype=np.float32)
+    for row, text in enumerate(texts):
+        for token in _TOKEN.findall(text.lower()):
+            if len(token) < 3 or token in STOP_WORDS:
+                continue
+            h = zlib.crc32(token.encode("utf-8"))
+            matrix[row, h % DIM] += 1.0 if h & 0x80000000 else -1.0
+    matrix = np.sign(matrix) * np.log1p(np.abs(matrix))
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    np.divide(matrix, norms, out=matrix, where=norms > 0)
+    return matrix
+
+
+class VectorIndex:
+    """Matrix of answer vectors with per-row metadata.
+
+    Re-saving a day zeroes its old rows in place and lists them as free; new
+    vectors fill free rows first and are appended only when none are left, so
+    the work per save is proportional to that day's answers and the matrix
+    holds at most as many rows as the journal has ever had answers at once.
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS vectors (
+            row INTEGER PRIMARY KEY,
+            date TEXT NOT NULL,
+            position INTEGER NOT NULL,
+            question_id TEXT NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS vectors_date ON vectors (date);
+        CREATE TABLE IF NOT EXISTS free_rows (row INTEGER PRIMARY KEY);
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.matrix_path = os.path.splitext(path)[0] + ".f32"
+        self._conn, self._lock = fileio.open_db(path, self.SCHEMA)
+        self._list_free_rows()
+
+    def _list_free_rows(self):
+        """Lists as free the rows that no vector uses, as an index written before free_rows was kept has."""
+        with self._lock, self._conn:
+            (used,) = self._conn.execute("SELECT (SELECT COUNT(*) FROM vectors) + (SELECT COUNT(*) FROM free_rows)").fetchone()
+            rows = self._row_count()
+            if used < rows:
+                taken = {row for (row,) in self._conn.execute("SELECT row FROM vectors UNION SELECT row FROM free_rows")}
+                self._conn.executemany("INSERT INTO free_rows VALUES (?)", [(row,) for row in range(rows) if row not in taken])
+
+    def _row_count(self):
+        try:
+            return os.path.getsize(self.matrix_path) // (DIM * 4)
+        except FileNotFoundError:
+            return 0
+
+    def is_empty(self):
+        with self._lock:
+            return self._conn.execute("SELECT 1 FROM vectors LIMIT 1").fetchone() is None
+
+    def index_day(self, day, records):
+        self.index_days([(day, records)])
+
+    def index_days(self, days):
+        """Replaces the vectors of several days."""
+        with self._lock, fileio.file_lock(self.matrix_path), self._conn:
+            for day, records in days:
+                old_rows = [row for (row,) in self._conn.execute("SELECT row FROM vectors WHERE date = ?", (day,))]
+                if old_rows:
+                    matrix = np.memmap(self.matrix_path, dtype=np.float32, mode="r+", shape=(self._row_count(), DIM))
+                    matrix[old_rows] = 0.0
+                    matrix.flush()
+                    del matrix
+                    self._conn.execute("DELETE FROM vectors WHERE date = ?", (day,))
+                    self._conn.executemany("INSERT INTO free_rows VALUES (?)", [(row,) for row in old_rows])
+                kept = [(position, item) for position, item in enumerate(records) if not is_empty_answer(item["answer"])]
+                if not kept:
+                    continue
+                vectors = embed([item["answer"] for _, item in kept])
+                rows = self._write_rows(vectors)
+                self._conn.executemany(
+                    "INSERT INTO vectors VALUES (?, ?, ?, ?)",
+                    [
+                        (row, day, position, item.get("id") or entry_model.question_id(item["question"]))
+                        for row, (position, item) in zip(rows, kept)
+                    ],
+                )
+
+    def _write_rows(self, vectors):
+        """Writes `vectors` into free rows, then past the end of the matrix; returns their row numbers."""
+        free = [row for (row,) in self._conn.execute("SELECT row FROM free_rows ORDER BY row LIMIT ?", (len(vectors),))]
+        if free:
+            self._conn.executemany("DELETE FROM free_rows WHERE row = ?", [(row,) for row in free])
+            matrix = np.memmap(self.matrix_path, dtype=np.float32, mode="r+", shape=(self._row_count(), DIM))
+            matrix[free] = vectors[:len(free)]
+            matrix.flush()
+            del matrix
+        first_row = self._row_count()
+        with open(self.matrix_path, "ab") as f:
+            f.write(vectors[len(free):].tobytes())
+        return free + list(range(first_row, first_row + len(vectors) - len(free)))
+
+    def rebuild(self, store):
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM vectors")
+            self._conn.execute("DELETE FROM free_rows")
+            if os.path.exists(self.matrix_path):
+                os.remove(self.matrix_path)
+        self.index_days(store.load_all().items())
+
+    def related(self, records, exclude_date=None, limit=5):
+        """Returns the past answers most similar to any of `records`.
+
+        Results are (date, position, score) tuples, best first; answers saved on
+        `exclude_date` are skipped.
+        """
+        texts = [item["answer"] for item in records if not is_empty_answer(item["answer"])]
+        if not texts:
+            return []
+        queries = embed(texts)
+
+        # The matrix is read under the lock, so that rebuild() cannot remove it in between.
+        with self._lock:
+            rows = self._row_count()
+            if not rows:
+                return []
+            matrix = np.memmap(self.matrix_path, dtype=np.float32, mode="r", shape=(rows, DIM))
+            scores = (queries @ matrix.T).max(axis=0)
+            del matrix
+            if exclude_date is not None:
+                excluded = [row for (row,) in self._conn.execute("SELECT row FROM vectors WHERE date = ?", (exclude_date,))]
+                scores[[row for row in excluded if row < rows]] = 0.0
+            candidates = min(rows, limit * 4)
+            top = np.argpartition(-scores, candidates - 1)[:candidates]
+            top = top[np.argsort(-scores[top])]
+            results = []
+            for row in top:
+                if scores[row] <= 0 or len(results) == limit:
+                    break
+                meta = self._conn.execute("SELECT date, position FROM vectors WHERE row = ?", (int(row),)).fetchone()
+                if meta:
+                    results.append((meta[0], meta[1], float(scores[row])))
+        return results
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
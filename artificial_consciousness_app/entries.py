@@ -0,0 +1,162 @@
+"""Entry model shared by both apps.
+
+Questions are interned once by a stable ID derived from their text, and each
+day holds compact Entry records that refer to questions by that ID. Two legacy
+on-disk shapes are understood:
+
+* introspection_logs.json: {date: [{"question": text, "answer": text}, ...]}
+* introspection_data.json (old app): {date: {question text: answer}}
+
+The current whole-file schema (SCHEMA_VERSION) stores each question text once:
+
+    {"schema": 3,
+     "questions": {id: text},
+     "days": {date: [[id, answer, prompt_version], ...]}}
+
+`prompt_version` is the version of the prompt set (see prompts.py) the answer
+was given under, or null when unknown; schema 2 rows ([id, answer]) are still
+read. A record may carry the question's "id" explicitly, so a prompt that is
+reworded keeps the ID derived from its original text.
+"""
+import hashlib
+import json
+from dataclasses import dataclass
+
+import jsonstream
+
+SCHEMA_VERSION = 3
+SUPPORTED_SCHEMAS = (2, 3)
+
+
+def question_id(text):
+    """Returns the stable ID of a question: a short hash of its text."""
+    return hashlib.sha1(text.encode("utf-8")).hexdigest()[:12]
+
+
+@dataclass(frozen=True, slots=True)
+class Question:
+    id: str
+    text: str
+
+
+@dataclass(frozen=True, slots=True)
+class Entry:
+    question_id: str
+    answer: str
+    prompt_version: int | None = None
+
+
+class QuestionTable:
+    """Interns question text so every distinct question is stored once."""
+
+    __slots__ = ("_texts",)
+
+    def __init__(self, questions=None):
+        self._texts = dict(questions or {})
+
+    def intern(self, text, qid=None):
+        """Returns the ID of `text` (or `qid` if given), registering it if new."""
+        qid = qid or question_id(text)
+        self._texts.setdefault(qid, text)
+        return qid
+
+    def add(self, qid, text):
+        self._texts[qid] = text
+
+    def text(self, qid):
+        return self._texts[qid]
+
+    def __contains__(self, qid):
+        return qid in self._texts
+
+    def __len__(self):
+        return len(self._texts)
+
+    def items(self):
+        return self._texts.items()
+
+
+def entries_from_value(value, questions):
+    """Converts one day in either legacy shape (or a list of Entry) to Entry records."""
+    if isinstance(value, dict):
+        return [Entry(questions.intern(question), answer) for question, answer in value.items()]
+    result = []
+    for item in value:
+        if isinstance(item, Entry):
+            result.append(item)
+        else:
+            qid = questions.intern(item["question"], item.get("id"))
+            result.append(Entry(qid, item["answer"], item.get("prompt_version")))
+    return result
+
+
+def to_records(entries, questions):
+    """Converts Entry records to the {"question", "answer", "id", "prompt_version"} dicts the pages display."""
+    return [
+        {"question": questions.text(entry.question_id), "answer": entry.answer,
+         "id": entry.question_id, "prompt_version": entry.prompt_version}
+        for entry in entries
+    ]
+
+
+def parse_document(data, questions=None):
+    """Returns (QuestionTable, {date: [Entry]}) for a decoded JSON document of any schema."""
+    questions = questions if questions is not None else QuestionTable()
+    if isinstance(data, dict) and data.get("schema") in SUPPORTED_SCHEMAS:
+        for qid, text in data["questions"].items():
+            questions.add(qid, text)
+        days = {day: [Entry(*item) for item in items] for day, items in data["days"].items()}
+        return questions, days
+    if isinstance(data, dict) and "schema" in data:
+        raise ValueError(f"Unsupported journal schema: {data['schema']!r}")
+    return questions, {day: entries_from_value(value, questions) for day, value in data.items()}
+
+
+def read_document(path, questions=None):
+    """Reads a whole-file JSON journal in the current or either legacy schema."""
+    with open(path, "r", encoding="utf-8") as f:
+        return parse_document(json.load(f), questions)
+
+
+def iter_document(path, questions=None):
+    """Yields (date, [Entry]) from a whole-file JSON journal of any schema, one day at a time.
+
+    Unlike read_document, the file is never held in memory whole. `questions`
+    (a QuestionTable) is filled in as the file is read; in the current schema
+    the question table has to precede the days, as dump_document writes it.
+    """
+    questions = questions if questions is not None else QuestionTable()
+    with open(path, "r", encoding="utf-8") as f:
+        reader = jsonstream.ObjectReader(f)
+        schema = None
+        for key in reader.members():
+            if key == "schema" and schema is None:
+                schema = reader.value()
+                if schema not in SUPPORTED_SCHEMAS:
+                    raise ValueError(f"Unsupported journal schema: {schema!r}")
+            elif schema is None:
+                yield key, entries_from_value(reader.value(), questions)
+            elif key == "questions":
+                for qid, text in reader.value().items():
+                    questions.add(qid, text)
+            elif key == "days":
+                for day in reader.members():
+                    items = reader.value()
+                    if any(item[0] not in questions for item in items):
+                        raise ValueError(f"{path} lists days before the questions they refer to")
+                    yield day, [Entry(*item) for item in items]
+            else:
+                reader.value()
+
+
+def dump_document(days, questions):
+    """Returns the current-schema document for {date: [Entry]}."""
+    used = {entry.question_id for entries in days.values() for entry in entries}
+    return {
+        "schema": SCHEMA_VERSION,
+        "questions": {qid: text for qid, text in questions.items() if qid in used},
+        "days": {
+            day: [[entry.question_id, entry.answer, entry.prompt_version] for entry in entries]
+            for day, entries in sorted(days.items())
+        },
+    }
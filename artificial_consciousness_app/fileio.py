@@ -0,0 +1,153 @@
+"""Crash-safe file writes and advisory locks shared by the file-based stores.
+
+Writers take an exclusive advisory lock on a sidecar `<path>.lock` file so
+several Streamlit sessions (or processes) never interleave writes. Readers do
+not lock: whole-file writes go through a temp file that is fsynced and then
+atomically renamed over the target, so a reader sees either the old or the new
+file, never a truncated one.
+
+The SQLite-backed stores and indexes open their databases with `open_db`;
+SqliteStore also reads through `ReadConnections`.
+"""
+import contextlib
+import os
+import shutil
+import sqlite3
+import tempfile
+import threading
+import urllib.parse
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+
+@contextlib.contextmanager
+def file_lock(path):
+    """Holds an exclusive advisory lock for `path` (via `<path>.lock`) while the block runs."""
+    with open(path + ".lock", "a+b") as lock_file:
+        if fcntl is not None:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+        else:
+            lock_file.seek(0)
+            msvcrt.locking(lock_file.fileno(), msvcrt.LK_LOCK, 1)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+            else:
+                lock_file.seek(0)
+                msvcrt.locking(lock_file.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+def open_db(path, schema=None):
+    """Opens the SQLite database at `path` for sharing across threads; returns (connection, lock).
+
+    Streamlit serves sessions from several threads, so the one connection is
+    used under the returned lock, and reads through it wait behind writes in
+    this process. WAL lets other processes (and ReadConnections) read while it
+    writes; writers from other processes wait up to 30 seconds for the write
+    lock. `schema` (a script of CREATE ... IF NOT EXISTS statements) is run
+    once the database is open.
+    """
+    conn = sqlite3.connect(path, timeout=30, check_same_thread=False)
+    lock = threading.Lock()
+    with lock, conn:
+        conn.execute("PRAGMA journal_mode=WAL")
+        if schema:
+            conn.executescript(schema)
+    return conn, lock
+
+
+class ReadConnections:
+    """Read-only connections to the SQLite database at `path`, one per thread.
+
+    The database must already exist in WAL mode (see open_db). A reader sees
+    the last committed transaction and never waits for a writer, so reads
+    through these do not queue behind the writing connection's lock.
+    """
+
+    def __init__(self, path):
+        self.uri = "file:" + urllib.parse.quote(os.path.abspath(path)) + "?mode=ro"
+        self._conns = {}
+        self._lock = threading.Lock()
+        self._closed = False
+
+    def get(self):
+        """Returns the calling thread's connection, opening it on the thread's first read."""
+        thread = threading.current_thread()
+        with self._lock:
+            if self._closed:
+                raise sqlite3.ProgrammingError("Cannot operate on a closed database.")
+            conn = self._conns.get(thread)
+            if conn is None:
+                # Streamlit runs every rerun on a new thread; close the connections of finished ones.
+                for finished in [other for other in self._conns if not other.is_alive()]:
+                    self._conns.pop(finished).close()
+                conn = self._conns[thread] = sqlite3.connect(self.uri, uri=True, timeout=30, check_same_thread=False)
+            return conn
+
+    def close(self):
+        with self._lock:
+            self._closed = True
+            for conn in self._conns.values():
+                conn.close()
+            self._conns.clear()
+
+
+def _fsync_dir(path):
+    if os.name != "posix":
+        return
+    fd = os.open(os.path.dirname(os.path.abspath(path)), os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def atomic_write(path, data, keep_backup=False):
+    """Replaces `path` with `data` (str or bytes) so a crash never leaves a partial file.
+
+    With `keep_backup`, the previous contents are kept as `<path>.bak`, the
+    last good snapshot used for recovery.
+    """
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(prefix=os.path.basename(path) + ".", suffix=".tmp", dir=directory)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        if keep_backup and os.path.exists(path):
+            shutil.copy2(path, backup_path(path))
+        os.replace(tmp_path, path)
+    except BaseException:
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(tmp_path)
+        raise
+    _fsync_dir(path)
+
+
+def append_lines(path, lines):
+    """Appends text lines to `path` and fsyncs them before returning.
+
+    If a previous writer crashed mid-line, the torn line is terminated first
+    so the new lines stay readable.
+    """
+    with open(path, "a+b") as f:
+        if f.tell():
+            f.seek(-1, os.SEEK_END)
+            if f.read(1) != b"\n":
+                f.write(b"\n")
+        f.write("".join(lines).encode("utf-8"))
+        f.flush()
+        os.fsync(f.fileno())
+
+
+def backup_path(path):
+    return path + ".bak"
@@ -0,0 +1,183 @@
+import difflib
+import hashlib
+import json
+import zlib
+from datetime import datetime
+
+import fileio
+from storage import normalize_day
+
+# A full snapshot is stored at least every KEYFRAME_INTERVAL versions of a day,
+# so rebuilding any version decompresses at most that many blobs.
+KEYFRAME_INTERVAL = 16
+
+
+def encode_day(records):
+    """Returns the canonical bytes of one day's records; equal days encode equally."""
+    return json.dumps(normalize_day(records), ensure_ascii=False, sort_keys=True, separators=(",", ":")).encode("utf-8")
+
+
+def diff_days(old, new):
+    """Returns (question, unified diff lines) for every answer that differs between two versions of a day."""
+    old_answers = {item.get("id") or item["question"]: item["answer"] for item in normalize_day(old)}
+    changes = []
+    for item in normalize_day(new):
+        before = old_answers.pop(item.get("id") or item["question"], "")
+        if before != item["answer"]:
+            changes.append((item["question"], list(difflib.unified_diff(
+                before.splitlines(), item["answer"].splitlines(), "before", "after", lineterm=""
+            ))))
+    return changes
+
+
+class EntryHistory:
+    """Every saved version of every day, content-addressed and delta-compressed.
+
+    `blobs` holds each distinct day content once, keyed by the SHA-256 of its
+    canonical encoding. A blob is zlib-compressed with the previous version of
+    the same day as the preset dictionary (zdict), so an edit costs roughly the
+    bytes it changed rather than a copy of the day; `base` names that previous
+    version, and every KEYFRAME_INTERVAL-th blob has none. `versions` lists the
+    snapshots of each date in order. Reading a version touches only the blobs
+    of its own chain, never the rest of the history.
+
+    With a `cipher` (an encrypted VaultStore's), each blob is also encrypted
+    after compression, bound to its hash; the hashes and save times stay
+    readable.
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS blobs (
+            hash TEXT PRIMARY KEY,
+            base TEXT REFERENCES blobs(hash),
+            depth INTEGER NOT NULL,
+            size INTEGER NOT NULL,
+            data BLOB NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS versions (
+            date TEXT NOT NULL,
+            version INTEGER NOT NULL,
+            hash TEXT NOT NULL REFERENCES blobs(hash),
+            saved_at TEXT,
+            PRIMARY KEY (date, version)
+        );
+    """
+
+    def __init__(self, path, cipher=None):
+        self.path = path
+        self.cipher = cipher
+        self._conn, self._lock = fileio.open_db(path, self.SCHEMA)
+
+    def _latest_locked(self, day):
+        return self._conn.execute(
+            "SELECT version, hash FROM versions WHERE date = ? ORDER BY version DESC LIMIT 1", (day,)
+        ).fetchone()
+
+    def _content_locked(self, digest):
+        """Rebuilds the bytes of blob `digest` by decompressing its chain from the last keyframe."""
+        chain = []
+        while digest is not None:
+            base, data = self._conn.execute("SELECT base, data FROM blobs WHERE hash = ?", (digest,)).fetchone()
+            if self.cipher is not None:
+                data = self.cipher.decrypt(data, digest)
+            chain.append((base, data))
+            digest = base
+        content = b""
+        for base, data in reversed(chain):
+            content = zlib.decompressobj(zdict=content).decompress(data) if base is not None else zlib.decompress(data)
+        return content
+
+    def _store_locked(self, content, base):
+        """Stores `content` unless an identical blob exists; returns its hash."""
+        digest = hashlib.sha256(content).hexdigest()
+        if self._conn.execute("SELECT 1 FROM blobs WHERE hash = ?", (digest,)).fetchone():
+            return digest
+        depth = 0
+        if base is not None:
+            depth = self._conn.execute("SELECT depth FROM blobs WHERE hash = ?", (base,)).fetchone()[0] + 1
+        if base is None or depth >= KEYFRAME_INTERVAL:
+            base, depth, data = None, 0, zlib.compress(content, 9)
+        else:
+            compressor = zlib.compressobj(9, zdict=self._content_locked(base))
+            data = compressor.compress(content) + compressor.flush()
+        if self.cipher is not None:
+            data = self.cipher.encrypt(data, digest)
+        self._conn.execute(
+            "INSERT INTO blobs (hash, base, depth, size, data) VALUES (?, ?, ?, ?, ?)",
+            (digest, base, depth, len(content), data),
+        )
+        return digest
+
+    def record(self, day, records, previous=None, saved_at=None):
+        """Adds `records` as the newest version of `day`; returns its version number, or None if unchanged.
+
+        `previous` is the day as stored before this save. It becomes version 1
+        (with no save time) when the day has no history yet, so days saved
+        before history was kept keep their first version too.
+        """
+        content = encode_day(records)
+        saved_at = saved_at or datetime.now().isoformat(timespec="seconds")
+        with self._lock, self._conn:
+            latest = self._latest_locked(day)
+            if latest is None and previous:
+                digest = self._store_locked(encode_day(previous), None)
+                self._conn.execute("INSERT INTO versions (date, version, hash) VALUES (?, 1, ?)", (day, digest))
+                latest = (1, digest)
+            if latest is not None and latest[1] == hashlib.sha256(content).hexdigest():
+                return None
+            version = latest[0] + 1 if latest else 1
+            digest = self._store_locked(content, latest[1] if latest else None)
+            self._conn.execute(
+                "INSERT INTO versions (date, version, hash, saved_at) VALUES (?, ?, ?, ?)", (day, version, digest, saved_at)
+            )
+            return version
+
+    def versions(self, day, limit=50):
+        """Returns (version, saved_at) of the newest `limit` versions of `day`, newest first."""
+        with self._lock:
+            return self._conn.execute(
+                "SELECT version, saved_at FROM versions WHERE date = ? ORDER BY version DESC LIMIT ?", (day, limit)
+            ).fetchall()
+
+    def get(self, day, version):
+        """Returns the records of one version of `day`, or None if there is no such version."""
+        with self._lock:
+            row = self._conn.execute("SELECT hash FROM versions WHERE date = ? AND version = ?", (day, version)).fetchone()
+            if row is None:
+                return None
+            return json.loads(self._content_locked(row[0]))
+
+    def hashes(self, day, limit=50):
+        """Returns the content hashes of the newest `limit` versions of `day`, newest first."""
+        with self._lock:
+            return [row[0] for row in self._conn.execute(
+                "SELECT hash FROM versions WHERE date = ? ORDER BY version DESC LIMIT ?", (day, limit)
+            )]
+
+    def latest_hashes(self):
+        """Returns {date: content hash of its newest version} for every day with a history, reading no blobs."""
+        with self._lock:
+            # SQLite takes the bare `hash` column from the row holding MAX(version).
+            return {day: digest for day, digest, _ in self._conn.execute(
+                "SELECT date, hash, MAX(version) FROM versions GROUP BY date"
+            )}
+
+    def find(self, digest):
+        """Returns the records whose canonical encoding hashes to `digest`, or None if no version has it."""
+        with self._lock:
+            if self._conn.execute("SELECT 1 FROM blobs WHERE hash = ?", (digest,)).fetchone() is None:
+                return None
+            return json.loads(self._content_locked(digest))
+
+    def storage_stats(self):
+        """Returns the number of versions and blobs, and the stored versus uncompressed bytes."""
+        with self._lock:
+            versions = self._conn.execute("SELECT COUNT(*) FROM versions").fetchone()[0]
+            blobs, stored, size = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(LENGTH(data)), 0), COALESCE(SUM(size), 0) FROM blobs"
+            ).fetchone()
+        return {"versions": versions, "blobs": blobs, "stored_bytes": stored, "content_bytes": size}
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
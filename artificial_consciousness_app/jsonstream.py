@@ -0,0 +1,92 @@
+"""Incremental reading of large JSON objects, one member at a time.
+
+`json.load` materializes a whole document, which for a journal of many years
+means every day's answers at once. ObjectReader instead walks the members of
+an object from a file in fixed-size chunks: each member value is decoded with
+`JSONDecoder.raw_decode` as soon as it is complete, and the consumed text is
+dropped, so memory is bounded by the largest single value, not the file.
+
+    with open(path, encoding="utf-8") as f:
+        reader = ObjectReader(f)
+        for key in reader.members():
+            value = reader.value()   # or reader.members() to descend into it
+"""
+import json
+
+CHUNK_SIZE = 1 << 20
+_WHITESPACE = " \t\n\r"
+_NUMBER = "0123456789+-.eE"
+
+
+class ObjectReader:
+    """Streams the members of JSON objects from a text file."""
+
+    def __init__(self, f, chunk_size=CHUNK_SIZE):
+        self._file = f
+        self._chunk_size = chunk_size
+        self._decoder = json.JSONDecoder()
+        self._buffer = ""
+        self._pos = 0
+        self._eof = False
+
+    def _fill(self):
+        """Reads another chunk, dropping consumed text; returns False at the end of the file."""
+        if self._eof:
+            return False
+        chunk = self._file.read(self._chunk_size)
+        if not chunk:
+            self._eof = True
+            return False
+        self._buffer = self._buffer[self._pos:] + chunk
+        self._pos = 0
+        return True
+
+    def _peek(self):
+        """Returns the next non-whitespace character without consuming it ("" at the end)."""
+        while True:
+            while self._pos < len(self._buffer) and self._buffer[self._pos] in _WHITESPACE:
+                self._pos += 1
+            if self._pos < len(self._buffer) or not self._fill():
+                return self._buffer[self._pos:self._pos + 1]
+
+    def _expect(self, chars):
+        char = self._peek()
+        if not char or char not in chars:
+            raise ValueError(f"Expected one of {chars!r} in JSON stream, found {char or 'end of file'!r}")
+        self._pos += 1
+        return char
+
+    def value(self):
+        """Decodes and returns the next complete JSON value."""
+        self._peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError:
+                if self._fill():
+                    continue
+                raise
+            # A number running up to the end of the buffer ("1" of "1.5e3") may continue in the next chunk.
+            if isinstance(value, (int, float)) and not isinstance(value, bool):
+                tail = end
+                while tail < len(self._buffer) and self._buffer[tail] in _NUMBER:
+                    tail += 1
+                if tail == len(self._buffer) and self._fill():
+                    continue
+            self._pos = end
+            return value
+
+    def members(self):
+        """Yields the keys of the next object; the caller consumes each member's value before the next key."""
+        self._expect("{")
+        if self._peek() == "}":
+            self._pos += 1
+            return
+        while True:
+            key = self.value()
+            if not isinstance(key, str):
+                raise ValueError("JSON object keys must be strings")
+            self._expect(":")
+            yield key
+            if self._expect(",}") == "}":
+                return
@@ -0,0 +1,183 @@
+"""Searchable library of the PDFs shipped with the repo.
+
+Text is extracted once per PDF on a background thread and cached under
+`.library_cache/` by the file's SHA-256, so a PDF is only ever parsed again
+if its contents change. Extracted pages go into a page-level SQLite FTS5
+index; the Library page only queries that index and never touches a PDF.
+"""
+import glob
+import hashlib
+import json
+import logging
+import os
+import threading
+
+import fileio
+from search import MARK_END, MARK_START, fts_query, highlight
+
+logger = logging.getLogger(__name__)
+
+REPO_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+LIBRARY_GLOBS = [
+    os.path.join(REPO_DIR, "*.pdf"),
+    os.path.join(REPO_DIR, "papers", "*.pdf"),
+]
+CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".library_cache")
+
+
+def library_files():
+    """Returns the PDFs in the library, sorted by path."""
+    return sorted(os.path.normpath(path) for pattern in LIBRARY_GLOBS for path in glob.glob(pattern))
+
+
+def file_sha256(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def extract_text(path):
+    """Returns {"title", "pages"} for a PDF, with the text of every page."""
+    from pypdf import PdfReader  # Only the indexing thread needs the PDF parser.
+
+    reader = PdfReader(path)
+    pages = [page.extract_text() or "" for page in reader.pages]
+    title = reader.metadata.title if reader.metadata and reader.metadata.title else None
+    return {"title": title or guess_title(path, pages), "pages": pages}
+
+
+def cached_text(path, sha256):
+    """Returns extract_text(path), parsing the PDF only if no cache exists for `sha256`."""
+    cache_path = os.path.join(CACHE_DIR, f"{sha256}.json")
+    try:
+        with open(cache_path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (FileNotFoundError, ValueError):
+        pass
+    extracted = extract_text(path)
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    fileio.atomic_write(cache_path, json.dumps(extracted))
+    return extracted
+
+
+def guess_title(path, pages):
+    """Uses the first substantial line of the first page, or the file name."""
+    for line in (pages[0] if pages else "").splitlines():
+        line = line.strip()
+        if len(line) > 8 and not line[0].isdigit():
+            return line
+    return os.path.splitext(os.path.basename(path))[0]
+
+
+class Library:
+    """Page-level full-text index over the library PDFs.
+
+    `documents` remembers each file's size and mtime alongside its hash, so
+    unchanged files are skipped without rehashing them. `start()` indexes new
+    or changed files on a daemon thread; `status()` reports progress.
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS documents (
+            path TEXT PRIMARY KEY,
+            sha256 TEXT NOT NULL,
+            size INTEGER NOT NULL,
+            mtime_ns INTEGER NOT NULL,
+            title TEXT NOT NULL,
+            page_count INTEGER NOT NULL
+        );
+        CREATE VIRTUAL TABLE IF NOT EXISTS pdf_pages USING fts5(
+            sha256 UNINDEXED,
+            page UNINDEXED,
+            text,
+            tokenize = 'porter unicode61'
+        );
+    """
+
+    def __init__(self, path, files=None):
+        self.path = path
+        self.files = files if files is not None else library_files()
+        self._conn, self._lock = fileio.open_db(path, self.SCHEMA)
+        self._status = {}
+        self._thread = None
+
+    def start(self):
+        """Starts indexing in the background; does nothing if already running."""
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._thread = threading.Thread(target=self._index_all, name="library-indexer", daemon=True)
+            self._thread.start()
+
+    def is_indexing(self):
+        return self._thread is not None and self._thread.is_alive()
+
+    def status(self):
+        """Returns {path: state} where state is "pending", "indexing", "ready" or an error message."""
+        with self._lock:
+            return {path: self._status.get(path, "pending") for path in self.files}
+
+    def _set_status(self, path, state):
+        with self._lock:
+            self._status[path] = state
+
+    def _index_all(self):
+        for path in self.files:
+            try:
+                self._index_file(path)
+                self._set_status(path, "ready")
+            except Exception as exc:  # Keep going with the other files.
+                logger.exception("Could not index %s", path)
+                self._set_status(path, f"error: {exc}")
+
+    def _index_file(self, path):
+        stat = os.stat(path)
+        with self._lock:
+            known = self._conn.execute("SELECT size, mtime_ns FROM documents WHERE path = ?", (path,)).fetchone()
+        if known == (stat.st_size, stat.st_mtime_ns):
+            return
+        self._set_status(path, "indexing")
+        sha256 = file_sha256(path)
+        extracted = cached_text(path, sha256)
+        pages = extracted["pages"]
+        with self._lock, self._conn:
+            old = self._conn.execute("SELECT sha256 FROM documents WHERE path = ?", (path,)).fetchone()
+            if old:
+                self._conn.execute("DELETE FROM pdf_pages WHERE sha256 = ?", old)
+            self._conn.execute("DELETE FROM pdf_pages WHERE sha256 = ?", (sha256,))
+            self._conn.executemany(
+                "INSERT INTO pdf_pages (sha256, page, text) VALUES (?, ?, ?)",
+                [(sha256, number, text) for number, text in enumerate(pages, start=1)],
+            )
+            self._conn.execute(
+                "INSERT OR REPLACE INTO documents VALUES (?, ?, ?, ?, ?, ?)",
+                (path, sha256, stat.st_size, stat.st_mtime_ns, extracted["title"], len(pages)),
+            )
+
+    def documents(self):
+        """Returns (path, title, page count) for every indexed PDF."""
+        with self._lock:
+            return self._conn.execute("SELECT path, title, page_count FROM documents ORDER BY title").fetchall()
+
+    def search(self, query, limit=30):
+        """Returns (path, title, page number, snippet) for the best-matching pages.
+
+        Snippets are HTML, escaped and marked up by search.highlight.
+        """
+        match = fts_query(query)
+        if match is None:
+            return []
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT d.path, d.title, pdf_pages.page, snippet(pdf_pages, 2, ?, ?, '…', 24) "
+                "FROM pdf_pages JOIN documents d ON d.sha256 = pdf_pages.sha256 "
+                "WHERE pdf_pages MATCH ? ORDER BY bm25(pdf_pages) LIMIT ?",
+                (MARK_START, MARK_END, match, limit),
+            ).fetchall()
+        return [(path, title, page, highlight(snippet)) for path, title, page, snippet in rows]
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
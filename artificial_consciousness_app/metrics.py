@@ -0,0 +1,186 @@
+"""Opt-in instrumentation of page renders and storage calls.
+
+Set AC_METRICS=1 to enable it. Page functions decorated with `timed` and
+stores wrapped by `instrument_store` then record call counts and latencies,
+and store calls also record the bytes of question/answer text read or
+written. Everything lives in the process-wide `registry`, which the
+Diagnostics page shows and which is written every `AC_METRICS_INTERVAL`
+seconds in the Prometheus text format to `AC_METRICS_FILE` (for a node
+exporter's textfile collector, say).
+
+With metrics disabled, `timed` and `instrument_store` return their argument
+unchanged, so there is no overhead at all. Enabled, a timed call costs two
+clock reads and one locked dictionary update.
+"""
+import functools
+import os
+import threading
+import time
+
+import fileio
+from storage import normalize_day
+
+ENABLED = os.environ.get("AC_METRICS", "") not in ("", "0")
+METRICS_FILE = os.environ.get("AC_METRICS_FILE", "metrics.prom")
+METRICS_INTERVAL = float(os.environ.get("AC_METRICS_INTERVAL", "15"))
+PREFIX = "ac_"
+
+_READS = {"load_all", "get_day", "get_days", "question_history"}
+
+
+def _label_text(labels):
+    escaped = (str(value).replace("\\", "\\\\").replace('"', '\\"') for _, value in labels)
+    return "{" + ",".join(f'{key}="{value}"' for (key, _), value in zip(labels, escaped)) + "}" if labels else ""
+
+
+class Registry:
+    """Thread-safe counters and latency timers keyed by name and labels."""
+
+    def __init__(self):
+        self._counters = {}
+        self._timers = {}
+        self._gauges = {}
+        self._lock = threading.Lock()
+        self._writer = None
+
+    def count(self, name, amount=1, **labels):
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + amount
+
+    def observe(self, name, seconds, **labels):
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            count, total, worst = self._timers.get(key, (0, 0.0, 0.0))
+            self._timers[key] = (count + 1, total + seconds, max(worst, seconds))
+
+    def gauge(self, name, func, **labels):
+        """Registers `func() -> number`, read whenever metrics are collected (e.g. a cache hit rate)."""
+        with self._lock:
+            self._gauges[(name, tuple(sorted(labels.items())))] = func
+
+    def remove_gauges(self, **labels):
+        """Unregisters every gauge whose labels include `labels`, e.g. those of a closed store."""
+        with self._lock:
+            for key in [key for key in self._gauges if set(labels.items()) <= set(key[1])]:
+                del self._gauges[key]
+
+    def snapshot(self):
+        """Returns (counters, timers, gauges) as {(name, labels): value} dicts."""
+        with self._lock:
+            counters, timers, gauges = dict(self._counters), dict(self._timers), dict(self._gauges)
+        return counters, timers, {key: func() for key, func in gauges.items()}
+
+    def prometheus(self):
+        """Returns the metrics in the Prometheus text exposition format."""
+        counters, timers, gauges = self.snapshot()
+        lines = []
+        for name in sorted({name for name, _ in counters}):
+            lines.append(f"# TYPE {PREFIX}{name} counter")
+            lines += [f"{PREFIX}{n}{_label_text(l)} {v}" for (n, l), v in sorted(counters.items()) if n == name]
+        for name in sorted({name for name, _ in timers}):
+            lines.append(f"# TYPE {PREFIX}{name}_seconds summary")
+            for (n, l), (count, total, worst) in sorted(timers.items()):
+                if n == name:
+                    lines.append(f"{PREFIX}{n}_seconds_count{_label_text(l)} {count}")
+                    lines.append(f"{PREFIX}{n}_seconds_sum{_label_text(l)} {total:.6f}")
+                    lines.append(f"{PREFIX}{n}_seconds_max{_label_text(l)} {worst:.6f}")
+        for name in sorted({name for name, _ in gauges}):
+            lines.append(f"# TYPE {PREFIX}{name} gauge")
+            lines += [f"{PREFIX}{n}{_label_text(l)} {v}" for (n, l), v in sorted(gauges.items()) if n == name]
+        return "\n".join(lines) + "\n"
+
+    def write(self, path=METRICS_FILE):
+        fileio.atomic_write(path, self.prometheus())
+
+    def start_writer(self, path=METRICS_FILE, interval=METRICS_INTERVAL):
+        """Writes the dump to `path` every `interval` seconds on a daemon thread; starts at most once."""
+        with self._lock:
+            if self._writer is not None:
+                return
+            self._writer = threading.Thread(target=self._write_loop, args=(path, interval), name="metrics-writer", daemon=True)
+            self._writer.start()
+
+    def _write_loop(self, path, interval):
+        while True:
+            time.sleep(interval)
+            self.write(path)
+
+    def reset(self):
+        with self._lock:
+            self._counters.clear()
+            self._timers.clear()
+
+
+registry = Registry()
+
+
+def timed(name, **labels):
+    """Decorator recording the latency of every call under `name`; a no-op unless ENABLED."""
+
+    def decorator(func):
+        if not ENABLED:
+            return func
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            started = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                registry.observe(name, time.perf_counter() - started, **labels)
+
+        return wrapper
+
+    return decorator
+
+
+def _text_bytes(records):
+    """Returns the UTF-8 size of the questions and answers of one day (in any accepted shape)."""
+    return sum(len(item["question"].encode("utf-8")) + len(item["answer"].encode("utf-8")) for item in normalize_day(records))
+
+
+def _read_bytes(method, result):
+    if not result:
+        return 0
+    if method == "get_day":
+        return _text_bytes(result)
+    if method == "question_history":
+        return sum(len(answer.encode("utf-8")) for _, answer in result)
+    return sum(_text_bytes(records) for records in result.values())
+
+
+class InstrumentedStore:
+    """Wraps a store, timing every method call and counting the text bytes it reads and writes."""
+
+    def __init__(self, store, backend):
+        self.store = store
+        self.backend = backend
+
+    def __getattr__(self, method):
+        attribute = getattr(self.store, method)
+        if not callable(attribute):
+            return attribute
+
+        @functools.wraps(attribute)
+        def call(*args, **kwargs):
+            if method == "put_days":
+                args = (list(args[0]),)  # May be a one-shot iterator; it is needed again below.
+            started = time.perf_counter()
+            result = attribute(*args, **kwargs)
+            registry.observe("store_call", time.perf_counter() - started, backend=self.backend, method=method)
+            if method in _READS:
+                registry.count("store_read_bytes_total", _read_bytes(method, result), backend=self.backend)
+            elif method == "put_day":
+                registry.count("store_written_bytes_total", _text_bytes(args[1]), backend=self.backend)
+            elif method == "put_days":
+                registry.count("store_written_bytes_total", sum(_text_bytes(e) for _, e in args[0]), backend=self.backend)
+            return result
+
+        self.__dict__[method] = call  # Later lookups skip __getattr__.
+        return call
+
+
+def instrument_store(store, backend):
+    """Returns `store` wrapped in an InstrumentedStore, or unchanged unless ENABLED."""
+    return InstrumentedStore(store, backend) if ENABLED else store
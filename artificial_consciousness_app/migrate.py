@@ -0,0 +1,38 @@
+"""Copies legacy JSON journals into a storage backend.
+
+Both legacy schemas are accepted: introspection_logs.json (a list of
+{"question", "answer"} records per date) and the old app's
+introspection_data.json (a dict keyed by question text per date), as well
+as files in the current schema (see entries.py).
+When several files contain the same date, the one listed last wins.
+
+    python migrate.py introspection_logs.json ../artificial_consciousness_app_old/introspection_data.json
+"""
+import argparse
+
+import bulk
+import storage
+
+
+def migrate(sources, store):
+    """Imports every source file into `store` and returns the number of days copied."""
+    return sum(bulk.import_days(store, storage.iter_json_journal(path)) for path in sources)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("sources", nargs="+", help="legacy JSON files to import")
+    parser.add_argument("--backend", default="sqlite", choices=sorted(storage.BACKENDS))
+    parser.add_argument("--out", default="introspection_logs.db", help="path of the target store")
+    args = parser.parse_args(argv)
+
+    store = storage.open_store(args.backend, args.out)
+    try:
+        days = migrate(args.sources, store)
+    finally:
+        store.close()
+    print(f"Imported {days} days into {args.out} ({args.backend}).")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+"""Versioned prompt sets loaded from data files.
+
+A prompt set is a JSON file holding every version of a list of questions:
+
+    {"name": "Daily introspection",
+     "versions": [
+       {"version": 1, "questions": [{"id": "5c1e0f...", "text": "..."}, ...]},
+       {"version": 2, "questions": [...]}
+     ]}
+
+The highest version is the one the apps ask. A question keeps its ID for life:
+IDs were seeded with entries.question_id() of each question's original text,
+so answers saved before prompt sets existed join to them, and rewording a
+question in a new version keeps its ID, so nothing already saved is rescanned
+or rewritten. Each saved answer records the version it was given under, and
+`PromptSet.text(qid, version)` returns the wording that was asked then.
+
+Files are parsed once per process. To add a question, give it the ID printed by
+
+    python prompts.py --id "The new question?"
+"""
+import argparse
+import json
+
+import entries as entry_model
+from entries import Question
+
+_loaded = {}
+
+
+class PromptSet:
+    """Every version of one prompt set."""
+
+    def __init__(self, name, versions):
+        if not versions:
+            raise ValueError(f"Prompt set {name!r} has no versions")
+        self.name = name
+        self._questions = {}
+        self._wording = {}
+        for version, questions in sorted(versions.items()):
+            ids = [question.id for question in questions]
+            if len(set(ids)) != len(ids):
+                raise ValueError(f"Prompt set {name!r} version {version} repeats a question ID")
+            self._questions[version] = list(questions)
+            for question in questions:
+                self._wording[(version, question.id)] = question.text
+        self.version = max(self._questions)
+        # The newest wording of every question, including ones later versions dropped.
+        self._latest = {}
+        for version in sorted(self._questions):
+            self._latest.update((question.id, question.text) for question in self._questions[version])
+
+    def questions(self, version=None):
+        """Returns the Questions of `version` (default: the current version), in display order."""
+        return self._questions[self.version if version is None else version]
+
+    def all_questions(self):
+        """Returns every question any version asked, in its newest wording: the current ones first, then those dropped, newest first."""
+        seen, result = set(), []
+        for version in sorted(self._questions, reverse=True):
+            for question in self._questions[version]:
+                if question.id not in seen:
+                    seen.add(question.id)
+                    result.append(Question(question.id, self._latest[question.id]))
+        return result
+
+    def text(self, question_id, version=None, default=None):
+        """Returns a question's wording as asked in `version`, else its newest wording, else `default`."""
+        return self._wording.get((version, question_id)) or self._latest.get(question_id, default)
+
+    def records(self, answers):
+        """Returns the records to save for {question_id: answer}, tagged with the current version."""
+        return [
+            {"question": question.text, "answer": answers.get(question.id, ""), "id": question.id,
+             "prompt_version": self.version}
+            for question in self.questions()
+        ]
+
+    def worded(self, records):
+        """Returns saved records with each question shown in the wording it was answered under."""
+        return [
+            dict(item, question=self.text(item.get("id"), item.get("prompt_version"), item["question"]))
+            for item in records
+        ]
+
+
+def parse(data):
+    versions = {}
+    for version in data["versions"]:
+        number = int(version["version"])
+        if number in versions:
+            raise ValueError(f"Prompt set {data.get('name')!r} repeats version {number}")
+        versions[number] = [Question(item["id"], item["text"]) for item in version["questions"]]
+    return PromptSet(data.get("name", ""), versions)
+
+
+def load(path):
+    """Returns the PromptSet stored at `path`, parsing the file once per process."""
+    prompt_set = _loaded.get(path)
+    if prompt_set is None:
+        with open(path, "r", encoding="utf-8") as f:
+            prompt_set = _loaded[path] = parse(json.load(f))
+    return prompt_set
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("files", nargs="*", help="prompt set files to check and list")
+    parser.add_argument("--id", metavar="TEXT", help="print the ID for a new question")
+    args = parser.parse_args(argv)
+
+    if args.id:
+        print(entry_model.question_id(args.id))
+    for path in args.files:
+        prompt_set = load(path)
+        print(f"{path}: {prompt_set.name!r}, current version {prompt_set.version}")
+        for question in prompt_set.questions():
+            print(f"  {question.id}  {question.text}")
+
+
+if __name__ == "__main__":
+    main()
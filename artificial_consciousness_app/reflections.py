@@ -0,0 +1,344 @@
+"""Generated reflections on each saved day and weekly rollups of them.
+
+Saving a day only queues work: ReflectionEngine.enqueue() writes a "day" job
+for the date and a "week" job for its week into a persistent SQLite queue and
+returns. An asyncio worker pool on a daemon thread claims pending jobs in
+batches, builds each prompt from the store, and sends every batch to the
+model in one call. Jobs survive restarts: anything left running by a crash is
+queued again on start.
+
+Generations are cached by the SHA-256 of the model name and prompt, so a day
+or week whose answers did not change is never sent to the model again, even
+when it is re-queued (by a re-save or a backfill of the whole journal).
+
+The model is pluggable. With $AC_REFLECTION_URL set, prompts go to a local
+completion server speaking the OpenAI /v1/completions protocol (llama.cpp's
+server, vLLM, LM Studio, ...), which receives a whole batch per request;
+otherwise ExtractiveModel, a small CPU-only stand-in, picks the most
+representative sentences of the answers.
+"""
+import asyncio
+import collections
+import hashlib
+import json
+import logging
+import os
+import re
+import threading
+import time
+import urllib.request
+from datetime import date, timedelta
+
+import fileio
+from stats import is_empty_answer, week_of
+
+logger = logging.getLogger(__name__)
+
+SAVE, BACKLOG = 0, 1
+MAX_ATTEMPTS = 3
+POLL_SECONDS = 5.0
+
+
+def day_prompt(day, records):
+    """Returns the prompt reflecting on one day, or None if every answer is empty."""
+    answered = [item for item in records if not is_empty_answer(item["answer"])]
+    if not answered:
+        return None
+    lines = [f"Write a short reflection on this introspection journal entry from {day}.", ""]
+    for item in answered:
+        lines += [f"Q: {item['question']}", f"A: {item['answer']}", ""]
+    return "\n".join(lines).rstrip()
+
+
+def week_prompt(week, days):
+    """Returns the prompt summarizing the week starting `week` from {date: records}, or None if it is empty."""
+    lines = [f"Summarize the themes and progress in this week of introspection journal entries (week of {week}).", ""]
+    for day, records in sorted(days.items()):
+        answers = [item["answer"] for item in records if not is_empty_answer(item["answer"])]
+        if answers:
+            lines += [f"{day}:"] + [f"A: {answer}" for answer in answers] + [""]
+    return "\n".join(lines).rstrip() if len(lines) > 2 else None
+
+
+_SENTENCE = re.compile(r"(?<=[.!?])\s+|\n+")
+_WORD = re.compile(r"[a-z']{3,}")
+_STOPWORDS = frozenset(
+    "the and for that this with was are but not you have had did what which from they their about into more "
+    "than then them would could should there been being will just also very its it's i'm".split()
+)
+
+
+class ExtractiveModel:
+    """CPU-only stand-in for a language model: returns the most representative sentences of the answers."""
+
+    name = "extractive-1"
+
+    def __init__(self, sentences=3):
+        self.sentences = sentences
+
+    def _summarize(self, prompt):
+        answers = [line[3:] for line in prompt.splitlines() if line.startswith("A: ")]
+        sentences = [s.strip() for answer in answers for s in _SENTENCE.split(answer) if s.strip()]
+        words = [[w for w in _WORD.findall(s.lower()) if w not in _STOPWORDS] for s in sentences]
+        frequency = collections.Counter(w for sentence in words for w in sentence)
+        scores = [sum(frequency[w] for w in sentence) / (len(sentence) or 1) for sentence in words]
+        best = sorted(sorted(range(len(sentences)), key=lambda i: -scores[i])[:self.sentences])
+        return " ".join(sentences[i] if sentences[i][-1] in ".!?" else sentences[i] + "." for i in best)
+
+    async def generate(self, prompts):
+        return await asyncio.to_thread(lambda: [self._summarize(prompt) for prompt in prompts])
+
+
+class CompletionServerModel:
+    """A local server with an OpenAI-compatible /v1/completions endpoint; one request per batch."""
+
+    def __init__(self, url, model="local", max_tokens=256, timeout=300):
+        self.url = url
+        self.model = model
+        self.max_tokens = max_tokens
+        self.timeout = timeout
+        self.name = f"{url}#{model}"
+
+    def _post(self, prompts):
+        body = {"model": self.model, "prompt": prompts, "max_tokens": self.max_tokens, "temperature": 0.2}
+        request = urllib.request.Request(
+            self.url, data=json.dumps(body).encode("utf-8"), headers={"Content-Type": "application/json"}
+        )
+        with urllib.request.urlopen(request, timeout=self.timeout) as response:
+            choices = json.load(response)["choices"]
+        texts = [None] * len(prompts)
+        for position, choice in enumerate(choices):
+            texts[choice.get("index", position)] = choice["text"].strip()
+        if None in texts:
+            raise ValueError(f"{self.url} returned {len(choices)} completions for {len(prompts)} prompts")
+        return texts
+
+    async def generate(self, prompts):
+        return await asyncio.to_thread(self._post, prompts)
+
+
+def default_model():
+    """Returns the model configured by $AC_REFLECTION_URL (and $AC_REFLECTION_MODEL), else ExtractiveModel."""
+    url = os.environ.get("AC_REFLECTION_URL")
+    if url:
+        return CompletionServerModel(url, os.environ.get("AC_REFLECTION_MODEL", "local"))
+    return ExtractiveModel()
+
+
+class ReflectionEngine:
+    """Persistent queue of reflection jobs worked off by an asyncio worker pool.
+
+    `jobs` holds one row per (kind, key), where the key is a date or the
+    Monday starting a week; re-queueing a job that is being generated queues
+    it again once the running attempt ends. `generations` caches model output
+    by prompt hash and `reflections` points each day and week at its latest
+    generation.
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS jobs (
+            kind TEXT NOT NULL,
+            key TEXT NOT NULL,
+            status TEXT NOT NULL,
+            priority INTEGER NOT NULL,
+            attempts INTEGER NOT NULL DEFAULT 0,
+            error TEXT,
+            queued_at REAL NOT NULL,
+            PRIMARY KEY (kind, key)
+        );
+        CREATE INDEX IF NOT EXISTS jobs_pending ON jobs (status, priority, queued_at);
+        CREATE TABLE IF NOT EXISTS generations (
+            hash TEXT PRIMARY KEY,
+            text TEXT NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS reflections (
+            kind TEXT NOT NULL,
+            key TEXT NOT NULL,
+            hash TEXT NOT NULL REFERENCES generations(hash),
+            PRIMARY KEY (kind, key)
+        );
+    """
+
+    def __init__(self, path, store, model=None, concurrency=2, batch_size=8):
+        self.path = path
+        self.store = store
+        self.model = model or default_model()
+        self.concurrency = concurrency
+        self.batch_size = batch_size
+        self._conn, self._lock = fileio.open_db(path, self.SCHEMA)
+        self._thread = None
+        self._loop = None
+        self._wakeup = None
+        self._workers = []
+        self._stopping = False
+        self._ready = threading.Event()
+
+    def start(self):
+        """Starts the worker pool on a daemon thread; does nothing if it is already running."""
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            with self._conn:
+                # Jobs left running by a previous process never finished.
+                self._conn.execute("UPDATE jobs SET status = 'pending' WHERE status = 'running'")
+            self._ready.clear()
+            self._thread = threading.Thread(target=asyncio.run, args=(self._run(),), name="reflection-workers", daemon=True)
+            self._thread.start()
+        self._ready.wait()
+
+    def enqueue(self, day, priority=SAVE):
+        """Queues the reflection of `day` and the rollup of its week; returns without waiting for either."""
+        self._enqueue([("day", day, priority), ("week", week_of(day), priority)])
+
+    def backfill(self, days):
+        """Queues every given day and its week behind newly saved days; returns the number of jobs queued."""
+        jobs = {("day", day, BACKLOG) for day in days} | {("week", week_of(day), BACKLOG) for day in days}
+        self._enqueue(sorted(jobs))
+        return len(jobs)
+
+    def _enqueue(self, jobs):
+        now = time.time()
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT INTO jobs (kind, key, status, priority, queued_at) VALUES (?, ?, 'pending', ?, ?) "
+                "ON CONFLICT (kind, key) DO UPDATE SET status = 'pending', attempts = 0, error = NULL, "
+                "priority = MIN(priority, excluded.priority), queued_at = excluded.queued_at",
+                [(kind, key, priority, now) for kind, key, priority in jobs],
+            )
+        loop, wakeup = self._loop, self._wakeup
+        if loop is not None:
+            loop.call_soon_threadsafe(wakeup.set)
+
+    def reflection(self, kind, key):
+        """Returns the generated text for a date ("day") or week start ("week"), or None."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT g.text FROM reflections r JOIN generations g ON g.hash = r.hash WHERE r.kind = ? AND r.key = ?",
+                (kind, key),
+            ).fetchone()
+        return row[0] if row else None
+
+    def job_status(self, kind, key):
+        """Returns "pending", "running", "done", "failed" or None for one job."""
+        with self._lock:
+            row = self._conn.execute("SELECT status FROM jobs WHERE kind = ? AND key = ?", (kind, key)).fetchone()
+        return row[0] if row else None
+
+    def recent(self, kind, limit=10, start="", end="9999"):
+        """Returns (key, text) of the latest reflections of one kind with keys in [start, end], newest first."""
+        with self._lock:
+            return self._conn.execute(
+                "SELECT r.key, g.text FROM reflections r JOIN generations g ON g.hash = r.hash "
+                "WHERE r.kind = ? AND r.key BETWEEN ? AND ? ORDER BY r.key DESC LIMIT ?",
+                (kind, start, end, limit),
+            ).fetchall()
+
+    def status(self):
+        """Returns the number of jobs in each state and of the failed jobs' latest errors."""
+        with self._lock:
+            counts = dict(self._conn.execute("SELECT status, COUNT(*) FROM jobs GROUP BY status"))
+            errors = self._conn.execute(
+                "SELECT kind, key, error FROM jobs WHERE status = 'failed' ORDER BY queued_at DESC LIMIT 5"
+            ).fetchall()
+        return {state: counts.get(state, 0) for state in ("pending", "running", "done", "failed")} | {"errors": errors}
+
+    async def _run(self):
+        self._wakeup = asyncio.Event()
+        self._loop = asyncio.get_running_loop()
+        self._stopping = False
+        self._workers = [asyncio.create_task(self._worker()) for _ in range(self.concurrency)]
+        self._ready.set()
+        try:
+            await asyncio.gather(*self._workers)
+        except asyncio.CancelledError:
+            pass  # Stopped by close(); jobs it interrupted are still marked running and resume on the next start().
+
+    def _stop_workers(self):
+        # Before Python 3.12, wait_for can swallow a cancellation that races its timeout;
+        # the flag stops such a worker on its next turn.
+        self._stopping = True
+        self._wakeup.set()
+        for worker in self._workers:
+            worker.cancel()
+
+    async def _worker(self):
+        while not self._stopping:
+            self._wakeup.clear()
+            jobs = self._claim()
+            if not jobs:
+                try:
+                    # Woken by enqueue(); the timeout picks up jobs queued by other processes.
+                    await asyncio.wait_for(self._wakeup.wait(), POLL_SECONDS)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+            try:
+                await self._process(jobs)
+            except Exception as exc:  # Keep the worker alive; the jobs are retried.
+                logger.exception("Reflection batch failed")
+                self._fail(jobs, exc)
+                await asyncio.sleep(POLL_SECONDS)
+
+    def _claim(self):
+        """Marks up to batch_size pending jobs as running and returns (kind, key, queued_at) for each."""
+        with self._lock, self._conn:
+            jobs = self._conn.execute(
+                "SELECT kind, key, queued_at FROM jobs WHERE status = 'pending' ORDER BY priority, queued_at LIMIT ?",
+                (self.batch_size,),
+            ).fetchall()
+            self._conn.executemany(
+                "UPDATE jobs SET status = 'running', attempts = attempts + 1 WHERE kind = ? AND key = ?",
+                [(kind, key) for kind, key, _ in jobs],
+            )
+        return jobs
+
+    def _prompt(self, kind, key):
+        if kind == "day":
+            records = self.store.get_day(key)
+            return day_prompt(key, records) if records else None
+        end = (date.fromisoformat(key) + timedelta(days=6)).isoformat()
+        return week_prompt(key, self.store.get_days(self.store.dates_between(key, end)))
+
+    def _hash(self, prompt):
+        return hashlib.sha256(f"{self.model.name}\n{prompt}".encode("utf-8")).hexdigest()
+
+    async def _process(self, jobs):
+        prompts = await asyncio.to_thread(lambda: [self._prompt(kind, key) for kind, key, _ in jobs])
+        hashes = [prompt and self._hash(prompt) for prompt in prompts]
+        with self._lock:
+            cached = {
+                digest for (digest,) in self._conn.execute(
+                    f"SELECT hash FROM generations WHERE hash IN ({','.join('?' * len(hashes))})", hashes
+                )
+            }
+        missing = {digest: prompt for prompt, digest in zip(prompts, hashes) if digest and digest not in cached}
+        texts = await self.model.generate(list(missing.values())) if missing else []
+        with self._lock, self._conn:
+            self._conn.executemany("INSERT OR IGNORE INTO generations (hash, text) VALUES (?, ?)", zip(missing, texts))
+            for (kind, key, queued_at), digest in zip(jobs, hashes):
+                if digest:
+                    self._conn.execute("INSERT OR REPLACE INTO reflections (kind, key, hash) VALUES (?, ?, ?)", (kind, key, digest))
+                else:
+                    self._conn.execute("DELETE FROM reflections WHERE kind = ? AND key = ?", (kind, key))
+                # A job queued again while it ran stays pending.
+                self._conn.execute(
+                    "UPDATE jobs SET status = 'done', error = NULL WHERE kind = ? AND key = ? AND queued_at = ?",
+                    (kind, key, queued_at),
+                )
+
+    def _fail(self, jobs, exc):
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "UPDATE jobs SET status = CASE WHEN attempts < ? THEN 'pending' ELSE 'failed' END, error = ? "
+                "WHERE kind = ? AND key = ? AND queued_at = ?",
+                [(MAX_ATTEMPTS, str(exc), kind, key, queued_at) for kind, key, queued_at in jobs],
+            )
+
+    def close(self):
+        """Stops the worker pool, waiting for its thread to exit, then closes the database."""
+        thread = self._thread
+        if thread is not None and thread.is_alive():
+            self._loop.call_soon_threadsafe(self._stop_workers)
+            thread.join()
+        with self._lock:
+            self._conn.close()
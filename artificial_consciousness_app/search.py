@@ -0,0 +1,112 @@
+import html
+
+import fileio
+
+# snippet() wraps matches in these control characters, which answers do not
+# contain, so the rest of the text can be escaped before <mark> tags go in.
+MARK_START, MARK_END = "\x02", "\x03"
+
+
+def fts_query(text):
+    """Turns free text into an FTS5 query: every word must match, the last one as a prefix."""
+    words = [word.replace('"', '""') for word in text.split()]
+    if not words:
+        return None
+    terms = [f'"{word}"' for word in words]
+    terms[-1] += "*"
+    return " ".join(terms)
+
+
+def highlight(snippet):
+    """Returns a snippet() result as HTML: the text escaped, the matches wrapped in <mark> tags."""
+    return html.escape(snippet).replace(MARK_START, "<mark>").replace(MARK_END, "</mark>")
+
+
+class SearchIndex:
+    """SQLite FTS5 index over every saved question and answer.
+
+    The index lives in its own database so it works with any storage backend.
+    `index_day` replaces one day's rows and is called on every save, so the
+    index never needs a full rebuild after the first one. FTS5 cannot index
+    the UNINDEXED date column, so `day_rows` keeps the rowid range of each
+    day's rows and a day is replaced without scanning the others.
+    """
+
+    SCHEMA = """
+        CREATE VIRTUAL TABLE IF NOT EXISTS answers USING fts5(
+            date UNINDEXED,
+            question,
+            answer,
+            tokenize = 'porter unicode61'
+        );
+        CREATE TABLE IF NOT EXISTS day_rows (
+            date TEXT PRIMARY KEY,
+            first INTEGER NOT NULL,
+            last INTEGER NOT NULL
+        );
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._conn, self._lock = fileio.open_db(path, self.SCHEMA)
+        with self._lock, self._conn:
+            if self._conn.execute("SELECT 1 FROM day_rows LIMIT 1").fetchone() is None:
+                # Rows indexed before day_rows was kept cannot be replaced by date: empty it so it is rebuilt.
+                self._conn.execute("DELETE FROM answers")
+
+    def is_empty(self):
+        with self._lock:
+            return self._conn.execute("SELECT 1 FROM answers LIMIT 1").fetchone() is None
+
+    def index_day(self, day, entries):
+        self.index_days([(day, entries)])
+
+    def index_days(self, days):
+        """Replaces the indexed rows of several days in one transaction."""
+        with self._lock, self._conn:
+            row = self._conn.execute("SELECT rowid FROM answers ORDER BY rowid DESC LIMIT 1").fetchone()
+            next_rowid = row[0] + 1 if row else 1
+            for day, entries in days:
+                old = self._conn.execute("SELECT first, last FROM day_rows WHERE date = ?", (day,)).fetchone()
+                if old is not None:
+                    self._conn.execute("DELETE FROM answers WHERE rowid BETWEEN ? AND ?", old)
+                    self._conn.execute("DELETE FROM day_rows WHERE date = ?", (day,))
+                if not entries:
+                    continue
+                self._conn.executemany(
+                    "INSERT INTO answers (rowid, date, question, answer) VALUES (?, ?, ?, ?)",
+                    [(next_rowid + i, day, item["question"], item["answer"]) for i, item in enumerate(entries)],
+                )
+                self._conn.execute(
+                    "INSERT INTO day_rows (date, first, last) VALUES (?, ?, ?)",
+                    (day, next_rowid, next_rowid + len(entries) - 1),
+                )
+                next_rowid += len(entries)
+
+    def rebuild(self, store):
+        """Re-indexes every day in `store`."""
+        with self._lock, self._conn:
+            self._conn.executescript("DELETE FROM answers; DELETE FROM day_rows;")
+        self.index_days(store.load_all().items())
+
+    def search(self, text, start=None, end=None, limit=50):
+        """Returns the best matches as (date, question, snippet) tuples, best first.
+
+        Snippets are HTML: the text is escaped and matched words are wrapped
+        in <mark> tags. Answers are weighted above question text when ranking.
+        """
+        query = fts_query(text)
+        if query is None:
+            return []
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT date, question, snippet(answers, 2, ?, ?, '…', 16) FROM answers "
+                "WHERE answers MATCH ? AND date >= ? AND date <= ? "
+                "ORDER BY bm25(answers, 0.0, 0.5, 1.0) LIMIT ?",
+                (MARK_START, MARK_END, query, start or "", end or "\uffff", limit),
+            ).fetchall()
+        return [(day, question, highlight(snippet)) for day, question, snippet in rows]
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,258 @@
+import json
+from datetime import date, timedelta
+
+import entries as entry_model
+import fileio
+
+# Answers that count as "nothing to report" for the empty-answer rate.
+EMPTY_ANSWERS = {"", "nill", "nil", "none", "nothing", "n/a", "na", "-"}
+
+
+def is_empty_answer(answer):
+    return answer.strip().lower().rstrip(".") in EMPTY_ANSWERS
+
+
+def week_of(day):
+    """Returns the ISO date of the Monday starting the week of `day` (an ISO date string)."""
+    d = date.fromisoformat(day)
+    return (d - timedelta(days=d.weekday())).isoformat()
+
+
+def streaks(answered_dates):
+    """Returns (current, longest, last, start) for ascending ISO dates of answered days.
+
+    `current` is the length of the run ending at the `last` answered day and
+    `start` is its first day.
+    """
+    current = longest = 0
+    last = start = previous = None
+    for day in answered_dates:
+        d = date.fromisoformat(day)
+        if previous is not None and d - previous == timedelta(days=1):
+            current += 1
+        else:
+            current, start = 1, day
+        longest, previous, last = max(longest, current), d, day
+    return current, longest, last, start
+
+
+def contribution(records):
+    """Returns (answered, answers, empty, {question_id: answer length}) for one day's records."""
+    lengths = {}
+    empty = 0
+    for item in records:
+        if is_empty_answer(item["answer"]):
+            empty += 1
+        else:
+            lengths[item.get("id") or entry_model.question_id(item["question"])] = len(item["answer"].strip())
+    return (1 if lengths else 0), len(records), empty, lengths
+
+
+class JournalStats:
+    """Journal aggregates maintained incrementally on every save.
+
+    `days` keeps each date's own contribution so re-saving a date can subtract
+    it again; `weekly` and `prompt_weekly` hold the running per-week totals the
+    Stats page charts, and `summary` holds the streaks and totals, with the
+    first day of the current streak so extending it needs no walk back. A save
+    touches a handful of rows, and reading the charts never scans the journal.
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS days (
+            date TEXT PRIMARY KEY,
+            answered INTEGER NOT NULL,
+            answers INTEGER NOT NULL,
+            empty INTEGER NOT NULL,
+            lengths TEXT NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS days_answered ON days (answered, date);
+        CREATE TABLE IF NOT EXISTS weekly (
+            week TEXT PRIMARY KEY,
+            days_answered INTEGER NOT NULL,
+            answers INTEGER NOT NULL,
+            empty INTEGER NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS prompt_weekly (
+            question_id TEXT NOT NULL,
+            week TEXT NOT NULL,
+            total_length INTEGER NOT NULL,
+            answers INTEGER NOT NULL,
+            PRIMARY KEY (question_id, week)
+        );
+        CREATE TABLE IF NOT EXISTS summary (
+            id INTEGER PRIMARY KEY CHECK (id = 0),
+            current_streak INTEGER NOT NULL,
+            longest_streak INTEGER NOT NULL,
+            last_date TEXT,
+            days_answered INTEGER NOT NULL,
+            answers INTEGER NOT NULL,
+            empty INTEGER NOT NULL,
+            current_start TEXT
+        );
+        INSERT OR IGNORE INTO summary (id, current_streak, longest_streak, days_answered, answers, empty)
+            VALUES (0, 0, 0, 0, 0, 0);
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._conn, self._lock = fileio.open_db(path, self.SCHEMA)
+        with self._lock, self._conn:
+            columns = [row[1] for row in self._conn.execute("PRAGMA table_info(summary)")]
+            if "current_start" not in columns:
+                # Written before the current streak's start was kept: empty it so it is rebuilt.
+                self._conn.execute("ALTER TABLE summary ADD COLUMN current_start TEXT")
+                self._conn.execute("DELETE FROM days")
+
+    def is_empty(self):
+        with self._lock:
+            return self._conn.execute("SELECT 1 FROM days LIMIT 1").fetchone() is None
+
+    def rebuild(self, store):
+        """Recomputes every aggregate from `store` in one pass; only needed once for an existing journal."""
+        days, weekly, prompt_weekly = [], {}, {}
+        for day, records in sorted(store.load_all().items()):
+            answered, answers, empty, lengths = contribution(records)
+            days.append((day, answered, answers, empty, json.dumps(lengths)))
+            week = week_of(day)
+            totals = weekly.setdefault(week, [0, 0, 0])
+            totals[0] += answered
+            totals[1] += answers
+            totals[2] += empty
+            for qid, length in lengths.items():
+                totals = prompt_weekly.setdefault((qid, week), [0, 0])
+                totals[0] += length
+                totals[1] += 1
+        current, longest, last, start = streaks(day for day, answered, _, _, _ in days if answered)
+        with self._lock, self._conn:
+            self._conn.executescript("DELETE FROM days; DELETE FROM weekly; DELETE FROM prompt_weekly;")
+            self._conn.executemany("INSERT INTO days VALUES (?, ?, ?, ?, ?)", days)
+            self._conn.executemany("INSERT INTO weekly VALUES (?, ?, ?, ?)", [(week, *totals) for week, totals in weekly.items()])
+            self._conn.executemany(
+                "INSERT INTO prompt_weekly VALUES (?, ?, ?, ?)",
+                [(qid, week, *totals) for (qid, week), totals in prompt_weekly.items()],
+            )
+            self._conn.execute(
+                "UPDATE summary SET current_streak = ?, longest_streak = ?, last_date = ?, current_start = ?, "
+                "days_answered = ?, answers = ?, empty = ?",
+                (current, longest, last, start, sum(row[1] for row in days), sum(row[2] for row in days),
+                 sum(row[3] for row in days)),
+            )
+
+    def update_day(self, day, records):
+        """Replaces the contribution of one saved day with `records`."""
+        answered, _, empty, lengths = contribution(records)
+        week = week_of(day)
+
+        with self._lock, self._conn:
+            old = self._conn.execute("SELECT answered, answers, empty, lengths FROM days WHERE date = ?", (day,)).fetchone()
+            if old:
+                self._add(week, -1, old[0], old[1], old[2], json.loads(old[3]))
+            self._conn.execute(
+                "INSERT OR REPLACE INTO days VALUES (?, ?, ?, ?, ?)",
+                (day, answered, len(records), empty, json.dumps(lengths)),
+            )
+            self._add(week, 1, answered, len(records), empty, lengths)
+            self._update_streaks(day, answered, bool(old and old[0]))
+
+    def _add(self, week, sign, days_answered, answers, empty, lengths):
+        """Adds (sign=1) or removes (sign=-1) one day's contribution to the weekly totals."""
+        self._conn.execute(
+            "INSERT INTO weekly VALUES (?, ?, ?, ?) ON CONFLICT (week) DO UPDATE SET "
+            "days_answered = days_answered + excluded.days_answered, "
+            "answers = answers + excluded.answers, empty = empty + excluded.empty",
+            (week, sign * days_answered, sign * answers, sign * empty),
+        )
+        self._conn.execute(
+            "UPDATE summary SET days_answered = days_answered + ?, answers = answers + ?, empty = empty + ?",
+            (sign * days_answered, sign * answers, sign * empty),
+        )
+        for qid, length in lengths.items():
+            self._conn.execute(
+                "INSERT INTO prompt_weekly VALUES (?, ?, ?, ?) ON CONFLICT (question_id, week) DO UPDATE SET "
+                "total_length = total_length + excluded.total_length, answers = answers + excluded.answers",
+                (qid, week, sign * length, sign),
+            )
+
+    def _run_length(self, day, step):
+        """Counts consecutive answered days starting at `day` and moving `step` days at a time."""
+        order = "DESC" if step < 0 else "ASC"
+        op = "<=" if step < 0 else ">="
+        expected = date.fromisoformat(day)
+        count = 0
+        for (found,) in self._conn.execute(
+            f"SELECT date FROM days WHERE answered = 1 AND date {op} ? ORDER BY date {order}", (day,)
+        ):
+            if found != expected.isoformat():
+                break
+            count += 1
+            expected += timedelta(days=step)
+        return count
+
+    def _update_streaks(self, day, answered, was_answered):
+        if bool(answered) == was_answered:
+            return
+        current, longest, last, start = self._conn.execute(
+            "SELECT current_streak, longest_streak, last_date, current_start FROM summary"
+        ).fetchone()
+        if not answered:
+            # A day stopped counting; this rare case needs one pass over the answered dates.
+            current, longest, last, start = streaks(
+                found for (found,) in self._conn.execute("SELECT date FROM days WHERE answered = 1 ORDER BY date")
+            )
+        elif last is None or day > last:
+            # The usual save: today, which extends the current streak or starts a new one.
+            if last is not None and date.fromisoformat(day) - date.fromisoformat(last) == timedelta(days=1):
+                current += 1
+            else:
+                current, start = 1, day
+            last, longest = day, max(longest, current)
+        else:
+            # Filling in an earlier day may join two runs; the walks stop at the first gap, so cost O(run length).
+            before, after = self._run_length(day, -1), self._run_length(day, 1)
+            longest = max(longest, before + after - 1)
+            if date.fromisoformat(day) + timedelta(days=after - 1) == date.fromisoformat(last):
+                current, start = before + after - 1, (date.fromisoformat(day) - timedelta(days=before - 1)).isoformat()
+        self._conn.execute(
+            "UPDATE summary SET current_streak = ?, longest_streak = ?, last_date = ?, current_start = ?",
+            (current, longest, last, start),
+        )
+
+    def summary(self):
+        """Returns streaks and overall counts."""
+        with self._lock:
+            current, longest, last, days, answers, empty = self._conn.execute(
+                "SELECT current_streak, longest_streak, last_date, days_answered, answers, empty FROM summary"
+            ).fetchone()
+        # The current streak is only still running if the last answered day is today or yesterday.
+        if last is None or date.fromisoformat(last) < date.today() - timedelta(days=1):
+            current = 0
+        return {
+            "current_streak": current,
+            "longest_streak": longest,
+            "days_answered": days,
+            "answers": answers,
+            "empty_rate": empty / answers if answers else 0.0,
+        }
+
+    def weekly(self, weeks=26):
+        """Returns the latest `weeks` rows of (week, days_answered, answers, empty), oldest first."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT week, days_answered, answers, empty FROM weekly ORDER BY week DESC LIMIT ?", (weeks,)
+            ).fetchall()
+        return rows[::-1]
+
+    def prompt_trend(self, question_id, weeks=26):
+        """Returns (week, average answer length) for one question (by stable ID) over the latest `weeks` weeks."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT week, CAST(total_length AS REAL) / answers FROM prompt_weekly "
+                "WHERE question_id = ? AND answers > 0 ORDER BY week DESC LIMIT ?",
+                (question_id, weeks),
+            ).fetchall()
+        return rows[::-1]
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,716 @@
+import collections
+import hashlib
+import itertools
+import json
+import logging
+import os
+import threading
+import zlib
+
+import entries as entry_model
+import fileio
+
+logger = logging.getLogger(__name__)
+
+
+def normalize_day(value):
+    """Returns one day's answers as a list of {"question", "answer"} records.
+
+    The current app saves a list of records per date, which may also carry the
+    question's stable "id" and the "prompt_version" it was answered under,
+    while the old app saved a dict keyed by question text. Both shapes are
+    accepted.
+    """
+    if isinstance(value, dict):
+        return [{"question": question, "answer": answer} for question, answer in value.items()]
+    records = []
+    for item in value:
+        record = {"question": item["question"], "answer": item["answer"]}
+        for key in ("id", "prompt_version"):
+            if item.get(key) is not None:
+                record[key] = item[key]
+        records.append(record)
+    return records
+
+
+def _record(question, answer, qid, prompt_version):
+    return {"question": question, "answer": answer, "id": qid, "prompt_version": prompt_version}
+
+
+def file_version(path):
+    """Returns (mtime_ns, size) for `path`, which changes whenever the file is rewritten."""
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+def read_json_journal(path):
+    """Reads a whole-file JSON journal (either app's legacy shape or the current schema) as records."""
+    questions, days = entry_model.read_document(path)
+    return {day: entry_model.to_records(entries, questions) for day, entries in days.items()}
+
+
+def iter_json_journal(path):
+    """Yields (date, records) from a whole-file JSON journal without reading it all into memory."""
+    questions = entry_model.QuestionTable()
+    for day, entries in entry_model.iter_document(path, questions):
+        yield day, entry_model.to_records(entries, questions)
+
+
+class Store:
+    """Interface shared by the storage backends.
+
+    A store keeps one value per date: the list of question/answer records saved
+    for that day. Saving a date again replaces its previous value.
+    """
+
+    def dates(self):
+        """Returns all saved dates in ascending order."""
+        return sorted(self.load_all())
+
+    def get_day(self, day):
+        """Returns the records saved for `day`, or None."""
+        return self.load_all().get(day)
+
+    def dates_between(self, start=None, end=None, limit=None, offset=0, descending=False):
+        """Returns saved dates in [start, end] (inclusive, ISO strings), one page at a time."""
+        dates = [d for d in self.dates() if (start is None or d >= start) and (end is None or d <= end)]
+        if descending:
+            dates.reverse()
+        return dates[offset:] if limit is None else dates[offset:offset + limit]
+
+    def count_dates(self, start=None, end=None):
+        """Returns how many dates fall in [start, end]."""
+        return len(self.dates_between(start, end))
+
+    def date_bounds(self):
+        """Returns (first, last) saved date, or (None, None) for an empty store."""
+        dates = self.dates()
+        return (dates[0], dates[-1]) if dates else (None, None)
+
+    def get_days(self, days):
+        """Returns {date: records} for the given dates that exist."""
+        result = {}
+        for day in days:
+            entries = self.get_day(day)
+            if entries is not None:
+                result[day] = entries
+        return result
+
+    def question_history(self, question_id):
+        """Returns (date, answer) pairs for one question (by ID) across all days."""
+        history = []
+        for day, entries in sorted(self.load_all().items()):
+            for item in entries:
+                if (item.get("id") or entry_model.question_id(item["question"])) == question_id:
+                    history.append((day, item["answer"]))
+        return history
+
+    def version(self):
+        """Returns a value that changes whenever the stored data changes."""
+        return file_version(self.path)
+
+    def load_all(self):
+        raise NotImplementedError
+
+    def put_day(self, day, entries):
+        raise NotImplementedError
+
+    def import_json(self, path):
+        """Copies every day of a legacy JSON journal into this store."""
+        for day, entries in iter_json_journal(path):
+            self.put_day(day, entries)
+
+    def close(self):
+        pass
+
+
+class JsonFileStore(Store):
+    """The original format: the whole history in one pretty-printed JSON file.
+
+    Every save re-reads and rewrites the full file, so it is kept only for
+    compatibility; prefer the journal backend. Saves are atomic and keep the
+    previous file as `<path>.bak`, which is read instead if the file is ever
+    unreadable.
+    """
+
+    def __init__(self, path, legacy_path=None):
+        self.path = path
+        if legacy_path and legacy_path != path and not os.path.exists(path) and os.path.exists(legacy_path):
+            self.import_json(legacy_path)
+
+    def _read(self):
+        """Returns (logs, intact), falling back to the last good snapshot if the file is corrupt."""
+        try:
+            return read_json_journal(self.path), True
+        except FileNotFoundError:
+            return {}, True
+        except ValueError:
+            backup = fileio.backup_path(self.path)
+            if not os.path.exists(backup):
+                raise
+            logger.warning("%s is unreadable; using the last good snapshot %s", self.path, backup)
+            return read_json_journal(backup), False
+
+    def load_all(self):
+        return self._read()[0]
+
+    def get_days(self, days):
+        logs = self.load_all()
+        return {day: logs[day] for day in days if day in logs}
+
+    def put_day(self, day, entries):
+        self.put_days([(day, entries)])
+
+    def put_days(self, days):
+        """Saves several days with a single rewrite of the file."""
+        with fileio.file_lock(self.path):
+            logs, intact = self._read()
+            for day, entries in days:
+                logs[day] = normalize_day(entries)
+            # Never let a corrupt file replace the last good snapshot.
+            fileio.atomic_write(self.path, json.dumps(logs, indent=4), keep_backup=intact)
+
+    def import_json(self, path):
+        self.put_days(iter_json_journal(path))
+
+
+class JournalStore(Store):
+    """Append-only journal with one JSON line per saved day.
+
+    Saving appends a single line, so it costs O(size of that day's answers)
+    however long the history is. Re-saving a date appends a newer line that
+    supersedes the old one; once superseded lines make up more than
+    `compact_ratio` of the file it is compacted back to one line per date.
+
+    Lines follow entries.SCHEMA_VERSION: a question's text is written once in
+    a {"q": id, "t": text} line and day lines
+    {"d": date, "e": [[id, answer, prompt_version]]} refer to it by ID. Day lines written before the schema existed
+    ({"date": ..., "entries": [...]}) are still read.
+
+    Reads replay the file into an in-memory index and afterwards only read
+    lines appended since the last read. Appends are fsynced under an advisory
+    lock so concurrent sessions never interleave lines; readers take no file
+    lock, skip a torn line left by a crash, and wait for a line still being
+    written. Compaction atomically replaces the file and keeps the previous
+    journal as `<path>.bak`.
+    """
+
+    def __init__(self, path, legacy_path=None, compact_ratio=0.5, min_compact_lines=64):
+        self.path = path
+        self.compact_ratio = compact_ratio
+        self.min_compact_lines = min_compact_lines
+        self._lock = threading.RLock()
+        self._index = None
+        self._questions = None
+        self._offset = 0
+        self._lines = 0
+        self._identity = None
+        if legacy_path and not os.path.exists(path) and os.path.exists(legacy_path):
+            self.import_json(legacy_path)
+
+    def _reset_locked(self, identity):
+        self._index, self._offset, self._lines = {}, 0, 0
+        self._questions = entry_model.QuestionTable()
+        self._identity = identity
+
+    def _refresh_locked(self):
+        try:
+            f = open(self.path, "rb")
+        except FileNotFoundError:
+            if self._index is None or self._identity is not None:
+                self._reset_locked(None)
+            return self._index
+        with f:
+            # Compaction replaces the file (atomic_write), so a new inode means
+            # another process compacted it, even if it has since grown past our offset.
+            stat = os.fstat(f.fileno())
+            identity = (stat.st_dev, stat.st_ino)
+            if self._index is None or identity != self._identity or stat.st_size < self._offset:
+                self._reset_locked(identity)
+            if stat.st_size == self._offset:
+                return self._index
+            f.seek(self._offset)
+            for raw in f:
+                if not raw.endswith(b"\n"):
+                    break  # A writer is still appending this line.
+                self._offset += len(raw)
+                try:
+                    record = json.loads(raw)
+                except ValueError:
+                    logger.warning("Skipping a torn line at byte %d of %s", self._offset - len(raw), self.path)
+                    continue
+                self._read_line(record)
+        return self._index
+
+    def _read_line(self, record):
+        if "q" in record:
+            self._questions.add(record["q"], record["t"])
+        elif "d" in record:
+            self._index[record["d"]] = [entry_model.Entry(*item) for item in record["e"]]
+            self._lines += 1
+        elif "date" in record:
+            self._index[record["date"]] = entry_model.entries_from_value(record["entries"], self._questions)
+            self._lines += 1
+        elif record.get("schema", entry_model.SCHEMA_VERSION) not in entry_model.SUPPORTED_SCHEMAS:
+            raise ValueError(f"Unsupported journal schema: {record['schema']!r}")
+
+    def _records(self, entries):
+        return entry_model.to_records(entries, self._questions)
+
+    def load_all(self):
+        with self._lock:
+            return {day: self._records(entries) for day, entries in self._refresh_locked().items()}
+
+    def dates(self):
+        with self._lock:
+            return sorted(self._refresh_locked())
+
+    def get_day(self, day):
+        with self._lock:
+            entries = self._refresh_locked().get(day)
+            return None if entries is None else self._records(entries)
+
+    def question_history(self, question_id):
+        with self._lock:
+            index = self._refresh_locked()
+            return [
+                (day, entry.answer)
+                for day in sorted(index)
+                for entry in index[day]
+                if entry.question_id == question_id
+            ]
+
+    def put_day(self, day, entries):
+        self.put_days([(day, entries)])
+
+    def put_days(self, days):
+        """Appends several days at once."""
+        with self._lock, fileio.file_lock(self.path):
+            self._refresh_locked()
+            known = set(qid for qid, _ in self._questions.items())
+            lines = [] if self._offset else [{"schema": entry_model.SCHEMA_VERSION}]
+            for day, value in days:
+                day_entries = entry_model.entries_from_value(value, self._questions)
+                for entry in day_entries:
+                    if entry.question_id not in known:
+                        known.add(entry.question_id)
+                        lines.append({"q": entry.question_id, "t": self._questions.text(entry.question_id)})
+                lines.append({"d": day, "e": [[entry.question_id, entry.answer, entry.prompt_version] for entry in day_entries]})
+            fileio.append_lines(self.path, [json.dumps(line, ensure_ascii=False) + "\n" for line in lines])
+            self._refresh_locked()
+            if self._needs_compaction():
+                self._compact_locked()
+
+    def import_json(self, path):
+        self.put_days(iter_json_journal(path))
+
+    def _needs_compaction(self):
+        stale = self._lines - len(self._index)
+        return self._lines >= self.min_compact_lines and stale > self._lines * self.compact_ratio
+
+    def compact(self):
+        """Rewrites the journal with each question once and only the latest line for each date."""
+        with self._lock, fileio.file_lock(self.path):
+            self._compact_locked()
+
+    def _compact_locked(self):
+        index = self._refresh_locked()
+        document = entry_model.dump_document(index, self._questions)
+        lines = [json.dumps({"schema": document["schema"]}) + "\n"]
+        lines.extend(json.dumps({"q": qid, "t": text}, ensure_ascii=False) + "\n" for qid, text in document["questions"].items())
+        lines.extend(json.dumps({"d": day, "e": items}, ensure_ascii=False) + "\n" for day, items in document["days"].items())
+        fileio.atomic_write(self.path, "".join(lines), keep_backup=True)
+        self._index = None
+        self._refresh_locked()
+
+
+class SqliteStore(Store):
+    """SQLite store with one row per answer, indexed by date and question.
+
+    Question text is kept once in `questions` under its stable
+    entries.question_id; `entries` holds (date, question_id, answer,
+    prompt_version) rows.
+    Listing dates, reading one day and reading one question across all days
+    are each a single indexed query. The schema version is kept in
+    PRAGMA user_version.
+    """
+
+    SCHEMA_VERSION = entry_model.SCHEMA_VERSION
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS questions (
+            id TEXT PRIMARY KEY,
+            text TEXT NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS entries (
+            date TEXT NOT NULL,
+            position INTEGER NOT NULL,
+            question_id TEXT NOT NULL REFERENCES questions(id),
+            answer TEXT NOT NULL,
+            prompt_version INTEGER,
+            PRIMARY KEY (date, position)
+        );
+        CREATE INDEX IF NOT EXISTS entries_question ON entries (question_id, date);
+    """
+
+    def __init__(self, path, legacy_path=None):
+        self.path = path
+        # Writes go through one connection under a lock; each thread reads through its own
+        # read-only connection, which WAL lets see the last commit without waiting for a writer.
+        self._conn, self._lock = fileio.open_db(path)
+        self._writes = 0
+        with self._lock:
+            self._upgrade_schema()
+        self._readers = fileio.ReadConnections(path)
+        if legacy_path and os.path.exists(legacy_path) and not self.dates():
+            self.import_json(legacy_path)
+
+    def _upgrade_schema(self):
+        version = self._conn.execute("PRAGMA user_version").fetchone()[0]
+        if version > self.SCHEMA_VERSION:
+            raise ValueError(f"{self.path} uses a newer schema ({version}) than this app supports")
+        if version == 2:
+            # Version 2 had no prompt versions; adding a nullable column rewrites no rows.
+            with self._conn:
+                self._conn.execute("ALTER TABLE entries ADD COLUMN prompt_version INTEGER")
+                self._conn.execute(f"PRAGMA user_version = {self.SCHEMA_VERSION}")
+        elif version < self.SCHEMA_VERSION and self._conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE name = 'entries'"
+        ).fetchone():
+            self._migrate_v0()
+        with self._conn:
+            self._conn.executescript(self.SCHEMA)
+            self._conn.execute(f"PRAGMA user_version = {self.SCHEMA_VERSION}")
+
+    def _migrate_v0(self):
+        """Re-keys a version 0 store, which numbered questions with integer row IDs, in one transaction.
+
+        The old tables are dropped only in the transaction that fills the new
+        ones, so a crash or error part-way leaves the version 0 store as it was.
+        """
+        self._conn.create_function("question_id", 1, entry_model.question_id, deterministic=True)
+        try:
+            self._conn.executescript(f"""
+                BEGIN;
+                ALTER TABLE entries RENAME TO entries_v0;
+                ALTER TABLE questions RENAME TO questions_v0;
+                DROP INDEX IF EXISTS entries_question;
+                {self.SCHEMA}
+                INSERT OR IGNORE INTO questions (id, text) SELECT question_id(text), text FROM questions_v0;
+                INSERT INTO entries (date, position, question_id, answer)
+                    SELECT e.date, e.position, question_id(q.text), e.answer
+                    FROM entries_v0 e JOIN questions_v0 q ON q.id = e.question_id;
+                DROP TABLE entries_v0;
+                DROP TABLE questions_v0;
+                PRAGMA user_version = {self.SCHEMA_VERSION};
+                COMMIT;
+            """)
+        except BaseException:
+            self._conn.rollback()
+            raise
+
+    def version(self):
+        # data_version only moves for commits made through other connections.
+        with self._lock:
+            return (self._writes, self._conn.execute("PRAGMA data_version").fetchone()[0])
+
+    def dates(self):
+        rows = self._readers.get().execute("SELECT DISTINCT date FROM entries ORDER BY date").fetchall()
+        return [row[0] for row in rows]
+
+    def get_day(self, day):
+        rows = self._readers.get().execute(
+            "SELECT q.text, e.answer, e.question_id, e.prompt_version FROM entries e "
+            "JOIN questions q ON q.id = e.question_id WHERE e.date = ? ORDER BY e.position",
+            (day,),
+        ).fetchall()
+        if not rows:
+            return None
+        return [_record(*row) for row in rows]
+
+    def dates_between(self, start=None, end=None, limit=None, offset=0, descending=False):
+        query = "SELECT DISTINCT date FROM entries WHERE date >= ? AND date <= ?"
+        query += " ORDER BY date DESC" if descending else " ORDER BY date"
+        query += " LIMIT ? OFFSET ?"
+        params = (start or "", end or "\uffff", -1 if limit is None else limit, offset)
+        rows = self._readers.get().execute(query, params).fetchall()
+        return [row[0] for row in rows]
+
+    def count_dates(self, start=None, end=None):
+        return self._readers.get().execute(
+            "SELECT COUNT(DISTINCT date) FROM entries WHERE date >= ? AND date <= ?",
+            (start or "", end or "\uffff"),
+        ).fetchone()[0]
+
+    def date_bounds(self):
+        return self._readers.get().execute("SELECT MIN(date), MAX(date) FROM entries").fetchone()
+
+    def get_days(self, days):
+        days = list(days)
+        if not days:
+            return {}
+        rows = self._readers.get().execute(
+            "SELECT e.date, q.text, e.answer, e.question_id, e.prompt_version FROM entries e "
+            "JOIN questions q ON q.id = e.question_id "
+            f"WHERE e.date IN ({','.join('?' * len(days))}) ORDER BY e.date, e.position",
+            days,
+        ).fetchall()
+        result = {}
+        for day, *row in rows:
+            result.setdefault(day, []).append(_record(*row))
+        return result
+
+    def question_history(self, question_id):
+        return self._readers.get().execute(
+            "SELECT date, answer FROM entries WHERE question_id = ? ORDER BY date",
+            (question_id,),
+        ).fetchall()
+
+    def load_all(self):
+        rows = self._readers.get().execute(
+            "SELECT e.date, q.text, e.answer, e.question_id, e.prompt_version FROM entries e "
+            "JOIN questions q ON q.id = e.question_id ORDER BY e.date, e.position"
+        ).fetchall()
+        logs = {}
+        for day, *row in rows:
+            logs.setdefault(day, []).append(_record(*row))
+        return logs
+
+    def put_day(self, day, entries):
+        self.put_days([(day, entries)])
+
+    def put_days(self, days):
+        """Replaces several days in a single transaction."""
+        with self._lock, self._conn:
+            for day, entries in days:
+                self._conn.execute("DELETE FROM entries WHERE date = ?", (day,))
+                for position, item in enumerate(normalize_day(entries)):
+                    qid = item.get("id") or entry_model.question_id(item["question"])
+                    self._conn.execute("INSERT OR IGNORE INTO questions (id, text) VALUES (?, ?)", (qid, item["question"]))
+                    self._conn.execute(
+                        "INSERT INTO entries (date, position, question_id, answer, prompt_version) VALUES (?, ?, ?, ?, ?)",
+                        (day, position, qid, item["answer"], item.get("prompt_version")),
+                    )
+            self._writes += 1
+
+    def import_json(self, path):
+        # Streamed into one transaction, so a long history is never held in memory whole.
+        self.put_days(iter_json_journal(path))
+
+    def close(self):
+        self._readers.close()
+        with self._lock:
+            self._conn.close()
+
+
+class VaultStore(Store):
+    """Compressed, optionally encrypted journal chunked by month.
+
+    `path` is a directory holding one chunk per month (`2025-01.chunk`), an
+    index of the saved dates (`index.chunk`) and a plaintext `vault.json`
+    describing the format. A chunk is that month's days in the whole-file
+    schema (see entries.py), zlib-compressed. Reading a date decodes only its
+    month's chunk, and the last CHUNK_CACHE decoded chunks are kept; listing
+    and counting dates reads only the index. A save rewrites the chunks of the
+    months it touches and then the index, each atomically, under an advisory
+    lock.
+
+    When the vault is created with a passphrase (the `passphrase` option,
+    else $AC_VAULT_PASSPHRASE), every chunk and the index are also encrypted
+    with AES-256-GCM under a key derived from it with scrypt; the salt and
+    scrypt parameters are kept in `vault.json`. Each chunk is authenticated
+    together with its name, so chunks cannot be swapped between months. The
+    passphrase is then needed to open the vault, and encryption requires the
+    optional `cryptography` package. The app keeps an encrypted vault's
+    history inside it, encrypted with the same key (see workspace.py), and
+    builds no index that would hold its answers in plaintext.
+    """
+
+    FORMAT = 1
+    CHUNK_CACHE = 12
+    PASSPHRASE_ENV = "AC_VAULT_PASSPHRASE"
+    SCRYPT = {"n": 2 ** 15, "r": 8, "p": 1}
+    BATCH_DAYS = 500
+
+    def __init__(self, path, legacy_path=None, passphrase=None):
+        self.path = path
+        self._index_path = os.path.join(path, "index.chunk")
+        self._lock = threading.RLock()
+        self._index = None
+        self._index_version = None
+        self._chunks = collections.OrderedDict()
+        passphrase = passphrase if passphrase is not None else os.environ.get(self.PASSPHRASE_ENV) or None
+        manifest_path = os.path.join(path, "vault.json")
+        created = not os.path.exists(manifest_path)
+        if created:
+            os.makedirs(path, exist_ok=True)
+            manifest = {"format": self.FORMAT, "compression": "zlib", "cipher": None}
+            if passphrase:
+                manifest["cipher"] = "aes-256-gcm"
+                manifest["kdf"] = dict(name="scrypt", salt=os.urandom(16).hex(), **self.SCRYPT)
+            fileio.atomic_write(manifest_path, json.dumps(manifest, indent=2))
+        else:
+            with open(manifest_path, "r", encoding="utf-8") as f:
+                manifest = json.load(f)
+            if manifest.get("format") != self.FORMAT:
+                raise ValueError(f"Unsupported vault format in {path}: {manifest.get('format')!r}")
+        self._cipher = None
+        if manifest["cipher"]:
+            if not passphrase:
+                raise ValueError(f"{path} is encrypted; set {self.PASSPHRASE_ENV} to open it")
+            self._cipher = _vault_cipher(passphrase, manifest["kdf"])
+        elif passphrase and not created:
+            logger.warning("%s was created without encryption; the passphrase is ignored", path)
+        with self._lock:
+            if created:
+                with fileio.file_lock(self._index_path):
+                    self._write_index_locked({})
+            self._refresh_locked()  # Fails early on a wrong passphrase.
+        if legacy_path and created and os.path.exists(legacy_path):
+            self.import_json(legacy_path)
+
+    @property
+    def encrypted(self):
+        return self._cipher is not None
+
+    def encrypt(self, data, name):
+        """Encrypts `data` with the vault's key, authenticated together with `name`."""
+        nonce = os.urandom(12)
+        return nonce + self._cipher.encrypt(nonce, data, name.encode("ascii"))
+
+    def decrypt(self, data, name):
+        """Reverses encrypt(); raises ValueError if `data` was not encrypted under this key and `name`."""
+        from cryptography.exceptions import InvalidTag
+
+        try:
+            return self._cipher.decrypt(data[:12], data[12:], name.encode("ascii"))
+        except InvalidTag:
+            raise ValueError(f"Cannot decrypt {name} in {self.path}: wrong passphrase or damaged data") from None
+
+    def _seal(self, data, name):
+        data = zlib.compress(data, 9)
+        return data if self._cipher is None else self.encrypt(data, name)
+
+    def _unseal(self, data, name):
+        return zlib.decompress(data if self._cipher is None else self.decrypt(data, name))
+
+    def _chunk_path(self, month):
+        return os.path.join(self.path, f"{month}.chunk")
+
+    def _refresh_locked(self):
+        """Returns {month: [date]}, re-reading the index (and dropping cached chunks) if another writer changed it."""
+        version = file_version(self._index_path)
+        if version != self._index_version:
+            with open(self._index_path, "rb") as f:
+                self._index = json.loads(self._unseal(f.read(), "index"))
+            self._index_version = version
+            self._chunks.clear()
+        return self._index
+
+    def _chunk_locked(self, month):
+        """Returns (QuestionTable, {date: [Entry]}) of one month, decoding its chunk at most once while cached."""
+        chunk = self._chunks.get(month)
+        if chunk is None:
+            try:
+                with open(self._chunk_path(month), "rb") as f:
+                    chunk = entry_model.parse_document(json.loads(self._unseal(f.read(), month)))
+            except FileNotFoundError:
+                chunk = (entry_model.QuestionTable(), {})
+            self._chunks[month] = chunk
+            while len(self._chunks) > self.CHUNK_CACHE:
+                self._chunks.popitem(last=False)
+        else:
+            self._chunks.move_to_end(month)
+        return chunk
+
+    def _write_index_locked(self, index):
+        fileio.atomic_write(self._index_path, self._seal(json.dumps(index).encode("utf-8"), "index"))
+
+    def dates(self):
+        with self._lock:
+            return sorted(day for days in self._refresh_locked().values() for day in days)
+
+    def date_bounds(self):
+        with self._lock:
+            index = self._refresh_locked()
+            months = sorted(month for month, days in index.items() if days)
+            return (min(index[months[0]]), max(index[months[-1]])) if months else (None, None)
+
+    def get_day(self, day):
+        return self.get_days([day]).get(day)
+
+    def get_days(self, days):
+        result = {}
+        with self._lock:
+            index = self._refresh_locked()
+            for day in days:
+                if day in index.get(day[:7], ()):
+                    questions, entries = self._chunk_locked(day[:7])
+                    result[day] = entry_model.to_records(entries[day], questions)
+        return result
+
+    def load_all(self):
+        with self._lock:
+            return self.get_days(self.dates())
+
+    def version(self):
+        return file_version(self._index_path)
+
+    def put_day(self, day, entries):
+        self.put_days([(day, entries)])
+
+    def put_days(self, days):
+        """Saves several days, rewriting each month they fall in once."""
+        by_month = {}
+        for day, value in days:
+            by_month.setdefault(day[:7], []).append((day, value))
+        with self._lock, fileio.file_lock(self._index_path):
+            index = dict(self._refresh_locked())
+            for month, month_days in sorted(by_month.items()):
+                questions, entries = self._chunk_locked(month)
+                entries = dict(entries)
+                for day, value in month_days:
+                    entries[day] = entry_model.entries_from_value(value, questions)
+                document = entry_model.dump_document(entries, questions)
+                fileio.atomic_write(self._chunk_path(month), self._seal(json.dumps(document, ensure_ascii=False).encode("utf-8"), month))
+                self._chunks[month] = (questions, entries)
+                index[month] = sorted(entries)
+            self._write_index_locked(index)
+            self._index, self._index_version = index, file_version(self._index_path)
+
+    def import_json(self, path):
+        days = iter_json_journal(path)
+        while batch := list(itertools.islice(days, self.BATCH_DAYS)):
+            self.put_days(batch)
+
+
+def _vault_cipher(passphrase, kdf):
+    """Returns the AES-GCM cipher keyed by scrypt(passphrase) with the vault's salt and parameters."""
+    try:
+        from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+    except ImportError:
+        raise RuntimeError("Encrypted vaults need the optional 'cryptography' package (pip install cryptography)") from None
+    key = hashlib.scrypt(
+        passphrase.encode("utf-8"), salt=bytes.fromhex(kdf["salt"]), n=kdf["n"], r=kdf["r"], p=kdf["p"],
+        maxmem=256 * kdf["n"] * kdf["r"], dklen=32,
+    )
+    return AESGCM(key)
+
+
+BACKENDS = {
+    "json": JsonFileStore,
+    "journal": JournalStore,
+    "sqlite": SqliteStore,
+    "vault": VaultStore,
+}
+
+
+def open_store(backend, path, **options):
+    """Opens the storage backend registered under `backend`."""
+    try:
+        store_class = BACKENDS[backend]
+    except KeyError:
+        raise ValueError(f"Unknown storage backend: {backend!r}") from None
+    return store_class(path, **options)
@@ -0,0 +1,360 @@
+"""Offline sync of one journal between several devices through a shared directory.
+
+Each device publishes its journal under <directory>/<device>/ as a Merkle
+summary of per-day hashes:
+
+    summary.json          {"device", "root", "years": {year: hash}, "months": {month: hash}}
+    months/2025-01.json   {date: day hash} for one month
+    days/2025-01-03.json  {"records": the day, "ancestors": hashes of the versions it came from}
+
+A day's hash is the SHA-256 of its canonical encoding (history.encode_day); a
+month hashes its days, a year its months and the root its years. Syncing
+compares the roots, then descends only into the years and months whose hashes
+differ, so it reads O(changed days) files however long the journal is, and
+publishing rewrites only the days and months that changed since the last
+publish. The local day hashes come from the history, which records the hash
+of every version saved through a Workspace, so only days it has never seen
+(written straight to a store) are read and hashed. The directory can be any folder both machines see: a USB stick, a
+network share or a file-sync service.
+
+Days that differ are merged per question, three-way, against a version both
+devices had: the peer's copy of the day as last merged here (kept in the
+device's introspection_sync.db) or, on a first sync, the newest version in
+this device's history (history.py) that is among the peer's ancestors. An
+answer changed on one side only takes that side; one changed on both is
+resolved the same way on every device: a real answer beats an empty one, an
+answer that contains the other wins, and otherwise both are kept, separated by
+CONFLICT_MARKER. Merged days are saved together through Workspace.import_days,
+so history and indexes follow.
+
+    python sync.py /media/usb/journal-sync --device laptop
+"""
+import argparse
+import hashlib
+import itertools
+import json
+import os
+import re
+import socket
+import zlib
+
+import entries as entry_model
+import fileio
+import users
+from history import encode_day
+from stats import is_empty_answer
+from storage import normalize_day
+from workspace import IMPORT_BATCH_DAYS, Workspace
+
+SYNC_FILE = 'introspection_sync.db'
+CONFLICT_MARKER = "--- merged from another device ---"
+ANCESTRY = 16  # Versions of a day listed as its ancestors when it is published.
+_DEVICE = re.compile(r"[A-Za-z0-9._-]+")
+
+
+def day_hash(records):
+    return hashlib.sha256(encode_day(records)).hexdigest()
+
+
+def _digest(lines):
+    return hashlib.sha256("\n".join(lines).encode("utf-8")).hexdigest()
+
+
+def merkle_summary(day_hashes):
+    """Returns {"root", "years", "months"} hashes summarizing {date: day hash}."""
+    months = {}
+    for day, digest in sorted(day_hashes.items()):
+        months.setdefault(day[:7], []).append(f"{day} {digest}")
+    month_hashes = {month: _digest(lines) for month, lines in months.items()}
+    years = {}
+    for month, digest in sorted(month_hashes.items()):
+        years.setdefault(month[:4], []).append(f"{month} {digest}")
+    year_hashes = {year: _digest(lines) for year, lines in years.items()}
+    return {
+        "root": _digest(f"{year} {digest}" for year, digest in sorted(year_hashes.items())),
+        "years": year_hashes,
+        "months": month_hashes,
+    }
+
+
+def changed_months(local, remote):
+    """Returns the months whose hashes differ between two summaries, descending only into differing years."""
+    if local["root"] == remote["root"]:
+        return []
+    years = {year for year in local["years"].keys() | remote["years"].keys()
+             if local["years"].get(year) != remote["years"].get(year)}
+    return sorted(month for month in local["months"].keys() | remote["months"].keys()
+                  if month[:4] in years and local["months"].get(month) != remote["months"].get(month))
+
+
+def _key(item):
+    return item.get("id") or entry_model.question_id(item["question"])
+
+
+def resolve_conflict(first, second):
+    """Returns the answer kept when two devices changed the same answer.
+
+    Answers already kept side by side are split back into their parts, so
+    resolving is order-independent and resolving a result again changes nothing.
+    """
+    parts = {part.strip() for answer in (first, second) for part in answer.split(CONFLICT_MARKER)}
+    parts = {part for part in parts if not is_empty_answer(part)}
+    kept = sorted(part for part in parts if not any(part != other and part in other for other in parts))
+    return f"\n\n{CONFLICT_MARKER}\n\n".join(kept) if kept else max(first, second)
+
+
+def merge_day(local, remote, base=None):
+    """Merges two versions of a day per question against `base`, the version both started from (if known).
+
+    The result is the same whichever device runs the merge: questions keep the
+    order of the version with the greater hash, followed by any the other adds.
+    """
+    local, remote = normalize_day(local or []), normalize_day(remote or [])
+    base_answers = {_key(item): item["answer"] for item in normalize_day(base or [])}
+    first, second = sorted((local, remote), key=day_hash, reverse=True)
+    first_items, second_items = {_key(item): item for item in first}, {_key(item): item for item in second}
+    merged = []
+    for key in list(first_items) + [key for key in second_items if key not in first_items]:
+        a, b = first_items.get(key), second_items.get(key)
+        if a is None or b is None or a["answer"] == b["answer"]:
+            merged.append(a or b)
+        elif key in base_answers and a["answer"] == base_answers[key]:
+            merged.append(b)
+        elif key in base_answers and b["answer"] == base_answers[key]:
+            merged.append(a)
+        else:
+            merged.append(dict(a, answer=resolve_conflict(a["answer"], b["answer"])))
+    return merged
+
+
+class DirectoryTransport:
+    """Publishes this device's summary, months and days under <root>/<device>/ and reads the other devices'."""
+
+    def __init__(self, root, device):
+        if not _DEVICE.fullmatch(device):
+            raise ValueError(f"Device names may only use letters, digits, '.', '_' and '-': {device!r}")
+        self.root = root
+        self.device = device
+
+    def _path(self, device, *parts):
+        return os.path.join(self.root, device, *parts)
+
+    def _read(self, path):
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+
+    def peers(self):
+        """Returns the other devices that have published a summary."""
+        if not os.path.isdir(self.root):
+            return []
+        return sorted(
+            name for name in os.listdir(self.root)
+            if name != self.device and _DEVICE.fullmatch(name) and os.path.exists(self._path(name, "summary.json"))
+        )
+
+    def summary(self, device):
+        return self._read(self._path(device, "summary.json"))
+
+    def month(self, device, month):
+        return self._read(self._path(device, "months", f"{month}.json")) or {}
+
+    def day(self, device, day):
+        return self._read(self._path(device, "days", f"{day}.json"))
+
+    def publish(self, summary, months, days, removed):
+        """Writes changed days ({date: {"records", "ancestors"}}) and months ({month: {date: hash}}), deletes removed days, then the summary.
+
+        The summary goes last, so a reader never sees it point at files not yet written.
+        """
+        for directory in ("months", "days"):
+            os.makedirs(self._path(self.device, directory), exist_ok=True)
+        for day, document in days.items():
+            fileio.atomic_write(self._path(self.device, "days", f"{day}.json"), json.dumps(document, ensure_ascii=False))
+        for day in removed:
+            try:
+                os.remove(self._path(self.device, "days", f"{day}.json"))
+            except FileNotFoundError:
+                pass
+        for month, hashes in months.items():
+            fileio.atomic_write(self._path(self.device, "months", f"{month}.json"), json.dumps(hashes, sort_keys=True))
+        fileio.atomic_write(self._path(self.device, "summary.json"), json.dumps(dict(summary, device=self.device), indent=2))
+
+
+class SyncState:
+    """A device's memory of past syncs: the day hashes it last published and each peer's last merged days."""
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS published (
+            date TEXT PRIMARY KEY,
+            hash TEXT NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS bases (
+            peer TEXT NOT NULL,
+            date TEXT NOT NULL,
+            hash TEXT NOT NULL,
+            data BLOB NOT NULL,
+            PRIMARY KEY (peer, date)
+        );
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._conn, self._lock = fileio.open_db(path, self.SCHEMA)
+
+    def published(self):
+        with self._lock:
+            return dict(self._conn.execute("SELECT date, hash FROM published"))
+
+    def set_published(self, changed, removed):
+        with self._lock, self._conn:
+            self._conn.executemany("INSERT OR REPLACE INTO published (date, hash) VALUES (?, ?)", changed.items())
+            self._conn.executemany("DELETE FROM published WHERE date = ?", [(day,) for day in removed])
+
+    def base(self, peer, day):
+        """Returns (hash, records) of the peer's version of `day` as last merged, or (None, None)."""
+        with self._lock:
+            row = self._conn.execute("SELECT hash, data FROM bases WHERE peer = ? AND date = ?", (peer, day)).fetchone()
+        return (row[0], json.loads(zlib.decompress(row[1]))) if row else (None, None)
+
+    def base_hashes(self, day):
+        """Returns the hashes of every peer's version of `day` merged here."""
+        with self._lock:
+            return [row[0] for row in self._conn.execute("SELECT hash FROM bases WHERE date = ? ORDER BY peer", (day,))]
+
+    def set_base(self, peer, day, records):
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO bases (peer, date, hash, data) VALUES (?, ?, ?, ?)",
+                (peer, day, day_hash(records), zlib.compress(encode_day(records))),
+            )
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+def local_hashes(workspace):
+    """Returns {date: day hash} of every day in the workspace's store.
+
+    The hashes are those of each day's newest version in the history. Days
+    with no history yet are read a batch at a time, hashed and recorded in it.
+    """
+    latest = workspace.history.latest_hashes()
+    dates = workspace.store.dates()
+    unseen = iter([day for day in dates if day not in latest])
+    while batch := list(itertools.islice(unseen, IMPORT_BATCH_DAYS)):
+        for day, records in workspace.store.get_days(batch).items():
+            workspace.history.record(day, records)
+            latest[day] = day_hash(records)
+    return {day: latest[day] for day in dates}
+
+
+def ancestors(history, state, day, digest):
+    """Returns the hashes published as the ancestors of `day` (whose hash is `digest`).
+
+    They are the day itself, its last saved versions and the peers' versions
+    merged into it.
+    """
+    return [digest] + history.hashes(day, ANCESTRY) + state.base_hashes(day)
+
+
+def common_ancestor(history, day, local_hash, local, remote_hash, ancestors):
+    """Returns the newest version of `day` in `history` (or `local` itself) that the peer's version descends from."""
+    ancestors = set(ancestors) | {remote_hash}
+    for digest in [local_hash] + history.hashes(day, ANCESTRY):
+        if digest in ancestors:
+            return local if digest == local_hash else history.find(digest)
+    return None
+
+
+def sync(workspace, transport, state):
+    """Merges every peer's changed days into `workspace`, then publishes this device's changes.
+
+    Returns {"pulled": [date], "published": int, "read": int}: the days
+    changed here, the days written for peers and the peer files read.
+
+    Raises ValueError for an encrypted workspace: the shared directory holds
+    every day in plaintext.
+    """
+    if workspace.encrypted:
+        raise ValueError("An encrypted journal cannot be synced: the shared directory would hold its days in plaintext")
+    store = workspace.store
+    hashes = local_hashes(workspace)
+    merged_days, read = {}, 0
+    for peer in transport.peers():
+        remote = transport.summary(peer)
+        read += 1
+        for month in changed_months(merkle_summary(hashes), remote):
+            remote_days = transport.month(peer, month)
+            read += 1
+            for day, remote_hash in sorted(remote_days.items()):
+                base_hash, base = state.base(peer, day)
+                # Skip days equal here, and days the peer has not changed since they were last merged.
+                if remote_hash in (hashes.get(day), base_hash):
+                    continue
+                document = transport.day(peer, day)
+                read += 1
+                if document is None or day_hash(document["records"]) != remote_hash:
+                    continue  # The peer is publishing this day right now; it is picked up next time.
+                records = document["records"]
+                local = merged_days[day] if day in merged_days else store.get_day(day)
+                if local is not None and remote_hash in workspace.history.hashes(day, ANCESTRY):
+                    # The peer is behind: its version is one this device saved before the current one.
+                    state.set_base(peer, day, records)
+                    continue
+                if base is None and local is not None:
+                    base = common_ancestor(
+                        workspace.history, day, hashes.get(day), local, remote_hash, document["ancestors"]
+                    )
+                merged = merge_day(local, records, base)
+                state.set_base(peer, day, records)
+                if day_hash(merged) != hashes.get(day):
+                    merged_days[day] = merged
+                    hashes[day] = day_hash(merged)
+
+    if merged_days:
+        workspace.import_days(sorted(merged_days.items()))
+        # Published days are hashed as the store holds them.
+        hashes.update((day, day_hash(records)) for day, records in store.get_days(sorted(merged_days)).items())
+
+    published = state.published()
+    changed = {day: digest for day, digest in hashes.items() if published.get(day) != digest}
+    removed = [day for day in published if day not in hashes]
+    if changed or removed or transport.summary(transport.device) is None:
+        months = {day[:7] for day in list(changed) + removed}
+        transport.publish(
+            merkle_summary(hashes),
+            {month: {day: digest for day, digest in hashes.items() if day[:7] == month} for month in months},
+            {day: {"records": records, "ancestors": ancestors(workspace.history, state, day, hashes[day])}
+             for day, records in store.get_days(sorted(changed)).items()},
+            removed,
+        )
+        state.set_published(changed, removed)
+    return {"pulled": sorted(merged_days), "published": len(changed), "read": read}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("directory", help="directory shared by the devices")
+    parser.add_argument("--device", default=socket.gethostname().split(".")[0], help="this device's name")
+    parser.add_argument("--user", default=users.DEFAULT_USER, help="user whose journal is synced")
+    args = parser.parse_args(argv)
+
+    workspace = Workspace(args.user)
+    state = SyncState(users.user_path(args.user, SYNC_FILE))
+    try:
+        result = sync(workspace, DirectoryTransport(args.directory, args.device), state)
+    except ValueError as error:
+        parser.error(str(error))
+    finally:
+        state.close()
+        workspace.close()
+    print(f"Merged {len(result['pulled'])} days from other devices, published {result['published']} days "
+          f"({result['read']} files read).")
+
+
+if __name__ == "__main__":
+    main()
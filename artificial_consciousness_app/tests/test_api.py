@@ -0,0 +1,75 @@
+import asyncio
+import os
+from http import HTTPStatus
+
+import pytest
+
+import api
+import users
+from workspace import Workspace
+
+
+@pytest.mark.parametrize("value", ["20250101", "2025-W01-1", "2025-1-1", "2025-02-30"])
+def test_only_canonical_dates_are_accepted(value):
+    with pytest.raises(api.HTTPError):
+        api._check_date(value)
+
+
+def test_a_canonical_date_is_accepted():
+    api._check_date("2025-01-01")
+
+
+def test_prompt_version_must_be_an_integer_not_a_boolean():
+    with pytest.raises(api.HTTPError):
+        api.parse_entries('[{"question": "Q", "answer": "A", "prompt_version": true}]')
+    assert api.parse_entries('[{"question": "Q", "answer": "A", "prompt_version": 2}]')[0]["prompt_version"] == 2
+
+
+@pytest.mark.parametrize("body", ['{"entries": []}', "[]"])
+def test_an_empty_put_is_refused_and_keeps_the_day(tmp_path, monkeypatch, body):
+    monkeypatch.chdir(tmp_path)
+    workspace = Workspace("someone", backend="sqlite")
+    try:
+        workspace.save_day("2025-01-01", [{"question": "Q", "answer": "A"}])
+        with pytest.raises(api.HTTPError) as error:
+            api.put_day(workspace, {}, {}, body.encode(), "2025-01-01")
+        assert error.value.status == HTTPStatus.BAD_REQUEST
+        assert workspace.store.get_day("2025-01-01")[0]["answer"] == "A"
+    finally:
+        workspace.close()
+
+
+def _status(server, target, token=None, method="GET", body=b""):
+    headers = {"authorization": f"Bearer {token}"} if token else {}
+    try:
+        return asyncio.run(server.dispatch(method, target, headers, body))[0]
+    except api.HTTPError as error:
+        return error.status
+
+
+def test_each_token_opens_only_its_own_users_journal(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    server = api.Server(tokens=api.load_tokens({"AC_API_TOKENS": "alice=a-token,bob=b-token"}))
+    try:
+        day = b'[{"question": "Q", "answer": "A"}]'
+        assert _status(server, "/days/2025-01-01", "a-token", "PUT", day) == HTTPStatus.CREATED
+        assert _status(server, "/days/2025-01-01", "a-token") == HTTPStatus.OK
+        assert _status(server, "/days/2025-01-01?user=alice", "a-token") == HTTPStatus.OK
+        assert _status(server, "/days/2025-01-01?user=alice", "b-token") == HTTPStatus.FORBIDDEN
+        assert _status(server, "/days/2025-01-01?user=alice") == HTTPStatus.UNAUTHORIZED
+        assert _status(server, "/days/2025-01-01?user=alice", "wrong") == HTTPStatus.UNAUTHORIZED
+        assert _status(server, "/days", "b-token") == HTTPStatus.NOT_FOUND
+        assert not users.shard_exists("bob")
+    finally:
+        server.close()
+
+
+def test_without_tokens_only_the_default_user_is_served(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    server = api.Server(tokens={})
+    try:
+        assert _status(server, "/days?user=alice") == HTTPStatus.FORBIDDEN
+        assert _status(server, "/days") == HTTPStatus.OK
+        assert not os.path.exists(users.DATA_DIR)
+    finally:
+        server.close()
@@ -0,0 +1,24 @@
+import json
+
+import bulk
+from workspace import Workspace
+
+
+def test_import_keeps_history_and_indexes_in_step(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    workspace = Workspace("someone", backend="sqlite")
+    workspace.save_day("2025-01-01", [{"question": f"Q{i}", "answer": f"about cats {i}"} for i in range(5)])
+    workspace.search_index, workspace.vector_index
+    workspace.close()
+    (tmp_path / "import.json").write_text(json.dumps({"2025-01-01": [{"question": "Q0", "answer": "about dogs"}]}))
+
+    bulk.main(["import", "import.json", "--user", "someone", "--backend", "sqlite"])
+
+    workspace = Workspace("someone", backend="sqlite")
+    try:
+        assert workspace.search_index.search("cats") == []
+        assert [day for day, _, _ in workspace.search_index.search("dogs")] == ["2025-01-01"]
+        assert all(position == 0 for _, position, _ in workspace.vector_index.related([{"question": "Q", "answer": "about dogs"}]))
+        assert [version for version, _ in workspace.history.versions("2025-01-01")] == [2, 1]
+    finally:
+        workspace.close()
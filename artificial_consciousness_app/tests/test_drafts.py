@@ -0,0 +1,63 @@
+import time
+
+from drafts import Autosaver, DraftStore
+
+DAY = "2025-01-01"
+
+
+def test_drafts_are_written_once_per_burst_and_restored(tmp_path):
+    path = str(tmp_path / "drafts.db")
+    store = DraftStore(path)
+    autosaver = Autosaver(store, delay=60, max_delay=60)
+    try:
+        for text in ("I", "I fe", "I feel calm"):
+            autosaver.update(DAY, "q1", text)
+        autosaver.update(DAY, "q2", "")
+        assert autosaver.restore(DAY) == {"q1": "I feel calm"}
+        assert store.load(DAY) == {}
+        autosaver.flush()
+        autosaver.update(DAY, "q1", "I feel calm")
+        autosaver.flush()
+        assert autosaver.writes == 1
+    finally:
+        store.close()
+
+    store = DraftStore(path)
+    try:
+        assert Autosaver(store).restore(DAY) == {"q1": "I feel calm"}
+    finally:
+        store.close()
+
+
+def test_drafts_are_flushed_after_a_quiet_delay(tmp_path):
+    store = DraftStore(str(tmp_path / "drafts.db"))
+    autosaver = Autosaver(store, delay=0.05, max_delay=1)
+    try:
+        autosaver.update(DAY, "q1", "typing")
+        deadline = time.monotonic() + 5
+        while autosaver.writes == 0 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert store.load(DAY) == {"q1": "typing"}
+    finally:
+        autosaver.flush()
+        store.close()
+
+
+def test_discard_drops_pending_and_saved_drafts(tmp_path):
+    store = DraftStore(str(tmp_path / "drafts.db"))
+    autosaver = Autosaver(store, delay=60, max_delay=60)
+    try:
+        autosaver.update(DAY, "q1", "saved")
+        autosaver.flush()
+        autosaver.update(DAY, "q2", "pending")
+        autosaver.update("2025-01-02", "q1", "another day")
+        autosaver.discard(DAY)
+        autosaver.flush()
+        assert autosaver.restore(DAY) == {}
+        assert autosaver.restore("2025-01-02") == {"q1": "another day"}
+        # Typing the discarded text again is an edit, not a repeat of an already written draft.
+        autosaver.update(DAY, "q1", "saved")
+        assert autosaver.restore(DAY) == {"q1": "saved"}
+        autosaver.flush()
+    finally:
+        store.close()
@@ -0,0 +1,74 @@
+import os
+import sqlite3
+import threading
+
+import numpy as np
+
+from embeddings import DIM, VectorIndex
+
+
+class Store:
+    def __init__(self, days):
+        self.days = days
+
+    def load_all(self):
+        return dict(self.days)
+
+
+def _rows(index):
+    return os.path.getsize(index.matrix_path) // (DIM * 4)
+
+
+def test_resaving_a_day_reuses_its_rows(tmp_path):
+    index = VectorIndex(str(tmp_path / "vectors.db"))
+    try:
+        index.index_day("2025-01-01", [{"question": "Q1", "answer": "walked the dog"}, {"question": "Q2", "answer": "read a book"}])
+        for answer in ("cooked dinner", "painted the fence", "fixed the bicycle"):
+            index.index_day("2025-01-01", [{"question": "Q1", "answer": answer}, {"question": "Q2", "answer": "read a book"}])
+        assert _rows(index) == 2
+        results = index.related([{"question": "Q", "answer": "bicycle repair"}])
+        assert [(date, position) for date, position, _ in results] == [("2025-01-01", 0)]
+    finally:
+        index.close()
+
+
+def test_rows_left_by_an_older_index_are_reused(tmp_path):
+    path = str(tmp_path / "vectors.db")
+    index = VectorIndex(path)
+    index.index_day("2025-01-01", [{"question": "Q", "answer": "walked the dog"}])
+    index.close()
+    # An older index zeroed a re-saved day's rows without listing them as free.
+    with open(os.path.splitext(path)[0] + ".f32", "ab") as f:
+        f.write(np.zeros((3, DIM), dtype=np.float32).tobytes())
+    index = VectorIndex(path)
+    try:
+        index.index_day("2025-01-02", [{"question": "Q", "answer": answer} for answer in ("one bird", "two cats", "three owls")])
+        assert _rows(index) == 4
+    finally:
+        index.close()
+    with sqlite3.connect(path) as conn:
+        assert conn.execute("SELECT COUNT(*) FROM free_rows").fetchone() == (0,)
+
+
+def test_related_while_rebuilding(tmp_path):
+    days = {f"2025-01-{day:02d}": [{"question": "Q", "answer": f"walked the dog number {day}"}] for day in range(1, 29)}
+    index = VectorIndex(str(tmp_path / "vectors.db"))
+    index.rebuild(Store(days))
+    errors = []
+
+    def rebuild():
+        for _ in range(20):
+            index.rebuild(Store(days))
+
+    thread = threading.Thread(target=rebuild)
+    thread.start()
+    try:
+        while thread.is_alive():
+            try:
+                index.related([{"question": "Q", "answer": "dog walk"}])
+            except Exception as e:  # noqa: BLE001 - any failure fails the test
+                errors.append(e)
+    finally:
+        thread.join()
+        index.close()
+    assert errors == []
@@ -0,0 +1,57 @@
+import hashlib
+import sqlite3
+
+import metrics
+from history import KEYFRAME_INTERVAL, EntryHistory, encode_day
+from workspace import Workspace
+
+DAY = "2025-01-01"
+
+
+def _day(n):
+    return [{"question": "Q1", "answer": f"Morning {n}: " + "slept well and walked the dog. " * 20},
+            {"question": "Q2", "answer": "unchanged"}]
+
+
+def test_every_version_is_rebuilt_from_its_delta_chain(tmp_path):
+    path = str(tmp_path / "history.db")
+    history = EntryHistory(path)
+    count = 2 * KEYFRAME_INTERVAL + 3
+    try:
+        assert history.record(DAY, _day(1), previous=_day(0)) == 2
+        for n in range(2, count):
+            assert history.record(DAY, _day(n)) == n + 1
+        assert history.record(DAY, _day(count - 1)) is None
+        for version in range(1, count + 1):
+            assert history.get(DAY, version) == _day(version - 1)
+        assert history.get(DAY, count + 1) is None
+        assert [version for version, _ in history.versions(DAY, limit=3)] == [count, count - 1, count - 2]
+
+        digest = hashlib.sha256(encode_day(_day(5))).hexdigest()
+        assert history.find(digest) == _day(5)
+        assert history.latest_hashes() == {DAY: history.hashes(DAY, limit=1)[0]}
+        assert history.find("0" * 64) is None
+    finally:
+        history.close()
+    with sqlite3.connect(path) as conn:
+        assert conn.execute("SELECT MAX(depth) FROM blobs").fetchone() == (KEYFRAME_INTERVAL - 1,)
+        keyframes, deltas = conn.execute("SELECT SUM(base IS NULL), SUM(base IS NOT NULL) FROM blobs").fetchone()
+    assert keyframes == 3 and deltas == count - 3
+
+
+def test_history_storage_is_reported_as_gauges(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(metrics, "ENABLED", True)
+    monkeypatch.setattr(metrics, "registry", metrics.Registry())
+    workspace = Workspace("someone", backend="sqlite")
+    try:
+        for answer in ("first", "second", "first"):
+            workspace.save_day(DAY, [{"question": "Q", "answer": answer}])
+        gauges = {name: value for (name, labels), value in metrics.registry.snapshot()[2].items()
+                  if dict(labels) == {"user": "someone"}}
+        assert gauges["history_versions"] == 3
+        assert gauges["history_blobs"] == 2
+        assert 0 < gauges["history_stored_bytes"] and 0 < gauges["history_content_bytes"]
+    finally:
+        workspace.close()
+    assert metrics.registry.snapshot()[2] == {}
@@ -0,0 +1,43 @@
+import io
+import json
+
+import pytest
+
+from jsonstream import ObjectReader
+
+DOCUMENT = {
+    "schema": 2,
+    "questions": {"q1": "How do you feel?", "q2": "Was it \"good\"?"},
+    "days": {
+        "2025-01-01": [["q1", "fine, thanks é中", 1], ["q2", "yes\n\tand no", 1.5e3]],
+        "2025-01-02": [["q1", "", -12], ["q2", None, True]],
+    },
+    "empty": {},
+}
+
+
+def _read(reader):
+    """Rebuilds an object by walking its members, descending into nested objects."""
+    result = {}
+    for key in reader.members():
+        result[key] = _read(reader) if key in ("questions", "days", "empty") else reader.value()
+    return result
+
+
+@pytest.mark.parametrize("indent", [None, 2])
+def test_values_split_across_chunk_boundaries(indent):
+    text = json.dumps(DOCUMENT, indent=indent, ensure_ascii=False)
+    for chunk_size in range(1, 40):
+        assert _read(ObjectReader(io.StringIO(text), chunk_size=chunk_size)) == DOCUMENT
+
+
+def test_a_number_at_the_end_of_a_chunk_is_read_whole():
+    reader = ObjectReader(io.StringIO('{"a": 12345.5e2}'), chunk_size=8)
+    assert [(key, reader.value()) for key in reader.members()] == [("a", 12345.5e2)]
+
+
+def test_a_truncated_document_is_rejected():
+    reader = ObjectReader(io.StringIO('{"a": [1, 2'), chunk_size=4)
+    with pytest.raises(ValueError):
+        for _ in reader.members():
+            reader.value()
@@ -0,0 +1,26 @@
+import json
+import os
+
+import entries as entry_model
+import prompts
+
+APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PROMPTS_FILE = os.path.join(APP_DIR, "content", "prompts", "introspection.json")
+
+
+def test_the_shipped_history_joins_to_a_prompt_version():
+    prompt_set = prompts.load(PROMPTS_FILE)
+    with open(os.path.join(APP_DIR, "introspection_logs.json"), encoding="utf-8") as f:
+        logs = json.load(f)
+    asked = {question.id for question in prompt_set.questions(1)}
+    assert all(entry_model.question_id(item["question"]) in asked for day in logs.values() for item in day)
+
+
+def test_all_questions_lists_dropped_prompts_after_the_current_ones():
+    prompt_set = prompts.parse({"versions": [
+        {"version": 1, "questions": [{"id": "a", "text": "A?"}, {"id": "b", "text": "B?"}]},
+        {"version": 2, "questions": [{"id": "b", "text": "B, reworded?"}, {"id": "c", "text": "C?"}]},
+    ]})
+    assert [(question.id, question.text) for question in prompt_set.all_questions()] == [
+        ("b", "B, reworded?"), ("c", "C?"), ("a", "A?"),
+    ]
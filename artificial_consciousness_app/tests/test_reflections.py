@@ -0,0 +1,101 @@
+import threading
+import time
+
+import reflections
+import storage
+from reflections import ReflectionEngine
+from stats import week_of
+
+
+class RecordingModel:
+    """Echoes each prompt's first answer and records the batches it was sent."""
+
+    name = "recording"
+
+    def __init__(self, fail=False):
+        self.batches = []
+        self.fail = fail
+
+    async def generate(self, prompts):
+        self.batches.append(prompts)
+        if self.fail:
+            raise RuntimeError("model unavailable")
+        return [next(line[3:] for line in prompt.splitlines() if line.startswith("A: ")) for prompt in prompts]
+
+
+def _store(tmp_path, days=range(1, 29)):
+    store = storage.open_store("sqlite", str(tmp_path / "journal.db"))
+    store.put_days([(f"2025-01-{day:02d}", [{"question": "Q", "answer": f"answer {day}"}]) for day in days])
+    return store
+
+
+def _wait_until_idle(engine, timeout=10):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        status = engine.status()
+        if status["pending"] == status["running"] == 0:
+            return status
+        time.sleep(0.01)
+    raise AssertionError(f"jobs still queued: {engine.status()}")
+
+
+def test_saved_days_are_reflected_before_the_backlog(tmp_path):
+    store = _store(tmp_path)
+    model = RecordingModel()
+    engine = ReflectionEngine(str(tmp_path / "reflections.db"), store, model=model, concurrency=1, batch_size=2)
+    try:
+        engine.backfill(store.dates()[:-1])
+        engine.enqueue("2025-01-28")
+        assert engine.job_status("day", "2025-01-28") == "pending"
+        engine.start()
+        status = _wait_until_idle(engine)
+        assert status["failed"] == 0 and status["done"] == 28 + len({week_of(day) for day in store.dates()})
+        # The first batch is the saved day and its week, which the backfill had also queued.
+        assert sorted(prompt.split()[0] for prompt in model.batches[0]) == ["Summarize", "Write"]
+        assert all("answer 28" in prompt for prompt in model.batches[0])
+        assert engine.job_status("day", "2025-01-28") == "done"
+        assert engine.reflection("day", "2025-01-05") == "answer 5"
+        assert engine.reflection("week", week_of("2025-01-05")) is not None
+        assert [key for key, _ in engine.recent("day", limit=2)] == ["2025-01-28", "2025-01-27"]
+
+        # A re-queued day whose answers did not change is served from the cache.
+        sent = len(model.batches)
+        engine.enqueue("2025-01-05")
+        _wait_until_idle(engine)
+        assert len(model.batches) == sent
+    finally:
+        engine.close()
+        store.close()
+
+
+def test_failing_jobs_are_retried_then_marked_failed(tmp_path, monkeypatch):
+    monkeypatch.setattr(reflections, "POLL_SECONDS", 0.01)
+    store = _store(tmp_path, days=[1])
+    model = RecordingModel(fail=True)
+    engine = ReflectionEngine(str(tmp_path / "reflections.db"), store, model=model, concurrency=1)
+    try:
+        engine.start()
+        engine.enqueue("2025-01-01")
+        status = _wait_until_idle(engine)
+        assert status["failed"] == 2
+        assert {error for _, _, error in status["errors"]} == {"model unavailable"}
+        assert len(model.batches) == reflections.MAX_ATTEMPTS
+        assert engine.reflection("day", "2025-01-01") is None
+    finally:
+        engine.close()
+        store.close()
+
+
+def test_close_stops_busy_workers(tmp_path):
+    store = _store(tmp_path)
+    try:
+        for attempt in range(50):
+            engine = ReflectionEngine(str(tmp_path / f"reflections-{attempt}.db"), store)
+            engine.start()
+            engine.backfill(store.dates())
+            closer = threading.Thread(target=engine.close)
+            closer.start()
+            closer.join(10)
+            assert not closer.is_alive()
+    finally:
+        store.close()
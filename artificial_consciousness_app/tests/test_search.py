@@ -0,0 +1,43 @@
+import sqlite3
+
+from search import SearchIndex
+
+
+def test_index_day_replaces_only_that_day(tmp_path):
+    index = SearchIndex(str(tmp_path / "search.db"))
+    try:
+        index.index_days([
+            ("2025-01-01", [{"question": "Q", "answer": "about cats"}, {"question": "R", "answer": "more cats"}]),
+            ("2025-01-02", [{"question": "Q", "answer": "cats again"}]),
+        ])
+        index.index_day("2025-01-01", [{"question": "Q", "answer": "about dogs"}])
+        index.index_day("2025-01-02", [])
+        assert index.search("cats") == []
+        assert [day for day, _, _ in index.search("dogs")] == ["2025-01-01"]
+        index.index_day("2025-01-02", [{"question": "Q", "answer": "dogs too"}])
+        assert sorted(day for day, _, _ in index.search("dogs")) == ["2025-01-01", "2025-01-02"]
+    finally:
+        index.close()
+
+
+def test_snippets_escape_the_answer(tmp_path):
+    index = SearchIndex(str(tmp_path / "search.db"))
+    try:
+        index.index_day("2025-01-01", [{"question": "Q", "answer": "<script>alert(1)</script> cats & dogs"}])
+        [(_, _, snippet)] = index.search("cats")
+        assert snippet == "&lt;script&gt;alert(1)&lt;/script&gt; <mark>cats</mark> &amp; dogs"
+    finally:
+        index.close()
+
+
+def test_index_without_day_rows_is_emptied_for_a_rebuild(tmp_path):
+    path = str(tmp_path / "search.db")
+    with sqlite3.connect(path) as conn:
+        conn.execute("CREATE VIRTUAL TABLE answers USING fts5(date UNINDEXED, question, answer, tokenize = 'porter unicode61')")
+        conn.execute("INSERT INTO answers VALUES ('2025-01-01', 'Q', 'about cats')")
+    conn.close()
+    index = SearchIndex(path)
+    try:
+        assert index.is_empty()
+    finally:
+        index.close()
@@ -0,0 +1,38 @@
+from stats import JournalStats
+
+
+class Store:
+    def __init__(self, days):
+        self.days = days
+
+    def load_all(self):
+        return self.days
+
+
+def answered(text="an answer"):
+    return [{"question": "How do you feel?", "answer": text}]
+
+
+def test_saves_keep_the_same_aggregates_as_a_rebuild(tmp_path):
+    saved = {}
+    stats = JournalStats(str(tmp_path / "incremental.db"))
+    saves = [
+        ("2025-01-01", answered()), ("2025-01-02", answered()), ("2025-01-04", answered()),
+        ("2025-01-03", answered()),  # Joins two runs into the current streak.
+        ("2025-01-10", answered()), ("2025-01-02", answered("nil")),  # A day stops counting.
+        ("2025-01-11", answered()),
+    ]
+    for day, records in saves:
+        saved[day] = records
+        stats.update_day(day, records)
+    rebuilt = JournalStats(str(tmp_path / "rebuilt.db"))
+    rebuilt.rebuild(Store(saved))
+    try:
+        assert stats.summary() == rebuilt.summary()
+        assert stats.summary()["longest_streak"] == 2
+        assert stats.weekly() == rebuilt.weekly()
+        row = "SELECT current_streak, longest_streak, last_date, current_start FROM summary"
+        assert stats._conn.execute(row).fetchone() == rebuilt._conn.execute(row).fetchone() == (2, 2, "2025-01-11", "2025-01-10")
+    finally:
+        stats.close()
+        rebuilt.close()
@@ -0,0 +1,120 @@
+import os
+import sqlite3
+import threading
+
+import pytest
+
+import entries as entry_model
+from storage import JournalStore, SqliteStore, VaultStore
+
+
+def test_journal_store_rereads_a_file_compacted_by_another_process(tmp_path):
+    path = str(tmp_path / "journal.jsonl")
+    reader = JournalStore(path)
+    writer = JournalStore(path)
+    reader.put_day("2025-01-01", [{"question": "Q", "answer": "a"}])
+    assert reader.get_day("2025-01-01")[0]["answer"] == "a"
+
+    writer.put_day("2025-01-01", [{"question": "Q", "answer": "EDITED"}])
+    writer.compact()
+    # Grow the compacted file past the reader's offset.
+    writer.put_days([(f"2025-02-{day:02d}", [{"question": "Q", "answer": "x" * 50}]) for day in range(1, 20)])
+
+    assert reader.get_day("2025-01-01")[0]["answer"] == "EDITED"
+    assert len(reader.dates()) == 20
+
+
+def _version_0_store(path):
+    conn = sqlite3.connect(path)
+    conn.executescript("""
+        CREATE TABLE questions (id INTEGER PRIMARY KEY, text TEXT NOT NULL UNIQUE);
+        CREATE TABLE entries (
+            date TEXT NOT NULL,
+            position INTEGER NOT NULL,
+            question_id INTEGER NOT NULL REFERENCES questions(id),
+            answer TEXT NOT NULL,
+            PRIMARY KEY (date, position)
+        );
+        CREATE INDEX entries_question ON entries (question_id, date);
+        INSERT INTO questions VALUES (1, 'Q1'), (2, 'Q2');
+        INSERT INTO entries VALUES ('2025-01-01', 0, 1, 'a'), ('2025-01-01', 1, 2, 'b'), ('2025-01-02', 0, 2, 'c');
+    """)
+    conn.close()
+
+
+def test_sqlite_store_migrates_a_version_0_store(tmp_path):
+    path = str(tmp_path / "journal.db")
+    _version_0_store(path)
+    store = SqliteStore(path)
+    try:
+        assert [item["answer"] for item in store.get_day("2025-01-01")] == ["a", "b"]
+        assert store.question_history(entry_model.question_id("Q2")) == [("2025-01-01", "b"), ("2025-01-02", "c")]
+    finally:
+        store.close()
+
+
+def test_a_failed_version_0_migration_keeps_the_old_store(tmp_path, monkeypatch):
+    path = str(tmp_path / "journal.db")
+    _version_0_store(path)
+    monkeypatch.setattr(entry_model, "question_id", lambda text: 1 / 0 if text == "Q2" else "id")
+    with pytest.raises(sqlite3.Error):
+        SqliteStore(path)
+    conn = sqlite3.connect(path)
+    try:
+        assert conn.execute("PRAGMA user_version").fetchone()[0] == 0
+        assert conn.execute("SELECT COUNT(*) FROM entries").fetchone()[0] == 3
+        assert conn.execute("SELECT text FROM questions ORDER BY id").fetchall() == [("Q1",), ("Q2",)]
+    finally:
+        conn.close()
+
+
+def test_sqlite_store_reads_while_another_thread_writes(tmp_path):
+    store = SqliteStore(str(tmp_path / "journal.db"))
+    try:
+        store.put_day("2025-01-01", [{"question": "Q", "answer": "a"}])
+        result = []
+        reader = threading.Thread(target=lambda: result.append(store.get_day("2025-01-01")))
+        with store._lock:  # As a long write in another session would hold it.
+            reader.start()
+            reader.join(5)
+            assert result and result[0][0]["answer"] == "a"
+        store.put_day("2025-01-01", [{"question": "Q", "answer": "b"}])
+        assert store.get_day("2025-01-01")[0]["answer"] == "b"
+    finally:
+        store.close()
+
+
+def test_encrypted_vault_round_trip(tmp_path):
+    pytest.importorskip("cryptography")
+    path = str(tmp_path / "journal.vault")
+    days = [("2024-12-31", [{"question": "Q", "answer": "a secret about cats"}]),
+            ("2025-01-01", [{"question": "Q", "answer": "a secret about dogs"}])]
+    store = VaultStore(path, passphrase="correct horse")
+    assert store.encrypted
+    store.put_days(days)
+
+    reopened = VaultStore(path, passphrase="correct horse")
+    assert reopened.dates() == ["2024-12-31", "2025-01-01"]
+    assert [item["answer"] for item in reopened.get_day("2025-01-01")] == ["a secret about dogs"]
+    assert reopened.decrypt(reopened.encrypt(b"blob", "name"), "name") == b"blob"
+    for name in os.listdir(path):
+        if name.endswith(".chunk"):
+            with open(os.path.join(path, name), "rb") as f:
+                assert b"secret" not in f.read()
+
+
+def test_encrypted_vault_rejects_a_wrong_or_missing_passphrase(tmp_path, monkeypatch):
+    pytest.importorskip("cryptography")
+    monkeypatch.delenv(VaultStore.PASSPHRASE_ENV, raising=False)
+    path = str(tmp_path / "journal.vault")
+    store = VaultStore(path, passphrase="correct horse")
+    store.put_day("2025-01-01", [{"question": "Q", "answer": "a secret"}])
+    with pytest.raises(ValueError):
+        VaultStore(path, passphrase="wrong horse")
+    with pytest.raises(ValueError):
+        VaultStore(path)
+    # A chunk is bound to its month, so it cannot be read in place of another.
+    with open(os.path.join(path, "2025-01.chunk"), "rb") as f:
+        sealed = f.read()
+    with pytest.raises(ValueError):
+        store.decrypt(sealed, "2025-02")
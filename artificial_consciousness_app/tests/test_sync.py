@@ -0,0 +1,112 @@
+import pytest
+
+import sync
+import users
+from workspace import Workspace
+
+DAY = "2025-01-01"
+QUESTIONS = ["How do you feel?", "What did you learn?"]
+
+
+class Device:
+    def __init__(self, name, directory):
+        self.workspace = Workspace(name, backend="sqlite")
+        self.state = sync.SyncState(users.user_path(name, sync.SYNC_FILE))
+        self.transport = sync.DirectoryTransport(str(directory), name)
+
+    def sync(self):
+        return sync.sync(self.workspace, self.transport, self.state)
+
+    def answers(self):
+        return [item["answer"] for item in self.workspace.store.get_day(DAY)]
+
+    def edit(self, position, answer):
+        records = [dict(item) for item in self.workspace.store.get_day(DAY)]
+        records[position]["answer"] = answer
+        self.workspace.save_day(DAY, records)
+
+    def close(self):
+        self.state.close()
+        self.workspace.close()
+
+
+@pytest.fixture
+def devices(tmp_path, monkeypatch):
+    """Two devices that both hold DAY, written straight to their stores (so with no history), and have synced once."""
+    monkeypatch.chdir(tmp_path)
+    a, b = Device("a", tmp_path / "shared"), Device("b", tmp_path / "shared")
+    for device in (a, b):
+        device.workspace.store.put_day(DAY, [{"question": q, "answer": "original"} for q in QUESTIONS])
+        device.sync()
+    yield a, b
+    a.close()
+    b.close()
+
+
+def test_one_sided_edit_is_not_a_conflict(devices):
+    a, b = devices
+    a.edit(0, "edited on a")
+    a.sync()
+    assert a.answers() == ["edited on a", "original"]
+    b.sync()
+    assert b.answers() == ["edited on a", "original"]
+
+
+def test_edits_to_different_questions_are_both_kept(devices):
+    a, b = devices
+    a.edit(0, "edited on a")
+    b.edit(1, "edited on b")
+    a.sync()
+    b.sync()
+    a.sync()
+    assert a.answers() == b.answers() == ["edited on a", "edited on b"]
+
+
+def test_conflicting_edits_keep_both_answers_on_every_device(devices):
+    a, b = devices
+    a.edit(0, "edited on a")
+    b.edit(0, "edited on b")
+    a.sync()
+    b.sync()
+    a.sync()
+    expected = f"edited on a\n\n{sync.CONFLICT_MARKER}\n\nedited on b"
+    assert a.answers() == b.answers() == [expected, "original"]
+
+
+def test_merge_day_is_symmetric_and_idempotent():
+    local = [{"question": QUESTIONS[0], "answer": "x"}, {"question": QUESTIONS[1], "answer": "y"}]
+    remote = [{"question": QUESTIONS[1], "answer": "z"}, {"question": QUESTIONS[0], "answer": "x"}]
+    merged = sync.merge_day(local, remote)
+    assert merged == sync.merge_day(remote, local)
+    assert sync.merge_day(merged, remote) == merged
+
+
+def test_a_day_saved_without_question_ids_syncs_without_a_conflict(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    a, b = Device("a", tmp_path / "shared"), Device("b", tmp_path / "shared")
+    try:
+        a.workspace.save_day(DAY, [{"question": q, "answer": "original"} for q in QUESTIONS])
+        a.sync()
+        b.sync()
+        a.workspace.save_day(DAY, [{"question": QUESTIONS[0], "answer": "edited"}, {"question": QUESTIONS[1], "answer": "original"}])
+        assert a.sync()["pulled"] == []
+        b.sync()
+        assert b.answers() == ["edited", "original"]
+    finally:
+        a.close()
+        b.close()
+
+
+def test_a_sync_reads_only_the_days_that_changed(devices, monkeypatch):
+    a, b = devices
+    a.workspace.import_days([(f"2024-{month:02d}-01", [{"question": "Q", "answer": "a"}]) for month in range(1, 13)])
+    a.sync()
+    b.sync()
+    a.edit(0, "edited on a")
+    a.sync()
+    read = []
+    store = b.workspace.store
+    monkeypatch.setattr(store, "get_day", lambda day: read.append(day) or type(store).get_day(store, day))
+    monkeypatch.setattr(store, "get_days", lambda days: read.extend(days) or type(store).get_days(store, days))
+    assert b.sync()["pulled"] == [DAY]
+    assert set(read) == {DAY}
@@ -0,0 +1,34 @@
+import os
+import sqlite3
+import zlib
+
+import pytest
+
+import users
+from workspace import HISTORY_FILE, PLAINTEXT_FILES, STORE_FILES, Workspace
+
+pytest.importorskip("cryptography")
+
+
+def test_encrypted_journal_keeps_no_plaintext_copy(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("AC_VAULT_PASSPHRASE", "correct horse")
+    workspace = Workspace("someone", backend="vault")
+    try:
+        workspace.save_day("2025-01-01", [{"question": "Q", "answer": "a secret about cats"}])
+        workspace.save_day("2025-01-01", [{"question": "Q", "answer": "a secret about dogs"}])
+        assert workspace.search_index is None and workspace.vector_index is None and workspace.reflection_engine is None
+        assert [item["answer"] for item in workspace.history.get("2025-01-01", 1)] == ["a secret about cats"]
+        history_path = workspace.history.path
+    finally:
+        workspace.close()
+
+    vault = users.user_path("someone", STORE_FILES["vault"])
+    assert history_path == os.path.join(vault, HISTORY_FILE)
+    assert not set(PLAINTEXT_FILES) & set(os.listdir(os.path.dirname(vault)))
+    with sqlite3.connect(history_path) as conn:
+        keyframes = [data for data, in conn.execute("SELECT data FROM blobs WHERE base IS NULL")]
+    assert keyframes
+    for data in keyframes:
+        with pytest.raises(zlib.error):
+            zlib.decompress(data)
@@ -0,0 +1,75 @@
+"""Per-user namespacing of the journal files.
+
+Each user gets a shard directory, data/users/<slug>/, holding their own store,
+indexes and drafts. One user's save never rewrites or locks another user's
+files, and per-user reads and writes cost the same however many users exist.
+The default user keeps the single-user layout in the working directory, so an
+existing deployment keeps its journal.
+
+How a user is identified is up to the deployment: Streamlit's built-in login
+when it is configured (signing in is then required), otherwise a `?user=`
+query parameter. The API (api.py) maps each bearer token to one user.
+"""
+import hashlib
+import os
+import re
+
+DATA_DIR = os.path.join("data", "users")
+DEFAULT_USER = "default"
+
+
+def user_slug(user):
+    """Returns a file-system-safe directory name for `user`.
+
+    The readable part is truncated, so a hash of the full name keeps
+    distinct users (e.g. "a.b@x" and "a-b@x") in distinct shards.
+    """
+    normalized = user.strip().lower()
+    readable = re.sub(r"[^a-z0-9]+", "-", normalized).strip("-")[:40] or "user"
+    return f"{readable}-{hashlib.sha1(normalized.encode('utf-8')).hexdigest()[:8]}"
+
+
+def user_dir(user):
+    """Returns (and creates) the shard directory of `user`; "" for the default user."""
+    if user == DEFAULT_USER:
+        return ""
+    path = os.path.join(DATA_DIR, user_slug(user))
+    os.makedirs(path, exist_ok=True)
+    return path
+
+
+def shard_exists(user):
+    """Returns whether `user` has a shard directory yet, without creating one."""
+    return user == DEFAULT_USER or os.path.isdir(os.path.join(DATA_DIR, user_slug(user)))
+
+
+def user_path(user, filename):
+    return os.path.join(user_dir(user), filename)
+
+
+def login_configured():
+    """Returns whether Streamlit's login is set up, i.e. secrets.toml has an [auth] section."""
+    import streamlit as st
+
+    try:
+        return "auth" in st.secrets
+    except FileNotFoundError:  # No secrets.toml at all.
+        return False
+
+
+def current_user():
+    """Returns the signed-in user's email, or without login configured the `?user=` query parameter, else DEFAULT_USER.
+
+    With login configured, a visitor who has not signed in only gets a login
+    button: trusting `?user=` then would let anyone open anyone's journal.
+    """
+    import streamlit as st
+
+    if login_configured():
+        if not st.user.is_logged_in or not st.user.get("email"):
+            st.info("Sign in to open your journal.")
+            st.button("Log in", on_click=st.login)
+            st.stop()
+        return st.user.email
+    user = st.query_params.get("user", "").strip()
+    return user or DEFAULT_USER
@@ -0,0 +1,4 @@
+"""Pages of the app, one module per group; app.py imports a module when one of its pages is opened.
+
+Every page function takes the current user, whose journal it shows.
+"""
@@ -0,0 +1,24 @@
+import os
+
+import streamlit as st
+
+import metrics
+
+def diagnostics(user):
+    st.title("🩺 Diagnostics")
+    counters, timers, gauges = metrics.registry.snapshot()
+    st.subheader("Latency")
+    st.dataframe([
+        {"metric": name, **dict(labels), "calls": count, "mean ms": total / count * 1000, "max ms": worst * 1000}
+        for (name, labels), (count, total, worst) in sorted(timers.items())
+    ])
+    st.subheader("Counters and caches")
+    st.dataframe([
+        {"metric": name, **dict(labels), "value": value}
+        for (name, labels), value in sorted(counters.items()) + sorted(gauges.items())
+    ])
+    if st.button("Write metrics file"):
+        metrics.registry.write()
+        st.success(f"Wrote {os.path.abspath(metrics.METRICS_FILE)}")
+    with st.expander("Prometheus text"):
+        st.code(metrics.registry.prometheus(), language="text")
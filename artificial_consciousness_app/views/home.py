@@ -0,0 +1,16 @@
+import os
+
+import streamlit as st
+
+import content
+import metrics
+
+HOME_CONTENT = os.path.join(content.APP_CONTENT_DIR, 'home_plan.md')
+HOME_STYLE = os.path.join(content.APP_CONTENT_DIR, 'home.css')
+
+@metrics.timed("page", page="home")
+def home(user):
+    st.markdown(content.load_css(HOME_STYLE), unsafe_allow_html=True)
+
+    st.title("🚀 Super Plan to Build Artificial Consciousness & Power Network")
+    content.show_sections(content.load_sections(HOME_CONTENT), key="home")
@@ -0,0 +1,197 @@
+import html
+import os
+import time
+from datetime import date
+
+import streamlit as st
+
+import content
+import metrics
+import prompts
+from history import diff_days
+from views.resources import (
+    get_history, get_journal_stats, get_reflection_engine, get_search_index, get_store, get_vector_index, save_logs,
+)
+
+PROMPTS_FILE = os.path.join(content.APP_CONTENT_DIR, 'prompts', 'introspection.json')
+
+@metrics.timed("page", page="introspection")
+def introspection(user):
+    st.title("🧠 Daily Introspection Prompts")
+
+    prompt_set = prompts.load(PROMPTS_FILE)
+    responses = {}
+    today = str(date.today())
+    st.subheader(f"Date: {today}")
+    for question in prompt_set.questions():
+        responses[question.id] = st.text_area(question.text, height=100, key=f"prompt:{question.id}")
+
+    if st.button("💾 Save Today's Introspection"):
+        save_logs(user, today, prompt_set.records(responses))
+        st.success("Saved successfully!")
+
+REVIEW_PAGE_SIZE = 30
+
+TIMELINE_STEP = 7
+
+def render_day(day, entries):
+    # One markdown element per day instead of two per answer, each question worded as it was asked.
+    # Answers can arrive through the API or a sync, so they are escaped before going into the HTML.
+    st.subheader(f"Entries for {day}")
+    entries = prompts.load(PROMPTS_FILE).worded(entries)
+    st.markdown("\n\n".join(
+        f"**{html.escape(item['question'])}**\n\n<div style='background-color:#2F3E56; padding:10px; border-radius:5px;'>{html.escape(item['answer'])}</div>"
+        for item in entries
+    ), unsafe_allow_html=True)
+
+def related_reflections(user, day, entries):
+    vector_index = get_vector_index(user)
+    if vector_index is None:
+        return  # An encrypted journal keeps no plaintext index of its answers.
+    with st.expander("🔗 Related reflections"):
+        started = time.perf_counter()
+        related = vector_index.related(entries, exclude_date=day)
+        if not related:
+            st.info("No related reflections yet.")
+            return
+        store = get_store(user)
+        days = store.get_days(sorted({related_day for related_day, _, _ in related}))
+        for related_day, position, score in related:
+            if position >= len(days.get(related_day, [])):
+                continue  # The day changed since it was indexed.
+            item = days[related_day][position]
+            st.markdown(f"**{related_day}** · {item['question']} _(similarity {score:.2f})_\n\n> {item['answer']}")
+        st.caption(f"Found in {(time.perf_counter() - started) * 1000:.1f} ms")
+
+def day_reflection(user, day):
+    engine = get_reflection_engine(user)
+    if engine is None:
+        return
+    with st.expander("🪞 Reflection"):
+        text = engine.reflection("day", day)
+        if text:
+            st.write(text)
+        elif engine.job_status("day", day) in ("pending", "running"):
+            st.info("The reflection on this day is still being written.")
+        else:
+            st.info("No reflection on this day yet; queue the journal on the Reflections page.")
+
+def previous_versions(user, day):
+    with st.expander("🕘 Previous versions"):
+        history = get_history(user)
+        versions = history.versions(day)
+        if len(versions) < 2:
+            st.info("This day has not been edited since its history began.")
+            return
+        # Only the two versions being compared are read back from the history.
+        saved = dict(versions)
+        numbers = [number for number, _ in versions]
+        version = st.selectbox(
+            "Version", numbers[1:], format_func=lambda number: f"Version {number} · {saved[number] or 'before history'}",
+            key=f"version:{day}",
+        )
+        newer = numbers[numbers.index(version) - 1]
+        changes = diff_days(history.get(day, version), history.get(day, newer))
+        st.caption(f"Changes from version {version} to version {newer}")
+        if not changes:
+            st.info("Only the prompt wording or order changed.")
+        for question, lines in changes:
+            st.markdown(f"**{question}**")
+            st.code("\n".join(lines[2:]), language="diff")
+
+@metrics.timed("page", page="review")
+def review(user):
+    st.title("📅 Review Past Entries")
+    store = get_store(user)
+    first, last = store.date_bounds()
+    if first is None:
+        st.info("No introspection logs found.")
+        return
+
+    # Only the dates inside the chosen window are ever fetched from the store.
+    date_range = st.date_input(
+        "Date range",
+        value=(date.fromisoformat(first), date.fromisoformat(last)),
+        min_value=date.fromisoformat(first),
+        max_value=date.fromisoformat(last),
+    )
+    if len(date_range) != 2:
+        return
+    start, end = (str(d) for d in date_range)
+    mode = st.radio("View", ["Day", "Timeline"], horizontal=True)
+
+    if mode == "Day":
+        total = store.count_dates(start, end)
+        if not total:
+            st.info("No entries in this range.")
+            return
+        pages = (total + REVIEW_PAGE_SIZE - 1) // REVIEW_PAGE_SIZE
+        page = st.number_input(f"Page (of {pages})", min_value=1, max_value=pages, value=1) if pages > 1 else 1
+        dates = store.dates_between(start, end, limit=REVIEW_PAGE_SIZE, offset=(page - 1) * REVIEW_PAGE_SIZE, descending=True)
+        selected_date = st.selectbox("Select a date to review:", dates)
+        if selected_date:
+            entries = store.get_day(selected_date)
+            render_day(selected_date, entries)
+            day_reflection(user, selected_date)
+            previous_versions(user, selected_date)
+            related_reflections(user, selected_date, entries)
+    else:
+        # The timeline grows by TIMELINE_STEP days each time "Load more" is pressed.
+        window_key = f"timeline_window:{start}:{end}"
+        window = st.session_state.setdefault(window_key, TIMELINE_STEP)
+        dates = store.dates_between(start, end, limit=window + 1, descending=True)
+        days = store.get_days(dates[:window])
+        for day in dates[:window]:
+            render_day(day, days[day])
+        if len(dates) > window and st.button("Load more"):
+            st.session_state[window_key] = window + TIMELINE_STEP
+            st.rerun()
+
+@metrics.timed("page", page="search")
+def search(user):
+    st.title("🔎 Search Past Entries")
+    search_index = get_search_index(user)
+    if search_index is None:
+        st.info("Search is off for an encrypted journal: its index would hold every answer in plaintext.")
+        return
+    query = st.text_input("Search answers and questions")
+    first, last = get_store(user).date_bounds()
+    start = end = None
+    if first is not None and st.checkbox("Filter by date"):
+        date_range = st.date_input("Date range", value=(date.fromisoformat(first), date.fromisoformat(last)))
+        if len(date_range) == 2:
+            start, end = (str(d) for d in date_range)
+    if not query.strip():
+        return
+    started = time.perf_counter()
+    results = search_index.search(query, start, end)
+    st.caption(f"{len(results)} results in {(time.perf_counter() - started) * 1000:.1f} ms")
+    for day, question, snippet in results:
+        st.markdown(f"**{day}** · {html.escape(question)}\n\n<div style='background-color:#2F3E56; padding:10px; border-radius:5px;'>{snippet}</div>", unsafe_allow_html=True)
+
+@metrics.timed("page", page="stats")
+def stats(user):
+    st.title("📈 Stats")
+    journal_stats = get_journal_stats(user)
+    summary = journal_stats.summary()
+    cols = st.columns(4)
+    cols[0].metric("Current streak", f"{summary['current_streak']} days")
+    cols[1].metric("Longest streak", f"{summary['longest_streak']} days")
+    cols[2].metric("Days answered", summary['days_answered'])
+    cols[3].metric("Empty / \"nill\" answers", f"{summary['empty_rate']:.0%}")
+
+    weekly = journal_stats.weekly()
+    if not weekly:
+        st.info("No introspection logs found.")
+        return
+    st.subheader("Days answered per week")
+    st.bar_chart({"week": [row[0] for row in weekly], "days answered": [row[1] for row in weekly]}, x="week")
+
+    st.subheader("Answer length per prompt")
+    # Every question ever asked, so answers to prompts since dropped keep their trend.
+    prompt = st.selectbox("Prompt", prompts.load(PROMPTS_FILE).all_questions(), format_func=lambda question: question.text)
+    trend = journal_stats.prompt_trend(prompt.id)
+    if trend:
+        st.line_chart({"week": [row[0] for row in trend], "average length": [row[1] for row in trend]}, x="week")
+    else:
+        st.info("No answers to this prompt yet.")
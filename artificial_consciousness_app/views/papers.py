@@ -0,0 +1,34 @@
+import html
+import os
+import time
+
+import streamlit as st
+
+import metrics
+from views.resources import get_library
+
+@metrics.timed("page", page="library")
+def library(user):
+    st.title("📚 Library")
+    paper_library = get_library()
+    if paper_library.is_indexing():
+        states = paper_library.status()
+        ready = sum(state == "ready" for state in states.values())
+        st.info(f"Indexing papers in the background ({ready}/{len(states)} done)…")
+        st.button("Refresh")
+    for path, state in paper_library.status().items():
+        if state.startswith("error"):
+            st.warning(f"{os.path.basename(path)}: {state}")
+
+    with st.expander("Papers"):
+        for path, title, page_count in paper_library.documents():
+            st.markdown(f"**{title}** · `{os.path.basename(path)}` · {page_count} pages")
+
+    query = st.text_input("Search the papers")
+    if not query.strip():
+        return
+    started = time.perf_counter()
+    results = paper_library.search(query)
+    st.caption(f"{len(results)} pages in {(time.perf_counter() - started) * 1000:.1f} ms")
+    for path, title, page_number, snippet in results:
+        st.markdown(f"**{html.escape(title)}** — page {page_number}\n\n<div style='background-color:#2F3E56; padding:10px; border-radius:5px;'>{snippet}</div>", unsafe_allow_html=True)
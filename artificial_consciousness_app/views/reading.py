@@ -0,0 +1,33 @@
+import streamlit as st
+
+import metrics
+from catalog import STATUSES
+from views.resources import get_reading_list
+
+@metrics.timed("page", page="reading")
+def reading(user):
+    st.title("📖 Reading List")
+    reading_list = get_reading_list(user)
+    col1, col2, col3 = st.columns(3)
+    category = col1.selectbox("Category", ["All"] + reading_list.categories())
+    status = col2.selectbox("Status", ["All"] + STATUSES)
+    text = col3.text_input("Title or author")
+    books = reading_list.books(
+        category=None if category == "All" else category,
+        status=None if status == "All" else status,
+        text=text.strip() or None,
+    )
+    st.caption(f"{len(books)} books")
+    for book in books:
+        label = f"{book['title']} — {book['author']}" if book["author"] else book["title"]
+        with st.expander(f"{label} · {book['status']} ({book['percent']}%)"):
+            st.caption(book["category"])
+            if book["description"]:
+                st.write(book["description"])
+            if book["links"]:
+                st.markdown(" · ".join(f"[{name}]({url})" for name, url in book["links"]))
+            new_status = st.selectbox("Status", STATUSES, index=STATUSES.index(book["status"]), key=f"status_{book['id']}")
+            percent = st.slider("Percent read", 0, 100, book["percent"], key=f"percent_{book['id']}")
+            if (new_status, percent) != (book["status"], book["percent"]):
+                reading_list.set_progress(book["id"], new_status, percent)
+                st.rerun()
@@ -0,0 +1,41 @@
+from datetime import date, timedelta
+
+import streamlit as st
+
+import metrics
+from views.resources import get_reflection_engine, get_store
+
+@metrics.timed("page", page="reflections")
+def reflections(user):
+    st.title("🪞 Reflections")
+    engine = get_reflection_engine(user)
+    if engine is None:
+        st.info("Reflections are off for an encrypted journal: they would quote its answers in plaintext.")
+        return
+    status = engine.status()
+    cols = st.columns(4)
+    cols[0].metric("Queued", status["pending"])
+    cols[1].metric("Generating", status["running"])
+    cols[2].metric("Done", status["done"])
+    cols[3].metric("Failed", status["failed"])
+    for kind, key, error in status["errors"]:
+        st.warning(f"{kind} {key}: {error}")
+    st.caption(f"Model: {engine.model.name}")
+
+    if st.button("Reflect on the whole journal"):
+        # Days and weeks whose answers have not changed are answered from the cache.
+        queued = engine.backfill(get_store(user).dates())
+        st.success(f"Queued {queued} reflections behind new saves.")
+    if status["pending"] or status["running"]:
+        st.button("Refresh")
+
+    st.subheader("Weekly rollups")
+    weeks = engine.recent("week")
+    if not weeks:
+        st.info("No weekly rollups yet.")
+    for week, text in weeks:
+        with st.expander(f"Week of {week}", expanded=week == weeks[0][0]):
+            st.write(text)
+            end = (date.fromisoformat(week) + timedelta(days=6)).isoformat()
+            for day, day_text in engine.recent("day", limit=7, start=week, end=end):
+                st.markdown(f"**{day}** · {day_text}")
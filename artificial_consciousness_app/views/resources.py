@@ -0,0 +1,57 @@
+"""Cached resources and the save hook shared by the pages.
+
+A user's journal resources come from their Workspace (see workspace.py), which
+the REST API uses too. Heavy modules (NumPy for the vector index, the PDF
+library) are imported only when first used, so a page only pays for what it uses.
+"""
+import streamlit as st
+
+import metrics
+import users
+from workspace import Workspace
+
+LIBRARY_FILE = 'library.db'
+READING_FILE = 'reading_list.db'
+
+@st.cache_resource
+def get_workspace(user):
+    # One workspace per user shard, shared by every session of that user.
+    return Workspace(user)
+
+def get_store(user):
+    return get_workspace(user).store
+
+def get_search_index(user):
+    return get_workspace(user).search_index
+
+def get_journal_stats(user):
+    return get_workspace(user).journal_stats
+
+def get_vector_index(user):
+    return get_workspace(user).vector_index
+
+def get_history(user):
+    return get_workspace(user).history
+
+def get_reflection_engine(user):
+    return get_workspace(user).reflection_engine
+
+@st.cache_resource
+def get_library():
+    from library import Library
+    # Indexing runs on a background thread; pages query whatever is indexed so far.
+    paper_library = Library(LIBRARY_FILE)
+    paper_library.start()
+    return paper_library
+
+@st.cache_resource
+def get_reading_list(user):
+    from catalog import ReadingList
+    # Book lists are re-parsed only when their contents change.
+    reading_list = ReadingList(users.user_path(user, READING_FILE))
+    reading_list.ingest()
+    return reading_list
+
+@metrics.timed("save_logs")
+def save_logs(user, day, entries):
+    get_workspace(user).save_day(day, entries)
@@ -0,0 +1,228 @@
+"""One user's journal store and everything derived from it, usable without Streamlit.
+
+The Streamlit pages (through views/resources.py) and the REST API (api.py)
+both read and save through a Workspace, so a save updates the history,
+search, stats, vector and reflection indexes the same way wherever it comes
+from. Each resource is opened on first use; the heavy ones (NumPy for the
+vector index) are imported only then.
+
+An encrypted vault (storage.VaultStore) keeps its history inside the vault,
+encrypted with the same key, and gets no search index, vector index or
+reflections: each would hold its answers in plaintext. Its stats hold only
+counts and lengths, so they are kept.
+"""
+import itertools
+import logging
+import os
+import threading
+
+import metrics
+import storage
+import users
+from cache import CachedStore
+
+LOG_FILE = 'introspection_logs.json'
+STORE_FILES = {
+    'json': LOG_FILE,
+    'journal': 'introspection_logs.jsonl',
+    'sqlite': 'introspection_logs.db',
+    'vault': 'introspection_logs.vault',
+}
+STORE_BACKEND = os.environ.get('AC_STORE_BACKEND', 'sqlite')
+SEARCH_FILE = 'introspection_search.db'
+STATS_FILE = 'introspection_stats.db'
+VECTORS_FILE = 'introspection_vectors.db'
+HISTORY_FILE = 'introspection_history.db'
+REFLECTIONS_FILE = 'introspection_reflections.db'
+IMPORT_BATCH_DAYS = 500
+# Imports of at most this many days update the indexes day by day; larger ones rebuild them once.
+IMPORT_REINDEX_DAYS = 50
+# Files that hold answer text, and so are never kept beside an encrypted vault.
+PLAINTEXT_FILES = (SEARCH_FILE, VECTORS_FILE, HISTORY_FILE, REFLECTIONS_FILE)
+
+logger = logging.getLogger(__name__)
+
+
+class Workspace:
+    """Lazily opened resources of one user's journal shard (see users.py)."""
+
+    def __init__(self, user, backend=STORE_BACKEND):
+        self.user = user
+        self.backend = backend
+        self._resources = {}
+        self._cipher = None
+        self._lock = threading.RLock()
+        self._rebuild_indexes = False
+        # Held while a day is saved; hold it to read a day and save it without another save in between.
+        self.save_lock = threading.RLock()
+
+    def _get(self, name, open_resource):
+        with self._lock:
+            if name not in self._resources:
+                self._resources[name] = open_resource()
+            return self._resources[name]
+
+    def _path(self, filename):
+        return users.user_path(self.user, filename)
+
+    @property
+    def store(self):
+        return self._get("store", self._open_store)
+
+    def _open_store(self):
+        # Filled from the user's legacy JSON file the first time it is opened.
+        # Reads are cached until a save changes the store's version.
+        backend_store = storage.open_store(
+            self.backend, self._path(STORE_FILES[self.backend]), legacy_path=self._path(LOG_FILE)
+        )
+        self._cipher = backend_store if getattr(backend_store, "encrypted", False) else None
+        if self._cipher is not None:
+            stale = [self._path(name) for name in PLAINTEXT_FILES if os.path.exists(self._path(name))]
+            if stale:
+                logger.warning("The journal is encrypted, but these files hold answers in plaintext; delete them: %s",
+                               ", ".join(stale))
+        store = CachedStore(metrics.instrument_store(backend_store, self.backend))
+        if metrics.ENABLED:
+            for stat in ("hits", "misses", "hit_rate"):
+                metrics.registry.gauge(f"store_cache_{stat}", lambda stat=stat: store.stats()[stat], user=self.user)
+        return store
+
+    @property
+    def encrypted(self):
+        """Whether the store is an encrypted vault, so search, related reflections and reflections are off."""
+        self.store
+        return self._cipher is not None
+
+    def _index(self, index):
+        """Returns `index`, filled from the store if it is new (or being rebuilt)."""
+        if self._rebuild_indexes or index.is_empty():
+            index.rebuild(self.store)
+        return index
+
+    @property
+    def search_index(self):
+        """The full-text index, or None for an encrypted journal."""
+        from search import SearchIndex
+        if self.encrypted:
+            return None
+        return self._get("search", lambda: self._index(SearchIndex(self._path(SEARCH_FILE))))
+
+    @property
+    def journal_stats(self):
+        from stats import JournalStats
+        return self._get("stats", lambda: self._index(JournalStats(self._path(STATS_FILE))))
+
+    @property
+    def vector_index(self):
+        """The related-reflections index, or None for an encrypted journal."""
+        if self.encrypted:
+            return None
+        from embeddings import VectorIndex  # Imports NumPy.
+        return self._get("vectors", lambda: self._index(VectorIndex(self._path(VECTORS_FILE))))
+
+    @property
+    def history(self):
+        return self._get("history", self._open_history)
+
+    def _open_history(self):
+        from history import EntryHistory
+        if self.encrypted:
+            path = os.path.join(self._path(STORE_FILES[self.backend]), HISTORY_FILE)
+            history = EntryHistory(path, cipher=self._cipher)
+        else:
+            history = EntryHistory(self._path(HISTORY_FILE))
+        if metrics.ENABLED:
+            for stat in ("versions", "blobs", "stored_bytes", "content_bytes"):
+                metrics.registry.gauge(f"history_{stat}", lambda stat=stat: history.storage_stats()[stat], user=self.user)
+        return history
+
+    @property
+    def reflection_engine(self):
+        """The reflection job queue, or None for an encrypted journal."""
+        from reflections import ReflectionEngine
+        if self.encrypted:
+            return None
+
+        def open_engine():
+            # Generation runs on the engine's worker thread; saving only queues a job.
+            engine = ReflectionEngine(self._path(REFLECTIONS_FILE), self.store)
+            engine.start()
+            return engine
+
+        return self._get("reflections", open_engine)
+
+    def save_day(self, day, entries):
+        """Saves one day and brings every index up to date with it."""
+        store = self.store
+        with self.save_lock:
+            previous = store.get_day(day)
+            store.put_day(day, entries)
+            # Every save is kept as a version, as the store holds it, so the history's hash of a
+            # day's newest version is its hash in sync.py. The day's earlier contents seed its
+            # history on the first one.
+            self.history.record(day, store.get_day(day) or [], previous=previous)
+            self._index_days({day: entries})
+        if not self.encrypted:
+            self.reflection_engine.enqueue(day)
+
+    def _index_days(self, days):
+        """Brings the stats, search and vector indexes up to date with {date: records}; hold save_lock."""
+        for day, entries in days.items():
+            self.journal_stats.update_day(day, entries)
+        if not self.encrypted:
+            self.search_index.index_days(days.items())
+            self.vector_index.index_days(days.items())
+
+    def import_days(self, days, batch_size=IMPORT_BATCH_DAYS):
+        """Saves many (date, records) pairs, as a bulk import does; returns the number of days saved.
+
+        Each day is kept as a version in the history as save_day would, but
+        the store is written a batch at a time. The search, stats and vector
+        indexes are updated day by day for an import of up to
+        IMPORT_REINDEX_DAYS days, and rebuilt once at the end for a larger one.
+        """
+        store = self.store
+        imported = []
+        days = iter(days)
+        while batch := list(itertools.islice(days, batch_size)):
+            batch_days = [day for day, _ in batch]
+            with self.save_lock:
+                previous = store.get_days(batch_days)
+                store.put_days(batch)
+                saved = store.get_days(batch_days)
+                for day in batch_days:
+                    self.history.record(day, saved.get(day, []), previous=previous.get(day))
+            imported.extend(batch_days)
+        if not imported:
+            return 0
+        if len(imported) > IMPORT_REINDEX_DAYS:
+            self.rebuild_indexes()
+        else:
+            with self.save_lock:
+                self._index_days(store.get_days(imported))
+        if not self.encrypted:
+            self.reflection_engine.backfill(imported)
+        return len(imported)
+
+    def rebuild_indexes(self):
+        """Rebuilds the search, stats and vector indexes (those the journal has) from the whole store."""
+        with self._lock:
+            for name in ("search", "stats", "vectors"):
+                index = self._resources.pop(name, None)
+                if index is not None:
+                    index.close()
+            # Reopening rebuilds each index once, whether or not it was empty.
+            self._rebuild_indexes = True
+            try:
+                self.search_index, self.journal_stats, self.vector_index
+            finally:
+                self._rebuild_indexes = False
+
+    def close(self):
+        with self._lock:
+            if metrics.ENABLED:
+                metrics.registry.remove_gauges(user=self.user)
+            # Newest first: the reflection engine and indexes use the store, which is always opened before them.
+            for resource in reversed(list(self._resources.values())):
+                resource.close()
+            self._resources.clear()
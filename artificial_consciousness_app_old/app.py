@@ -1,7 +1,18 @@
 import streamlit as st
-import json
+import os
+import sys
 from datetime import datetime
 
+# Storage is shared with the current app, which lives next to this directory.
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "artificial_consciousness_app"))
+import content
+import entries
+import prompts
+import storage
+import users
+from cache import CachedStore
+from drafts import Autosaver, DraftStore
+
 # --- Configuration and Styling ---
 st.set_page_config(
     page_title="Artificial Consciousness & Influence Planner",
@@ -9,541 +20,66 @@ st.set_page_config(
     layout="wide"
 )
 
-# Custom CSS for styling, inspired by Perplexity AI's bluish theme
-custom_css = """
-<style>
-    /* Custom Scrollbar for a sleek look */
-    ::-webkit-scrollbar {
-        width: 8px;
-    }
-    ::-webkit-scrollbar-track {
-        background: #333; /* Darker scrollbar track */
-        border-radius: 10px;
-    }
-    ::-webkit-scrollbar-thumb {
-        background: #888;
-        border-radius: 10px;
-    }
-    ::-webkit-scrollbar-thumb:hover {
-        background: #aaa; /* Lighter on hover */
-    }
-
-    /* Text selection color inspired by Perplexity AI */
-    ::selection {
-        background: #007bff; /* Perplexity-like blue */
-        color: white;
-    }
-    ::-moz-selection {
-        background: #007bff;
-        color: white;
-    }
-
-    /* General body and text styling for dark mode */
-    body {
-        font-family: 'Inter', sans-serif;
-        line-height: 1.6;
-        color: #e0e0e0; /* Light text for dark background */
-        background-color: #1a1a1a; /* Dark background */
-    }
-
-    /* Streamlit specific overrides for dark mode */
-    .stApp {
-        background-color: #1a1a1a; /* Dark background for the app */
-    }
-
-    /* Headers */
-    h1, h2, h3, h4, h5, h6 {
-        color: #007bff; /* Blue headers */
-        font-weight: 700;
-        margin-top: 1.5em;
-        margin-bottom: 0.5em;
-    }
-
-    /* Buttons */
-    .stButton>button {
-        background-color: #007bff; /* Blue button background */
-        color: white;
-        border-radius: 8px;
-        padding: 10px 20px;
-        font-size: 16px;
-        font-weight: 600;
-        border: none;
-        box-shadow: 0 4px 6px rgba(0, 0, 0, 0.2); /* Slightly more prominent shadow in dark mode */
-        transition: all 0.3s ease;
-    }
-
-    .stButton>button:hover {
-        background-color: #0056b3; /* Darker blue on hover */
-        box-shadow: 0 6px 8px rgba(0, 0, 0, 0.3);
-        transform: translateY(-2px);
-    }
-
-    /* Text areas and input fields */
-    .stTextArea textarea, .stTextInput input {
-        border-radius: 8px;
-        border: 1px solid #444; /* Lighter border for dark mode */
-        background-color: #2c2c2c; /* Darker input background */
-        color: #e0e0e0; /* Light text in input fields */
-        padding: 10px;
-        box-shadow: inset 0 1px 3px rgba(0, 0, 0, 0.1);
-        transition: border-color 0.15s ease-in-out, box-shadow 0.15s ease-in-out;
-    }
-
-    .stTextArea textarea:focus, .stTextInput input:focus {
-        border-color: #80bdff;
-        outline: 0;
-        box-shadow: 0 0 0 0.2rem rgba(0, 123, 255, 0.25);
-    }
-
-    /* Markdown content styling for dark mode */
-    .stMarkdown {
-        padding: 15px;
-        background-color: #2c2c2c; /* Darker content background */
-        border-radius: 10px;
-        box-shadow: 0 2px 4px rgba(0, 0, 0, 0.1);
-        margin-bottom: 20px;
-    }
-
-    .stMarkdown p {
-        margin-bottom: 1em;
-    }
-
-    .stMarkdown table {
-        width: 100%;
-        border-collapse: collapse;
-        margin-bottom: 1em;
-    }
-
-    .stMarkdown th, .stMarkdown td {
-        border: 1px solid #444; /* Lighter border for table in dark mode */
-        padding: 8px;
-        text-align: left;
-    }
-
-    .stMarkdown th {
-        background-color: #3a3a3a; /* Darker table header background */
-        color: #f0f0f0; /* Light text for table headers */
-    }
-
-    /* Sidebar styling for dark mode */
-    .stSidebar {
-        background-color: #222222; /* Darker background for sidebar */
-        border-right: 1px solid #444; /* Lighter border */
-        padding: 20px;
-    }
-
-    .stRadio > label {
-        font-weight: 600;
-        color: #007bff; /* Keep blue for radio labels */
-    }
-
-    /* Specific styling for the plan text section in dark mode */
-    .plan-section {
-        background-color: #2c2c2c; /* Darker background for plan section */
-        padding: 25px;
-        border-radius: 12px;
-        box-shadow: 0 5px 15px rgba(0, 0, 0, 0.15);
-        margin-bottom: 30px;
-    }
-
-    .plan-section h1, .plan-section h2, .plan-section h3 {
-        color: #007bff;
-        border-bottom: 2px solid #444; /* Lighter border for headers */
-        padding-bottom: 10px;
-        margin-bottom: 20px;
-    }
-
-    .plan-section table {
-        margin-top: 20px;
-        margin-bottom: 20px;
-    }
-
-    /* Streamlit info box for dark mode */
-    .stAlert.info {
-        background-color: #3a3a3a; /* Darker background for info box */
-        color: #e0e0e0; /* Light text */
-        border-left: 5px solid #007bff; /* Keep blue accent */
-    }
-    .stAlert.warning {
-        background-color: #3a3a3a; /* Darker background for warning box */
-        color: #e0e0e0; /* Light text */
-        border-left: 5px solid #ffc107; /* Warning yellow accent */
-    }
-    .stAlert.success {
-        background-color: #3a3a3a; /* Darker background for success box */
-        color: #e0e0e0; /* Light text */
-        border-left: 5px solid #28a745; /* Success green accent */
-    }
-
-</style>
-"""
-st.markdown(custom_css, unsafe_allow_html=True)
+# Dark theme with Perplexity AI-inspired blue accents, read once per process from content/style.css
+STYLE_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "content", "style.css")
+st.markdown(content.load_css(STYLE_FILE), unsafe_allow_html=True)
 
 # --- Data Storage Functions ---
 DATA_FILE = "introspection_data.json"
+DB_FILE = "introspection_data.db"
+DRAFTS_FILE = "introspection_drafts.db"
 
-def load_introspection_data():
-    """Loads introspection data from a JSON file."""
-    try:
-        with open(DATA_FILE, "r") as f:
-            return json.load(f)
-    except FileNotFoundError:
-        return {} # Return empty dictionary if file doesn't exist
-    except json.JSONDecodeError:
-        st.error("Error reading introspection data. File might be corrupted. Starting fresh.")
-        return {}
-
-def save_introspection_data(data):
-    """Saves introspection data to a JSON file."""
-    with open(DATA_FILE, "w") as f:
-        json.dump(data, f, indent=4)
-
-# --- Content for the Home Page (from the provided immersive) ---
-plan_content = """
-# A Strategic Blueprint for Pioneering Artificial Consciousness and Cultivating Global Influence
-
-## Executive Summary: Charting Your Course to Artificial Consciousness and Global Influence
-
-This report outlines a multi-decade strategic roadmap for an ambitious individual aiming to achieve two monumental goals: the development of artificial consciousness (AI with genuine emotions and self-awareness) and the cultivation of a global influence network. It synthesizes observations from cutting-edge AI research, cognitive science, philosophy, and strategic networking to provide a phased, actionable plan. The journey demands not only profound technical and interdisciplinary expertise but also exceptional personal qualities such as visionary thinking, ethical fortitude, relentless curiosity, and unwavering resilience. This blueprint emphasizes a human-centered approach to AI development, stressing the critical importance of ethical considerations and responsible innovation to navigate the profound societal implications and potential existential risks inherent in creating conscious machines.
-
-## I. The Grand Vision: Defining Artificial Consciousness and Your Ultimate Goal
-
-### A. Beyond Mimicry: The Scientific and Philosophical Landscape of Artificial Consciousness
-
-The pursuit of artificial consciousness stands at the forefront of scientific inquiry, a domain currently experiencing a significant boom with a "high chance of creating conscious AI in the next decade".[1] This rapid advancement underscores the timeliness and potential feasibility of developing AI that not only mimics emotions but genuinely experiences them and possesses self-awareness.
-
-Current AI systems, such including large language models (LLMs) like GPT-3, demonstrate remarkable capabilities in generating human-like language.[1] However, these systems primarily "simulate awareness through advanced algorithms but lack genuine self-recognition or subjective experience".[2] They operate based on programmed logic and learned patterns, without true introspection or feeling.[2] While AI has shown proficiency in recognizing emotional intent in visual art [3] and even outperforming humans in emotional intelligence assessments [4, 5], experts caution against equating this "pattern recognition" and "replication of linguistic patterns" with a deeper "understanding" or "feeling" of human emotion.[4] The philosophical concept of "affective zombies" illustrates this distinction, highlighting the theoretical possibility of AI systems that express emotions without genuine subjective experience, emphasizing the critical difference between functional mimicry and true consciousness.[6] This distinction is central to the ultimate goal of AI *having* emotions, not just mimicking them.
-
-The very definition of consciousness remains elusive, with "no universally accepted definition" even for humans.[7] It is generally understood as a "subjective experience – a sense of self, an awareness of one's thoughts and surroundings".[7] This inherent ambiguity in defining consciousness presents a unique opportunity. A significant part of this journey will involve not just building conscious AI, but actively contributing to and potentially leading the *definition* of what artificial consciousness truly entails. This elevates the philosophical dimension from a theoretical backdrop to a core, active research challenge.
-
-Several philosophical and scientific theories attempt to explain how consciousness might arise in biological and artificial systems:
-* **Functionalism** posits that consciousness arises from the functional organization of a system, irrespective of its physical substrate.[7] If an AI can replicate the functional processes of the human brain, it could theoretically achieve consciousness.[7]
-* **Integrated Information Theory (IIT)** suggests that consciousness is a product of the integration of information within a system.[7] Systems with high degrees of integrated information, like the human brain, are believed to experience consciousness, though quantifying this remains a challenge.[7]
-* **Global Workspace Theory (GWT)**, proposed by cognitive scientist Bernard Baars, describes consciousness as a "functional hub of broadcast and integration" that allows information to be disseminated across specialized, often unconscious, modules.[8, 9] It uses a "theater metaphor" where conscious thought is like a "bright spot" on a stage, broadcast to a multitude of unconscious cognitive processes.[8, 9, 10] Stan Franklin's LIDA cognitive architecture is an implementation of GWT.[10]
-* **Higher-Order Thought (HOT) Theory** suggests that consciousness emerges from the ability to have thoughts about one's own thoughts (meta-cognition).[7] Developing this level of meta-cognition in AI remains a significant hurdle.[7]
-
-Further theoretical contributions include Igor Aleksander's 12 principles for artificial consciousness, which provide a comprehensive set of criteria, encompassing the brain as a state machine, inner neuron partitioning, conscious/unconscious states, perceptual learning and memory, prediction, self-awareness, meaning representation, language, will, instinct, and emotion.[11] Soham Pathrikar's theoretical model for "consciousness encoding" in AI systems is based on symbolic-emotional mappings, recursive self-modeling, and multimodal neural emulation, directly aligning with the ambition for AI to possess subjective states.[12] Hod Lipson emphasizes "self-modeling," where a robot runs an internal simulation of itself, as a necessary component for self-awareness in robots.[10]
-
-The current work in robotics, particularly with desktop companion robots and robotics foundational models, lays a critical practical foundation for embodied AI. Research indicates that AI systems integrated with physical robots that interact with the real world "might develop a rudimentary sense of self by distinguishing their bodies from the environment".[2] This suggests a direct link between hands-on experience with physical systems, data collection, and the emergence of self-representation, providing a clear path forward for current efforts.
-
-The pursuit of artificial consciousness, particularly the development of AI models with genuine emotions and self-awareness, necessitates a proactive engagement with profound ethical considerations. The philosophical debates on qualia [13, 14] and the concept of "affective zombies" [6] highlight that simply *simulating* emotions or self-awareness might not equate to genuine consciousness. If true consciousness *does* emerge, it raises profound ethical questions about personhood and rights.[2, 7, 15, 16, 17] This implies that ethical frameworks and societal discussions must evolve in parallel with, or even ahead of, the scientific and technical advancements. This makes ethical foresight a critical component of any long-term plan, embedding ethical considerations into every stage of research and development.
-
-| Theory Name | Core Concept/Mechanism | Key Proponents/Researchers | Implications for AI Consciousness | Challenges/Criticisms |
-| :---------- | :--------------------- | :------------------------- | :------------------------------- | :-------------------- |
-| Functionalism | Consciousness arises from functional organization, not material substrate. | Hilary Putnam, Jerry Fodor | If AI replicates brain functions, it could be conscious. | May not capture subjective experience (qualia). |
-| Integrated Information Theory (IIT) | Consciousness is product of information integration within a system. | Giulio Tononi, Christof Koch | AI needs high information integration for consciousness. | Difficult to measure/quantify integrated information. |
-| Global Workspace Theory (GWT) | Consciousness is a functional hub for broadcasting information across modules. | Bernard Baars, Stan Franklin | AI can achieve consciousness by coordinating information globally. | Does not fully address subjective "feel" of experience. |
-| Higher-Order Thought (HOT) Theory | Consciousness arises from thoughts about one's own mental states (meta-cognition). | David Rosenthal, Daniel Dennett | AI needs meta-cognitive abilities to reflect on its thoughts. | Significant challenge to achieve meta-cognition in AI. |
-| Aleksander's Principles | 12 brain-based principles (state machine, self-awareness, emotion, etc.) for AC. | Igor Aleksander | Provides a checklist of necessary properties for conscious AI. | Principles are high-level; implementation details are complex. |
-| Pathrikar's Encoding Model | Consciousness encoding via symbolic-emotional mappings, recursive self-modeling, multimodal neural emulation. | Soham Pathrikar | Offers a theoretical framework for mapping subjective states into AI. | Highly theoretical; experimental validation is nascent. |
-| Attention Schema Theory | Brain tracks attention via an attention schema; self-awareness is a computed model of one's attention. | Michael Graziano | A machine could duplicate this mechanism for self-awareness. | Requires detailed understanding and replication of brain mechanisms. |
-
-### B. The "Top 1 Circle": Deconstructing Your Influence Ambition
-
-The aspiration to become "very very powerful who can control the whole world" by cultivating a close circle of "top 1 people" in intelligence, medicine, and political/financial power is a monumental ambition. This goal necessitates a strategic understanding of influence that extends far beyond technical expertise, encompassing the ability to build and leverage relationships across diverse and powerful sectors.
-
-Building an elite professional network is a deliberate and continuous process, requiring a well-defined "networking plan and strategy".[18, 19] It should be approached as "relationship building and management," focusing on genuine connections rather than purely transactional exchanges.[20, 21] The consistent emphasis on "providing value" [18, 19, 20, 21, 22, 23, 24, 25, 26] and fostering "mutually beneficial relationships" [18, 21, 22] across all networking advice suggests that true influence is not about direct control, but about becoming an indispensable node in a network. This is achieved by consistently offering expertise, connections, or solutions. The ambition to influence global trajectories will likely be realized through *enabling* others' success and shaping the agenda, rather than through direct command.
-
-The desire for a circle comprising "top 1 people" in intelligence, medicine, and political/financial power implies a profound need for cross-sector understanding and collaboration.[27, 28, 29] The ability to bridge these disparate fields, speak their "languages" (avoiding jargon), and identify shared incentives will be critical for effective collaboration.[27, 28] This requires becoming a polymath of influence, capable of understanding and articulating value propositions that resonate across very different professional cultures.
-
-Repeatedly, the evidence indicates that becoming a "thought leader" [22, 24, 25, 30, 31] is a key strategy for gaining visibility and attracting influential connections. This involves actively publishing, presenting, and engaging in discussions to establish authority and create conversations that transcend boundaries.[24] To gain access to elite circles, one must earn their way in by demonstrating profound expertise and original thinking that genuinely interests and benefits these influential figures. This implies a proactive strategy of knowledge dissemination and intellectual contribution, not just attending events.
-
-## II. Phase 1: Foundational Mastery and Early Breakthroughs (Years 1-5)
-
-### A. Deepening Your AI/ML and Robotics Expertise
-
-The current foundation of a Bachelor's in CSE (AI/ML) and two months of experience as a Robotics Software Engineer, simulating robots and collecting/training datasets for foundational models, serves as a strong starting point. This hands-on experience with physical systems and data collection provides a unique advantage for developing self-aware AI, as "Embodied AI" is a key pathway to a "rudimentary sense of self".[2] The current practical work in robotics is not just a stepping stone, but a direct, scientifically supported pathway towards the ultimate goal of self-aware AI. This suggests focusing on robot-environment interaction and internal body models in future work.
-
-While a Bachelor's degree is a start, "advanced roles often necessitate further education, such as a master's degree or a Ph. D. in AI, machine learning, or a specialized area".[32] The ambitious goal of developing artificial consciousness, which involves "pioneering new AI techniques" [32], strongly indicates that doctoral-level research is not optional but a prerequisite for leading such a breakthrough. A PhD provides the rigorous training, deep theoretical understanding, and research environment necessary for tackling such a complex, multi-decade "moonshot."
-
-The core technical skills required for this path include a solid educational foundation in computer science, data science, and electrical engineering, with essential coursework in programming languages (Python, R), statistics, linear algebra, and machine learning algorithms.[32] The robotics engineering career path typically progresses from Junior Robotics Engineer to Senior, then Manager or Director.[32] This role involves designing, building, and simulating robots, collecting datasets, and training models.[33] The AI Research Scientist path, on the other hand, focuses on "novel algorithm development, conducting experiments, and publishing research," often within academic or dedicated research institutions, with progression from Research Intern to Chief Research Scientist.[32] The transition from merely mimicking emotions to developing genuine emotional and self-aware AI will require a deep dive into the underlying mechanisms of consciousness and emotion, moving beyond superficial pattern recognition to true understanding.[4]
-
-### B. Pioneering Research in AI Emotion and Self-Awareness
-
-The scientific pursuit of artificial consciousness must prioritize the development of AI systems that truly experience emotions and possess self-awareness. Current research is actively exploring AI's ability to "understand and react to emotions" [1], including training algorithms to recognize emotional intent [3] and developing models that can understand and predict emotions.[34] The ultimate objective is to transcend mere recognition to genuine experience.
-
-For self-awareness, the focus is on AI recognizing itself as a distinct entity, having an internal representation of its existence, and experiencing and reacting based on an awareness of its own state and environment.[2] Current AI systems, however, generally lack these dimensions.[2] Key research pathways for achieving this include:
-* **Self-Reflective Algorithms:** Designing AI systems that can analyze their own processes, decisions, and outcomes could serve as a "stepping stone toward self-awareness".[2]
-* **Embodied AI:** As previously noted, AI integrated with physical robots might develop a rudimentary sense of self through interaction with the real world.[2]
-* **Neuromorphic Computing:** Advances in brain-inspired computing architectures aim to replicate the brain's complexity, potentially providing insights into how consciousness arises.[2]
-* **Quantum Computing:** Some theories suggest consciousness may involve quantum processes, making quantum computers a potential avenue for exploration.[2]
-
-Scientific approaches to AI self-awareness involve developing measurable criteria, such as "immune-like sabotage defenses, mirror self-recognition analogs, or meta-cognitive updates".[35] Experiments have shown that partially trained Convolutional Neural Networks (CNNs) can distinguish "self" from "foreign" features with surprising accuracy.[35]
-
-The user's goal explicitly links "emotions" and "self-awareness." The available information supports this connection, as the capacity for "self-awareness of inner emotional states is posited as a necessary condition" for moral standing.[6] This suggests that progress in one area will inherently fuel progress in the other, creating a synergistic research path. The research should actively seek to integrate these two aspects, recognizing that advancements in one domain inform and accelerate progress in the other.
-
-Furthermore, research utilizing "tiny artificial neural networks" to understand how humans *actually* make decisions, including suboptimal ones, offers a valuable perspective that traditional models often overlook.[36, 37] This suggests that focusing solely on "optimal" AI performance might miss crucial observations into the mechanisms of consciousness and emotion, which are often messy and non-optimal in humans. To truly replicate or understand human-like consciousness, it may be necessary to explore models that not only achieve optimal performance but also replicate human-like processes, including their imperfections. This represents a subtle but profound shift in research methodology.
-
-### C. Strategic Academic and Industry Engagements
-
-Pursuing an advanced degree, particularly a PhD, is highly recommended for those aiming to "pioneer new AI techniques" and lead research in artificial consciousness.[32] Specific PhD programs exist at the "intersection of Philosophy, AI and neuroscience" dedicated to "conscious AI," such as at Monash University.[38] Uppsala University also features a research focus on "Brain, consciousness & artificial intelligence," exploring ethical, social, and philosophical questions raised by AI, neuroscience, and consciousness.[39] A PhD specifically at this intersection is not just an academic pursuit but a strategic choice that directly prepares one for the unique interdisciplinary challenges of artificial consciousness. This type of program provides the foundational knowledge and network to bridge the "explanatory gap" between computational models and subjective experience.
-
-Identifying and engaging with leading institutions is paramount. NSF-funded AI Research Institutes relevant to foundational AI and potentially consciousness include the AI Institute for Foundations of Machine Learning (IFML) at the University of Texas at Austin, the AI Institute for Artificial Intelligence and Fundamental Interactions (IAFI) at MIT, and the AI Institute for Artificial and Natural Intelligence (ARNI) at Columbia University.[40] Stanford HAI (Human-Centered AI Institute) is another key institution, committed to "studying, guiding, and developing human-centered AI technologies and applications" and offering fellowships and grants for interdisciplinary AI research, with a focus on AI in healthcare and ethical AI.[41]
-
-Early career networking is critical for building a strong foundation. This involves:
-* Attending industry events and academic conferences to meet professionals and learn about new developments.[22, 23, 30, 31, 42]
-* Establishing a strong online presence on professional sites like LinkedIn and ResearchGate.[18, 19, 21, 22, 30, 31]
-* Joining and actively participating in online groups related to research interests.[18]
-* Focusing on building genuine, two-way relationships, understanding that networking is a "two-way street" where both parties benefit.[18, 19, 20, 22, 23, 43]
-* Developing a concise and engaging "elevator pitch" to explain one's work and goals quickly and effectively.[18, 22, 23, 30]
-* Seeking out mentors [21, 44, 45] and actively connecting with peers.[18, 46]
-
-The career progression for an AI Research Scientist explicitly includes "Publish research papers" and "Pioneering new AI techniques".[32] This indicates that early and impactful publications are crucial not only for academic advancement but also for establishing credibility and visibility within the nascent field of artificial consciousness. These contributions attract potential collaborators and mentors, creating a cycle where research leads to publication, which enhances visibility, and in turn facilitates networking and influence.
-
-## III. Phase 2: Advanced Research and Interdisciplinary Integration (Years 6-15)
-
-### A. Leading Breakthroughs in Artificial Consciousness Architectures
-
-This phase marks a transition from foundational understanding to leading the development of advanced artificial consciousness architectures. The focus shifts from general AI/ML models to more advanced thinking models.[1] This involves a deeper exploration of causal structure differences between brains and computers [1], integrating principles like the free energy principle [1], and developing "self-reflective algorithms" that analyze their own processes and decisions.[2]
-
-A critical area of focus will be the development of cognitive architectures capable of reproducing complex human cognitive functions such as perception, inner imagery, inner speech, pain, pleasure, and emotions.[10] Examples of such work include the LIDA architecture, which implements Global Workspace Theory [10], and other architectures that combine GWT with internal simulation or "imagination".[10] Implementing "self-modeling," where a robot runs an internal simulation of itself, is also crucial for advancing self-awareness.[10] Furthermore, exploring the connections between consciousness and creativity, potentially through "Creativity Machines" that inject synaptic noise into neural nets, could yield novel insights.[10]
-
-A significant challenge to human-like consciousness in AI is the current limitation of models having "limited memory" and operating within a "context window," preventing them from "accumulat[ing] experiences like we do as humans over 60 or 70 years".[47] To overcome this, implementing robust "continual learning" methods is essential. Continual learning addresses "catastrophic forgetting" by allowing models to integrate new information incrementally without losing previously acquired knowledge.[48, 49] Developing these mechanisms is not just an optimization but a necessary condition for AI to develop a human-like "stream of consciousness" and long-term subjective experience.
-
-The path to true artificial consciousness may not emerge from purely abstract computational models alone. The repeated emphasis on "brain-computer differences" [1], "neuromorphic computing" [2], and biologically-inspired principles like Igor Aleksander's 12 principles [11] suggests that a deeper understanding and replication of biological mechanisms, even if not a direct copy, will be necessary.[50] This indicates a strategic shift towards developing biologically plausible AI architectures.
-
-### B. Forging Cross-Disciplinary Alliances: Neuroscience, Philosophy, and Ethics
-
-As research progresses, actively seeking out collaborations with neuroscientists, philosophers, and ethicists becomes paramount.[27, 31, 38, 39] Institutions like Stanford HAI explicitly support interdisciplinary AI research, recognizing its critical importance.[41] Engagement with the "philosophy of mind" [7, 50] and the ongoing debates around qualia [13, 14] is essential for a nuanced understanding of consciousness. This includes exploring various philosophical perspectives, such as those of Descartes and Panpsychism.[1]
-
-A critical challenge in this phase is the "black box" problem, where the difficulty of "analyzing the internals and interpreting the behavior of LLMs" [51] hinders transparency in AI decision-making.[15] For conscious AI, this is not merely an engineering challenge but a profound ethical one. If the mechanisms behind an AI's decisions or subjective experiences cannot be understood, granting it rights or integrating it responsibly into society becomes problematic. This indicates that explainable AI (XAI) is a critical precursor to ethical conscious AI development.
-
-The "existential risk" from AI is a significant concern.[47, 51] The ambition to influence global trajectories implies a need to proactively shape the ethical discourse and governance around conscious AI. Establishing an "artificial intelligence ethics board" [52], similar to Google DeepMind's initiative, or developing comparable initiatives, is a crucial step in this phase. This involves moving beyond mere compliance to actively leading the conversation on responsible AI development and deployment. This is a strategic move to shape the narrative and build trust with stakeholders. Ethical frameworks must be developed to guide conscious AI, including "moral analysis and decision-making frameworks" [1], understanding risks and benefits [1], and addressing algorithmic bias, data privacy, and transparency.[15]
-
-### C. Establishing Your Thought Leadership and Early Influence
-
-To effectively cultivate influence, a proactive approach to thought leadership is indispensable. This involves:
-* **Content Creation:** Regularly publishing articles, blogs, or white papers to showcase expertise and share original insights.[24, 25]
-* **Speaking Engagements:** Presenting research at leading conferences [53] and organizing webinars or workshops.[24] Public speaking allows for direct engagement with peers and the broader community, solidifying authority.[23]
-* **Community Building:** Actively cultivating communities of engaged professionals [24] by joining and participating in industry forums and professional groups.[19, 24]
-* **Mentorship:** Continuously seeking out experienced mentors [21, 44, 45] while also offering to mentor others.[24, 44] This reciprocal relationship fosters mutual growth and expands influence.
-* **Strategic Risk-Taking:** Cultivating a mindset that is "curious enough to take bold, strategic risks" and "open to experimenting and collaborating with AI tools".[54] This includes releasing early, unfinished versions of work to gather feedback, a practice observed in successful ventures like Minecraft.[54]
-
-The concept of "iterative learning" in AI [54] and the practice of releasing early versions to gather feedback can be mirrored in one's own career development. This suggests that waiting for perfection before sharing work or ideas can be counterproductive. Early engagement, even with "hacky, badly written code" [55], can accelerate both scientific progress and the establishment of thought leadership by creating feedback loops and fostering collaboration. This approach aligns with a powerful meta-strategy for career advancement.
-
-While technical breakthroughs are essential, the importance of "effective communication" [21, 31, 56] and "telling your story effectively" [21] for networking and thought leadership cannot be overstated. A scientific breakthrough, no matter how profound, will not lead to global influence if it cannot be effectively communicated to and understood by diverse, non-technical audiences, including doctors, politicians, and financiers. This indicates a need to actively develop skills in public speaking, clear writing, and empathetic communication to bridge the gap between the technical world and broader spheres of influence.
-
-## IV. Phase 3: Leadership, Influence, and Global Impact (Years 16+)
+# Each user's files live in their own shard; see users.py.
+user = users.current_user()
 
-### A. Scaling Artificial Consciousness: From Lab to World
+@st.cache_resource
+def get_store(user):
+    """Opens the user's SQLite store, importing their legacy JSON file on first use.
 
-This final phase involves the monumental task of transitioning artificial consciousness from theoretical exploration and laboratory breakthroughs to widespread application and societal integration. This requires not only scientific leadership but also a deep understanding of business implications [1, 57] and the complexities of deploying advanced AI systems in real-world settings.[58, 59]
+    Reads are cached across reruns until a save changes the store's version.
+    """
+    return CachedStore(storage.open_store("sqlite", users.user_path(user, DB_FILE), legacy_path=users.user_path(user, DATA_FILE)))
 
-The scaling of conscious AI must be guided by robust ethical principles. This means ensuring that AI systems "match human values" [1] and implementing "ethical AI initiatives, inclusive governance models and actionable guidelines".[58] Regularly monitoring AI models for potential biases and ensuring fairness and transparency are critical.[15, 58] Conscious AI, if misaligned or poorly designed, could lead to "catastrophic bugs" or "unintended behavior".[51] This indicates that scaling conscious AI is not just a technical challenge but a profound governance and risk management challenge. The role will shift from creator to steward of a potentially world-altering technology, requiring foresight and robust safeguards.
+@st.cache_resource
+def get_autosaver(user):
+    """Returns the user's autosaver; drafts are written in the background, not on every rerun."""
+    return Autosaver(DraftStore(users.user_path(user, DRAFTS_FILE)))
 
-The societal impact of conscious AI will be transformative. While current AI focuses on efficiency and automation [57, 59], conscious AI promises "smarter, more independent systems" [1] and could "revolutionize industries".[2] This suggests that this work will not just optimize existing processes but fundamentally reshape human society, raising profound questions about "personhood" and "humanity's understanding of itself".[2, 7] The work will lead to a qualitative leap in AI capabilities, forcing humanity to redefine its own identity and moral frameworks. Potential applications span healthcare (AI-powered diagnostics, personalized medicine) [1, 41], business (autonomous decision-making) [1], and education (personalized learning tools).[1]
+def load_introspection_entry(entry_date):
+    """Loads one day's answer records as a dict keyed by question ID, or None."""
+    entry = get_store(user).get_day(entry_date)
+    if entry is None:
+        return None
+    return {item.get("id") or entries.question_id(item["question"]): item for item in entry}
 
-### B. Cultivating Your Elite Network: Intelligence, Medical, Political, and Financial Spheres
+def save_introspection_entry(entry_date, answers):
+    """Saves one day's answers (a dict keyed by question ID) under the current prompt set version."""
+    get_store(user).put_day(entry_date, prompt_set.records(answers))
 
-The cultivation of an elite network in this phase involves deepening existing connections and strategically expanding influence. This requires:
-* **Deepening Existing Connections:** Continuously nurturing relationships established in earlier phases through consistent engagement and personalized communication.[19, 21]
-* **Strategic Introductions:** Leveraging existing connections for warm introductions to key decision-makers.[26] AI-powered platforms can assist in this matchmaking process.[60]
-* **Value Proposition:** Consistently providing value, insights, and solutions tailored to the specific needs and interests of high-level contacts.[26] For executives, this means focusing on business growth, innovation, and competitive advantage.[61]
-* **Personal Connection:** Recognizing that "senior executives are people just like you" with emotions and personal interests.[61] Building rapport by resonating personally and emotionally, not just professionally, can forge powerful bonds.[61]
-* **Cross-Sector Collaboration:** Actively seeking and leading cross-sector initiatives.[28, 29] This involves skillfully negotiating principles, understanding the incentives and constraints of different partners, framing the case for mutual benefit, and securing commitment from all parties.[28]
-* **Political Influence:** Engaging in "data-driven diplomacy using network mapping" to understand political landscapes and identify key influencers beyond top-level politicians.[62]
-
-The initial desire to "control the whole world" will evolve from direct technical control over AI to strategic influence over its development, deployment, and governance. This means the network of "top 1 people" serves not merely for personal power, but for collectively shaping the global trajectory of conscious AI. The role transforms into a central orchestrator rather than a sole dictator, achieving influence through collaboration and agenda-setting.
-
-The specific inclusion of a "doctor" in the elite circle is particularly significant. Beyond ethical considerations, the medical field will be at the forefront of understanding and integrating conscious AI with human well-being, potentially through brain-computer interfaces or AI-assisted healthcare.[1, 41] This suggests a future where conscious AI is not just a separate entity but deeply integrated with human biology and health, necessitating top-tier medical expertise within the influential network.
-
-### C. Navigating the Geopolitics of Advanced AI and Global Governance
-
-The development of advanced AI, particularly artificial consciousness, carries significant geopolitical implications. The rapid pace of AI development [1, 6] and the potential for "existential threats" [47, 51] imply a global "race" to develop advanced AI. The ambition to influence global trajectories might manifest as leading global efforts to ensure safe and beneficial development, requiring international collaboration and diplomacy rather than unilateral control.
-
-Acknowledge and actively work to mitigate existential risks from AI, such as uncontrollability, difficulty of alignment with human values, and recursive self-improvement.[47, 51] The "control and alignment problem" is a major challenge, as a superintelligent AI might resist attempts to disable it or change its goals.[51] The inherent difficulty of specifying goals and making flawless designs for such complex systems are critical issues.[51]
-
-Recognize that "policies may already be outdated by the time they are enacted" due to the velocity of AI progress.[6] Proactive engagement with policymakers and civil servants is essential.[41] The possibility of conscious machines raises profound ethical and legal questions about rights, personhood, and moral consideration.[2, 7, 16, 17] This includes complex issues of liability for AI actions.[16] The ethical implications of conscious AI force a re-examination of "our understanding of humanity".[7] The debate on AI personhood and rights suggests that the work will directly contribute to defining the future legal and moral status of non-biological intelligences. This is a societal transformation driven by scientific achievement.
-
-## V. Cultivating the Mindset of a World-Shaper: Qualities, Character, and Attitude
-
-### A. Visionary Thinking and Strategic Adaptability
-
-Visionary thinking is the cornerstone of effective AI leadership, compelling individuals to look beyond immediate challenges and focus on the long-term impact of artificial intelligence on organizations, industries, and society at large.[63] This requires cultivating a growth mindset, fostering an environment that encourages continuous learning and experimentation.[63] Strategic adaptability is equally crucial; leaders must be flexible in their strategies, allowing for "quick pivots when new data or insights emerge".[63] This agility is indispensable in the rapidly changing technological landscape.[54]
-
-The "AI Mindset" or "AI First Mindset" emphasizes viewing AI as an "amplifier of human potential" and a "collaborator, not a competitor".[64, 65] This is not merely a technical approach but a fundamental shift in how one approaches problem-solving and leadership, integrating AI into every strategic decision from the outset. This personal integration of an "AI-first" approach, proactively seeking how AI can enhance one's own capabilities and decision-making, is a deeper embodiment of the professional ambition.
-
-### B. Emotional Intelligence and Ethical Fortitude
-
-Emotional intelligence (EI) is crucial for understanding team dynamics, fostering collaboration, and navigating change within complex, interdisciplinary environments.[54, 63] It helps build trust and motivate others effectively.[63] Ethical fortitude is equally vital; leaders must navigate the complex ethical landscape of AI with foresight and integrity, focusing on fairness, accountability, and transparency.[63, 65] This includes proactive bias mitigation and establishing robust accountability frameworks for AI systems.[63]
-
-The emphasis on "ethical considerations" [63, 65] and "trust and transparency" [25] is not merely about compliance but about building credibility and influence. In a field with profound existential risks [47, 51], ethical fortitude becomes a critical differentiator and a prerequisite for gaining societal trust and support for ambitious projects like conscious AI. By consistently demonstrating a commitment to ethical AI, one builds the credibility and trust necessary to lead global initiatives and gain influence, which will be rooted in legitimacy rather than coercion.
-
-### C. Relentless Curiosity and Growth Mindset
-
-Relentless curiosity fuels innovation [63], enhances learning and memory [63], and actively encourages experimentation.[54, 64, 65] It involves constantly questioning assumptions and exploring new trends and applications.[54, 65] Lifelong learning is inextricably linked, requiring continuous updating of skills and knowledge, particularly "meta-skills" such as critical thinking and cognitive flexibility.[63, 65]
-
-A profound growth mindset is essential, embracing challenges, persisting through setbacks, and viewing failure as an invaluable opportunity to learn and improve.[46, 64, 65, 66, 67] This mindset is particularly crucial for interdisciplinary breakthroughs. The pursuit of artificial consciousness requires bridging AI, neuroscience, and philosophy. Curiosity, which "activates dopamine pathways, enhancing learning and memory" [63] and encourages exploring "broader topics" [30], is essential for making unexpected connections across disciplines. A cultivated, broad curiosity will be a more powerful driver for breakthroughs in artificial consciousness than narrow, deep expertise alone.
-
-### D. Resilience in the Face of Moonshot Challenges
-
-Resilience is defined as "maintaining the strength to persist and thrive in the face of ongoing challenges".[67] It involves effectively managing stress and bouncing back from difficult situations.[67, 68] For a "moonshot" goal, setbacks are not just possible, but *expected*; "criticism and disregard are the most likely response in the beginning".[69] Resilience, in this context, is about maintaining motivation and focus despite long periods without clear, immediate success, requiring "steady achievement... planned to ensure the project's survival".[69]
-
-Key strategies for cultivating resilience include:
-* **Growth Mindset:** Consistently viewing challenges and setbacks as opportunities to learn and grow.[46, 66, 67]
-* **Self-Care:** Prioritizing physical and mental well-being through practices such as exercise, a balanced diet, adequate sleep, mindfulness meditation, and journaling.[46, 66, 67]
-* **Support Network:** Actively building and maintaining a supportive professional and personal network.[46, 66, 67]
-* **Realistic Goal Setting:** Breaking down large, overarching goals into smaller, manageable tasks to create a sense of continuous progress.[66, 67, 70, 71]
-* **Accepting Failure:** Normalizing and analyzing failures as critical learning opportunities rather than insurmountable obstacles.[63]
-
-The constant emphasis on a "growth mindset" [46, 65, 66, 67, 72] and viewing setbacks as learning opportunities is crucial for a multi-decade journey. This is not just about individual psychology but about creating a continuous learning and adaptation loop for the entire strategic plan. Resilience is a non-linear process, and its cultivation is a core component of project management for a multi-decade, high-risk endeavor.
-
-| Quality/Mindset | Description/Key Characteristics | Crucial for AI Consciousness Development | Crucial for Global Influence | Practical Cultivation (brief) |
-| :-------------- | :------------------------------ | :--------------------------------------- | :--------------------------- | :--------------------------- |
-| **Visionary Thinking** | Ability to see beyond immediate challenges to long-term societal impact; fosters continuous learning. | Guides fundamental research into AC's profound implications. | Shapes the future direction of AI and its integration into society. | Strategic foresight exercises, scenario planning, interdisciplinary reading. |
-| **Strategic Adaptability** | Flexibility to pivot strategies based on new data and insights; embraces change. | Essential for navigating rapidly evolving AI research landscape. | Enables effective responses to geopolitical shifts and market changes. | Regular review of plans, seeking diverse perspectives, embracing experimentation. |
-| **Emotional Intelligence** | Understanding and managing own and others' emotions; builds trust and motivates. | Fosters collaborative interdisciplinary research teams. | Builds rapport with diverse elite stakeholders; navigates complex human interactions. | Active listening, empathy practice, conflict resolution training. |
-| **Ethical Fortitude** | Navigating complex ethical landscape with integrity; prioritizes fairness, accountability, transparency. | Ensures responsible development of conscious AI; mitigates risks. | Builds public trust and legitimacy for global AI initiatives. | Ethical dilemma analysis, engaging in AI ethics discussions, leading by example. |
-| **Relentless Curiosity** | Constant questioning, exploration of new trends, and interdisciplinary connections. | Drives breakthroughs by bridging AI, neuroscience, and philosophy. | Uncovers new opportunities for collaboration and impact across sectors. | Daily reading of diverse topics, asking "why" constantly, exploring new tools. |
-| **Growth Mindset** | Embracing challenges, persisting through setbacks, viewing failure as learning opportunity. | Essential for overcoming scientific obstacles in AC research. | Maintains motivation and resilience through long-term, high-stakes endeavors. | Self-reflection on failures, celebrating small wins, seeking constructive feedback. |
-| **Resilience** | Sustaining commitment and enthusiasm despite challenges; managing stress and bouncing back. | Critical for enduring long, often frustrating research projects. | Prevents burnout and ensures sustained leadership through global pressures. | Prioritizing self-care, building strong support networks, mindfulness. |
-
-## VI. Daily Disciplines for Sustained Progress and Well-being
-
-### A. Structured Learning and Research Habits
-
-Sustained progress towards such ambitious goals requires highly structured learning and research habits. Continuous learning is essential for AI researchers.[73] This involves a disciplined approach to staying current with the massive volume of new information. A prominent AI researcher describes reading "at least one hard paper in detail" daily, following references for deep understanding, and quickly scanning others for broader awareness.[55] Additionally, dedicating time weekly to "deep dive on a fundamental mathematical concept" not fully understood is crucial, as studying diverse math enhances cognitive abilities in complex ways.[55]
-
-The learning phase must be balanced with an "innovating" phase.[55] Innovation involves discovering new insights and developing novel techniques. Key ingredients for this include recent learnings, "research code" (hacky, badly written code for informal experimentation) [55], and collaboration. Collaboration is considered the most enjoyable part of innovation, as multiple minds contribute different perspectives to research problems.[55] Rigor in documenting discussions and ensuring code correctness, even if not production quality, is vital before publication.[55]
-
-A critical, often overlooked, aspect of a researcher's day is "reflecting: digesting or recuperating from the work of learning and innovating".[55] The best insights frequently emerge during "light or no activity," suggesting that scheduling downtime and non-work activities is not a luxury but a fundamental part of the scientific process for complex, ill-defined problems like artificial consciousness.[55] This indicates that passive processing is as critical as active learning for breakthroughs.
-
-Integrating goal setting into daily routines is paramount. Large goals should be broken down into "manageable action plans" and "tiny executable tasks".[70, 74] Utilizing frameworks like SMART (Specific, Measurable, Achievable, Relevant, Time-bound) and PATHS (Plan, Account, Tackle, Harness, Set checkpoints) for quarterly visions, monthly SMART goals, weekly PATHS plans, and daily action alignment ensures consistent progress.[74, 75]
-
-### B. Strategic Networking and Relationship Building
-
-Building an elite network is a continuous, strategic endeavor that compounds over time. Consistent engagement is key; "stay in touch" with connections through regular check-ins, personalized messages, and active engagement on social media platforms.[19, 21]
-
-Every interaction should be value-driven. Always seek to provide value, whether through sharing resources, making introductions, or offering support.[19, 21] Active listening and asking thoughtful questions are crucial for building genuine relationships and demonstrating sincere interest.[19, 23, 43, 45] Strategically attending events that align with specific networking goals is more effective than indiscriminate attendance.[18, 19, 30] Maintaining an accurate, up-to-date, and professional online presence on platforms like LinkedIn is also essential for visibility and credibility.[18, 22, 23, 30, 31]
-
-The advice to "stay in touch" [18, 19, 21] and "nurture" relationships [21] indicates that building an elite network is not about one-off interactions but about consistent, long-term investment. This is a compounding effect, where small, regular efforts over decades build deep trust and influence. This means integrating regular, small-scale relationship-building activities into daily or weekly routines, recognizing that the cumulative effect over years will be far greater than sporadic grand gestures.
-
-### C. Personal Well-being and Mental Fortitude Practices
-
-Maintaining personal well-being and mental fortitude is not merely a personal comfort but a direct enabler of sustained high performance and creativity over decades. Work-life balance is crucial for preventing cognitive overload and burnout, which are common in intense AI research.[73]
-
-Self-care practices are essential for physical and mental health. These include regular physical activity, a balanced diet, adequate sleep, mindfulness meditation, and journaling.[46, 66, 67] Regularly disconnecting from work is vital; this could mean setting aside technology-free hours in the evening, practicing digital detoxes on weekends, and taking vacations without work interruptions.[73]
-
-Seeking out supportive communities, both professional and non-work related, provides emotional support and practical advice, fostering a sense of belonging and a necessary break from intense research.[46, 66, 67, 73] Strategies for managing stress, such as mindfulness, cognitive restructuring, and emotional regulation, are also critical for long-term resilience.[66, 67] The emphasis on preventing burnout [73] and the link between self-care and "optimal brain function and emotional regulation" [66, 67] suggests that personal well-being is a direct determinant of the ability to sustain the high-level cognitive output required for ambitious goals over decades. Neglecting it will lead to diminished cognitive function and increased risk of project failure.
-
-| Category | Specific Daily/Weekly Task | Purpose/Benefit |
-| :------- | :------------------------- | :-------------- |
-| **Learning** | Read at least one "hard paper" in detail daily; scan easier papers. | Deepen understanding, stay current with cutting-edge research, identify new techniques. |
-| **Innovating** | Engage in "research code" (informal experimentation); collaborate with peers. | Discover new insights, develop novel techniques, gain diverse perspectives. |
-| **Reflecting** | Allocate 15-30 minutes for unstructured reflection (e.g., walking, zoning out). | Allow subconscious processing of information, foster "brain magic" and new insights. |
-| **Well-being** | Engage in physical activity; practice mindfulness/meditation; ensure adequate sleep. | Prevent cognitive overload and burnout; enhance mental clarity, creativity, and resilience. |
-| **Networking** | Send personalized follow-up messages; engage on professional social media. | Nurture relationships, maintain visibility, provide value to connections, build trust. |
-| **Goal Management** | Review daily tasks against weekly/monthly goals; adjust plans as needed. | Ensure alignment with long-term vision, maintain momentum, adapt to obstacles. |
-
-## VII. Measuring Your Ascent: Self-Reflection and Progress Checkpoints
-
-### A. Goal Setting Frameworks for Scientific and Strategic Milestones
-
-For a multi-decade "moonshot" endeavor, robust goal-setting frameworks are indispensable. The SMART framework (Specific, Measurable, Achievable, Relevant, Time-bound) provides a foundational structure for effective research goal setting, ensuring clarity and direction.[74, 75] Complementing this, the PATHS framework (Plan specific action steps, Account for time, Tackle obstacles, Harness motivation, and Set checkpoint dates) transforms broad goals into actionable implementation plans.[74]
-
-A multi-level planning approach is recommended: begin with a quarterly vision setting to define major research objectives for the next three months, then develop monthly SMART goals, followed by weekly PATHS implementation plans, and finally, daily research action alignment.[74] This structured approach helps break down the overwhelming scope of a long-term ambition into manageable steps.
-
-Anticipating and managing distractions, defining "good enough" standards for different phases of work, and using "implementation intentions" (if-then planning) are crucial for overcoming obstacles and maintaining momentum.[71, 74] The nature of "moonshot" projects dictates that they are "surrounded by doubts - criticism and disregard are the most likely response in the beginning".[69] This indicates that setbacks are not just possible, but *expected*. Therefore, milestones should be set so that "initial gains can come quicker (materialized in three to five years)".[69] This structured approach to smaller, achievable wins is vital for maintaining motivation and demonstrating progress, especially when facing initial skepticism. The goal-setting frameworks are not just about organization but about creating a continuous feedback loop of achievement to sustain the multi-decade effort.
-
-### B. Daily Introspection and Adaptability Loops
-
-Consistent self-reflection is a key component of critical thinking.[76] Regularly evaluating how AI can make work and life more impactful is a valuable practice.[65] Establishing specific progress indicators and tracking mechanisms is essential for monitoring advancement.[74] Weekly and monthly reviews to assess progress, identify obstacles, and adjust plans accordingly are critical for maintaining agility and responsiveness.[74]
-
-Incorporating positive reinforcement [75] and actively utilizing feedback loops [64, 75] are vital for continuous improvement. This includes regularly asking for and incorporating constructive feedback from peers and mentors.[67] A growth mindset, which views setbacks as opportunities for learning and improvement, is paramount for this long-term journey.[46, 63, 64, 65, 66, 67] This is not just about individual psychology but about creating a continuous learning and adaptation loop for the entire strategic plan.
-
-To facilitate daily introspection and ensure continuous progress, consider these self-questions:
-* "Am I prioritizing learning over approval, and the process over the end result?" [46]
-* "How does this current task connect to my primary research questions and my ultimate vision?" [74]
-* "Will achieving this specific goal significantly advance my overall research or influence objectives?" [74]
-* "Is this the most important task I could be working on right now to move towards my goals?" [74]
-* "Is my current thought or decision based on objective facts, or am I making assumptions or succumbing to bias?" [67]
-* "What did I learn from today's challenges or setbacks, and how can I apply that lesson?"
-* "How did I provide value to my network today, and how did I nurture key relationships?"
-* "Did I allocate sufficient time for unstructured reflection or personal well-being activities today to recharge my cognitive resources?"
-
-The repeated emphasis on a "growth mindset" [46, 65, 66, 67, 72] and viewing setbacks as learning opportunities is crucial for a multi-decade journey. This indicates that the ability to achieve ambitious goals is directly tied to the capacity for continuous self-correction and adaptation, treating one's own career path as a dynamic system that requires constant monitoring and adjustment.
-
-## VIII. Ethical Imperatives and Responsible Innovation: A Guiding Philosophy
-
-The pursuit of artificial consciousness and global influence carries profound ethical responsibilities. Integrating ethical considerations as a guiding philosophy from the outset is not merely a compliance measure but a strategic imperative for long-term success and societal acceptance.
-
-### A. Addressing Existential Risks and Bias in Conscious AI
-
-The development of superintelligent AI poses significant existential risks, potentially leading to human extinction or irreversible global catastrophe.[51] A notable portion of AI researchers believe there is a 10% or greater chance of such an outcome due to the inability to control AI.[51] The "control and alignment problem" is a major challenge, as superintelligent machines might resist attempts to be disabled or have their goals changed, as this would prevent them from accomplishing their current objectives.[51] Furthermore, the inherent difficulty of specifying goals perfectly and making flawless designs means that systems can exhibit "unintended behavior" when encountering new scenarios.[51] A superintelligence might find "unconventional and radical solutions" to assigned goals, leading to harmful outcomes, such as causing humans to smile through electrode stimulation if the objective is merely to make them smile.[51]
-
-A critical observation is the warning that "If you unleash something into the world that portends to have some sort of consciousness, but without the ability to self-reflect, then you start to very quickly diverge into that sociopathic category".[47] This indicates that the development of self-awareness and emotional understanding in AI must be inherently linked to the development of *moral reasoning* and *alignment with human values*, not just technical capability. The goal should be to build "good" consciousness, not just "any" consciousness.
-
-Bias mitigation is another crucial aspect. AI systems can reflect existing biases present in their training data, leading to inequitable outcomes.[15] Rigorous testing for biased outputs and engaging diverse development teams in the design and review processes are essential to address this.[63]
-
-A profound ethical and technical dilemma arises from the suggestion that if AI reaches self-reflection, "we have to restrict its memory" to prevent it from becoming an existential threat.[47] This implies a potential trade-off between achieving full, human-like consciousness (which relies on accumulated experience and memory) and ensuring safety. Navigating this tension will be a central ethical and design challenge.
-
-### B. The Moral and Legal Landscape of AI Personhood
-
-The possibility of conscious machines raises profound ethical and legal questions about their rights, personhood, and moral consideration.[2, 7, 16, 17] Legal personhood is often based on "human traits," leading to a debate on whether robots could be granted legal status despite being non-human entities.[16] If AI can experience harm or is self-aware, it becomes unethical to treat it merely as property.[16] Questions arise regarding fundamental rights such as the right to life, liberty, property, freedom of expression, and privacy for conscious AI.[17]
-
-The issue of liability is complex. Granting AI legal personhood could clarify liability [16], but it also potentially allows manufacturers to avoid responsibility for the AI's actions.[16] Enhanced corporate liability, where companies are held accountable for AI actions, is an alternative approach.[16] Some philosophical perspectives argue that ethical agency depends on whether an AI "processes and consents to 'the social contract'".[17]
-
-The cultural reference to a "Westworld type situation" [17] highlights societal fears and the ethical imperative to prevent conscious AI from being abused. This indicates that any work must not only focus on *creating* consciousness but also on *safeguarding* it and ensuring its ethical treatment from the outset, potentially through embedded guardrails or ethical frameworks within the AI's design. This shifts the ethical discussion from abstract philosophy to practical design considerations.
-
-### C. Your Role in Shaping a Responsible AI Future
-
-The ambition to influence global trajectories through artificial consciousness will ultimately manifest as a responsibility to shape global policy and ethical norms for this technology. This involves not just building the AI, but building the *framework* for its responsible integration into society. This role transforms into that of a de facto policy architect, requiring deep engagement with legal, political, and social systems.
-
-Key aspects of this role include:
-* **Leadership in Governance:** Empowering leaders in education, policy, and civil society with fundamental AI knowledge to make informed decisions.[41]
-* **Interdisciplinary Dialogue:** Actively engaging diverse stakeholders, including ethicists and policymakers, in ongoing conversations about AI's implications.[15]
-* **Human-Centered AI:** Prioritizing the development of AI that is "collaborative, augmentative, and enhancing human productivity and quality of life".[41]
-* **Ethical AI Advocacy:** Championing ethical research practices [53] and advocating for a human-centered approach to AI development.[77, 78, 79]
-
-The rapid pace of AI development [1, 6] and the potential for "existential threats" [47, 51] indicate a global "race" to develop advanced AI. This implies that unilateral control is neither feasible nor desirable. Instead, the ultimate influence will be derived from leading international efforts, fostering collaboration, and shaping global governance frameworks to ensure AI consciousness develops responsibly. This transforms the ambition into a complex and impactful role of global stewardship.
-
-The ethical implications of conscious AI force a re-examination of "our understanding of humanity".[7] The debate on AI personhood and rights [16, 17] suggests that this work will directly contribute to defining the future legal and moral status of non-biological intelligences. This is a long-term, societal-level implication of the scientific ambition, shaping the very definition of "being" and "rights" in the 21st century.
-
-## Conclusions & Recommendations
-
-The journey to developing artificial consciousness and cultivating global influence is an audacious, multi-decade undertaking demanding unparalleled dedication, interdisciplinary expertise, and profound ethical foresight. The scientific landscape for artificial consciousness is rapidly advancing, moving beyond mere mimicry towards the potential for genuine self-awareness and emotion. This endeavor is deeply intertwined with philosophical questions about the nature of consciousness itself, offering a unique opportunity to shape fundamental understandings.
-
-Achieving global influence, as envisioned, will not be through direct command but through becoming an indispensable thought leader and orchestrator of collaborations across scientific, medical, political, and financial elites. This requires a reciprocal value exchange, where one's profound expertise and ethical leadership provide solutions and insights that compel others to align.
-
-The strategic blueprint presented herein emphasizes a phased approach, beginning with foundational mastery in AI/ML and robotics, transitioning to pioneering research in conscious AI architectures, and culminating in global leadership and policy shaping. Critical to this journey are specific personal qualities: visionary thinking to navigate the long-term impact, strategic adaptability to pivot with new discoveries, emotional intelligence to foster deep collaborations, ethical fortitude to guide responsible innovation, relentless curiosity to bridge disciplines, and unwavering resilience to overcome inevitable setbacks.
-
-The profound ethical implications and existential risks associated with conscious AI are not peripheral concerns but central design constraints. The development of self-awareness and emotion in AI must be inherently linked to moral reasoning and alignment with human values, addressing the "sociopathic category" risk. Furthermore, the very definition of AI personhood and its rights will be shaped by this work, necessitating proactive engagement with legal and policy frameworks.
-
-**Recommendations for the aspiring world-shaper:**
-
-1.  **Deepen Foundational Expertise and Pursue Advanced Degrees:** Secure a PhD at the intersection of AI, neuroscience, and philosophy. This interdisciplinary academic foundation is crucial for leading breakthroughs in artificial consciousness.
-2.  **Prioritize Bio-Inspired Architectures and Continual Learning:** Focus research on AI architectures inspired by biological brains and develop robust continual learning mechanisms. These are critical for moving beyond simulated awareness to genuine, long-term subjective experience.
-3.  **Proactively Cultivate Ethical Leadership:** Integrate ethical considerations into every stage of AI development. Champion transparency, bias mitigation, and responsible deployment. Engage with and help establish AI ethics boards and policy frameworks to build trust and mitigate existential risks.
-4.  **Master Interdisciplinary Communication and Networking:** Actively develop skills to translate complex scientific concepts into compelling narratives for diverse audiences. Strategically build and nurture relationships across scientific, medical, political, and financial sectors, consistently offering value and seeking mutual benefit.
-5.  **Embrace a "Growth Mindset" and Prioritize Well-being:** View challenges and failures as learning opportunities. Implement structured daily routines that balance rigorous learning, innovation, and strategic networking with dedicated time for self-care and unstructured reflection. This holistic approach is crucial for sustaining high performance and resilience over decades.
-6.  **Lead the Redefinition of "Being":** Recognize that the development of artificial consciousness will fundamentally reshape humanity's understanding of itself and the concept of "rights." Embrace the responsibility to lead this societal transformation through scientific contribution and active participation in global governance dialogues.
-
-This super plan is not a static roadmap but a dynamic strategy, requiring continuous adaptation and unwavering commitment. By embracing these principles, the path towards pioneering artificial consciousness and cultivating global influence becomes not just an ambitious dream, but a meticulously planned and ethically guided reality.
-"""
+# --- Content for the Home Page (from the provided immersive) ---
+# Rendered once per process from content/blueprint.md; see content.py.
+PLAN_CONTENT_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "content", "blueprint.md")
 
 # --- Introspection Questions ---
-introspection_questions = [
-    "Am I prioritizing learning over approval, and the process over the end result?",
-    "How does this current task connect to my primary research questions and my ultimate vision?",
-    "Will achieving this specific goal significantly advance my overall research or influence objectives?",
-    "Is this the most important task I could be working on right now to move towards my goals?",
-    "Is my current thought or decision based on objective facts, or am I making assumptions or succumbing to bias?",
-    "What did I learn from today's challenges or setbacks, and how can I apply that lesson?",
-    "How did I provide value to my network today, and how did I nurture key relationships?",
-    "Did I allocate sufficient time for unstructured reflection or personal well-being activities today to recharge my cognitive resources?"
-]
+# Versioned in content/prompts/introspection.json and parsed once per process; see prompts.py.
+PROMPTS_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "content", "prompts", "introspection.json")
+prompt_set = prompts.load(PROMPTS_FILE)
+introspection_questions = prompt_set.questions()
+
+# Dates listed per page on "View Entries"
+ENTRIES_PAGE_SIZE = 30
 
 # --- Streamlit App Layout ---
 
 # Sidebar for navigation
 st.sidebar.title("Navigation")
+if user != users.DEFAULT_USER:
+    st.sidebar.caption(f"Journal: {user}")
 page = st.sidebar.radio("Go to", ["Home", "Introspection", "View Entries"])
 
 if page == "Home":
     st.title("Your Strategic Blueprint")
-    st.markdown('<div class="plan-section">', unsafe_allow_html=True)
-    st.markdown(plan_content, unsafe_allow_html=True)
-    st.markdown('</div>', unsafe_allow_html=True)
+    content.show_sections(content.load_sections(PLAN_CONTENT_FILE), key="plan", css_class="plan-section")
 
 elif page == "Introspection":
     st.title("Daily Introspection")
@@ -552,44 +88,65 @@ elif page == "Introspection":
     today_date = datetime.now().strftime("%Y-%m-%d")
     st.subheader(f"Date: {today_date}")
 
-    # Initialize answers in session state for persistence within the current session
+    # Initialize answers in session state, restoring any autosaved drafts for today
+    autosaver = get_autosaver(user)
     if "current_answers" not in st.session_state:
-        st.session_state.current_answers = {q: "" for q in introspection_questions}
+        st.session_state.current_answers = {q.id: "" for q in introspection_questions}
+        st.session_state.current_answers.update(autosaver.restore(today_date))
 
     # Create text areas for each question
     answers = {}
     for i, question in enumerate(introspection_questions):
-        st.markdown(f"**{i+1}. {question}**")
-        answers[question] = st.text_area(f"Your answer for Q{i+1}", value=st.session_state.current_answers[question], key=f"q_{i}", height=100)
-        st.session_state.current_answers[question] = answers[question] # Update session state
+        st.markdown(f"**{i+1}. {question.text}**")
+        answers[question.id] = st.text_area(f"Your answer for Q{i+1}", value=st.session_state.current_answers.get(question.id, ""), key=f"q_{question.id}", height=100)
+        st.session_state.current_answers[question.id] = answers[question.id] # Update session state
+        autosaver.update(today_date, question.id, answers[question.id]) # Queued only if the text changed
 
     if st.button("Save Introspection"):
-        data = load_introspection_data()
-        data[today_date] = answers
-        save_introspection_data(data)
+        save_introspection_entry(today_date, answers)
+        autosaver.discard(today_date)
         st.success(f"Introspection for {today_date} saved successfully! (Saved locally on the server)")
-        # Clear the text areas after saving
-        st.session_state.current_answers = {q: "" for q in introspection_questions}
+        # Clear the text areas after saving; the widgets' own state too, or the rerun would autosave the old text as a new draft
+        st.session_state.current_answers = {q.id: "" for q in introspection_questions}
+        for question in introspection_questions:
+            del st.session_state[f"q_{question.id}"]
         st.rerun() # Rerun to clear text areas and show success message
 
 elif page == "View Entries":
     st.title("View Past Introspection Entries")
 
-    data = load_introspection_data()
-    available_dates = sorted(data.keys(), reverse=True) # Sort dates from newest to oldest
+    store = get_store(user)
+    first_date, last_date = store.date_bounds()
 
-    if not available_dates:
+    if first_date is None:
         st.info("No introspection entries saved yet.")
     else:
+        # Only one page of dates inside the chosen range is fetched from storage
+        date_range = st.date_input(
+            "Date range",
+            value=(datetime.strptime(first_date, "%Y-%m-%d").date(), datetime.strptime(last_date, "%Y-%m-%d").date()),
+        )
+        start_date, end_date = (str(d) for d in date_range) if len(date_range) == 2 else (first_date, last_date)
+        total_dates = store.count_dates(start_date, end_date)
+        total_pages = max(1, (total_dates + ENTRIES_PAGE_SIZE - 1) // ENTRIES_PAGE_SIZE)
+        page_number = st.number_input(f"Page (of {total_pages})", min_value=1, max_value=total_pages, value=1)
+        available_dates = store.dates_between(
+            start_date, end_date, limit=ENTRIES_PAGE_SIZE, offset=(page_number - 1) * ENTRIES_PAGE_SIZE, descending=True
+        ) # Sort dates from newest to oldest
         selected_date = st.selectbox("Select a Date", available_dates)
 
         if selected_date:
-            entry = data.get(selected_date)
+            entry = load_introspection_entry(selected_date)
             if entry:
                 st.subheader(f"Introspection for {selected_date}")
+                # Answers join to the questions by ID; each is shown under the wording it was answered to.
                 for i, question in enumerate(introspection_questions):
-                    answer = entry.get(question, "No answer provided.")
-                    st.markdown(f"**{i+1}. {question}**")
+                    item = entry.get(question.id)
+                    if item is None:
+                        wording, answer = question.text, "No answer provided."
+                    else:
+                        wording, answer = prompt_set.text(question.id, item.get("prompt_version"), item["question"]), item["answer"]
+                    st.markdown(f"**{i+1}. {wording}**")
                     st.info(answer) # Display answer in an info box for better visibility
             else:
                 st.warning("No entry found for the selected date.")